@@ -7,6 +7,8 @@ Persona: Methodical equipment analyst who knows every pole, transformer, and cab
 import logging
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -37,26 +39,30 @@ class AssetInspector:
     async def get_asset_overview(self, region: Optional[str] = None) -> Dict[str, Any]:
         """Get comprehensive asset health overview."""
         
-        assets = self.sf.get_assets(region=region)
+        snapshot = await self.sf.snapshots.get_async("assets", region)
         
-        total = len(assets)
+        total = len(snapshot)
+        health = snapshot.numeric("HEALTH_SCORE", 100)
+        risk = snapshot.numeric("RISK_SCORE")
+        age = snapshot.numeric("ASSET_AGE_YEARS")
+        cost = snapshot.numeric("REPLACEMENT_COST")
         
         # Health distribution
-        critical = len([a for a in assets if (a.get("HEALTH_SCORE") or 100) < 40])
-        poor = len([a for a in assets if 40 <= (a.get("HEALTH_SCORE") or 100) < 60])
-        fair = len([a for a in assets if 60 <= (a.get("HEALTH_SCORE") or 100) < 80])
-        good = len([a for a in assets if (a.get("HEALTH_SCORE") or 100) >= 80])
+        health_band = np.digitize(health, [40, 60, 80])
+        critical, poor, fair, good = (int(n) for n in np.bincount(health_band, minlength=4))
+        critical_value = float(cost[health_band == 0].sum())
         
         # Risk distribution
-        high_risk = len([a for a in assets if (a.get("RISK_SCORE") or 0) > 70])
+        high_risk_mask = risk > 70
+        high_risk = int(np.count_nonzero(high_risk_mask))
         
         # Age analysis
-        avg_age = sum(a.get("ASSET_AGE_YEARS", 0) or 0 for a in assets) / total if total > 0 else 0
-        old_assets = len([a for a in assets if (a.get("ASSET_AGE_YEARS") or 0) > 30])
+        avg_age = float(age.mean()) if total > 0 else 0
+        old_assets = int(np.count_nonzero(age > 30))
         
         # Replacement value
-        total_value = sum(a.get("REPLACEMENT_COST", 0) or 0 for a in assets)
-        at_risk_value = sum(a.get("REPLACEMENT_COST", 0) or 0 for a in assets if (a.get("RISK_SCORE") or 0) > 70)
+        total_value = float(cost.sum())
+        at_risk_value = float(cost[high_risk_mask].sum())
         
         scope_title = f"Region: {region}" if region else "All Regions"
         
@@ -70,7 +76,7 @@ class AssetInspector:
 ### Health Distribution
 | Condition | Count | % | Value at Risk |
 |-----------|-------|---|---------------|
-| 🔴 Critical (<40) | {critical} | {critical/total*100:.1f}% | ${sum(a.get('REPLACEMENT_COST', 0) or 0 for a in assets if (a.get('HEALTH_SCORE') or 100) < 40)/1e6:.1f}M |
+| 🔴 Critical (<40) | {critical} | {critical/total*100:.1f}% | ${critical_value/1e6:.1f}M |
 | 🟠 Poor (40-60) | {poor} | {poor/total*100:.1f}% | - |
 | 🟡 Fair (60-80) | {fair} | {fair/total*100:.1f}% | - |
 | 🟢 Good (80+) | {good} | {good/total*100:.1f}% | - |
@@ -86,17 +92,12 @@ class AssetInspector:
 """
         
         # Group by asset type
-        by_type = {}
-        for a in assets:
-            atype = a.get("ASSET_TYPE", "UNKNOWN")
-            if atype not in by_type:
-                by_type[atype] = []
-            by_type[atype].append(a)
-        
-        for atype, type_assets in sorted(by_type.items(), key=lambda x: len(x[1]), reverse=True):
-            avg_health = sum(a.get("HEALTH_SCORE", 0) or 0 for a in type_assets) / len(type_assets)
-            avg_type_age = sum(a.get("ASSET_AGE_YEARS", 0) or 0 for a in type_assets) / len(type_assets)
-            narrative += f"| {atype} | {len(type_assets)} | {avg_health:.1f} | {avg_type_age:.1f} |\n"
+        types, type_codes, type_counts = snapshot.group_by("ASSET_TYPE", missing="UNKNOWN")
+        avg_health = snapshot.group_mean(type_codes, type_counts, snapshot.numeric("HEALTH_SCORE"))
+        avg_type_age = snapshot.group_mean(type_codes, type_counts, age)
+        
+        for i in np.argsort(-type_counts, kind="stable"):
+            narrative += f"| {types[i]} | {type_counts[i]} | {avg_health[i]:.1f} | {avg_type_age[i]:.1f} |\n"
         
         narrative += f"\n> _{self.PERSONA['catchphrase']}_"
         
@@ -108,7 +109,7 @@ class AssetInspector:
                 "high_risk_count": high_risk,
                 "avg_age": avg_age,
                 "total_value": total_value,
-                "assets": assets[:100]
+                "assets": snapshot.rows[:100]
             },
             "sources": ["ATOMIC.ASSET", "ML.ASSET_HEALTH_PREDICTION"]
         }
@@ -116,18 +117,16 @@ class AssetInspector:
     async def get_replacement_priorities(self) -> Dict[str, Any]:
         """Get prioritized list of assets needing replacement."""
         
-        assets = self.sf.get_assets()
+        snapshot = await self.sf.snapshots.get_async("assets")
+        risk = snapshot.numeric("RISK_SCORE")
         
         # Filter to high-risk, poor health assets
-        replacement_candidates = [
-            a for a in assets 
-            if (a.get("HEALTH_SCORE") or 100) < 50 or (a.get("RISK_SCORE") or 0) > 75
-        ]
+        candidates = (snapshot.numeric("HEALTH_SCORE", 100) < 50) | (risk > 75)
         
         # Sort by risk score descending
-        replacement_candidates.sort(key=lambda x: x.get("RISK_SCORE", 0) or 0, reverse=True)
+        replacement_candidates = snapshot.take(snapshot.top(candidates, risk))
         
-        total_cost = sum(a.get("REPLACEMENT_COST", 0) or 0 for a in replacement_candidates)
+        total_cost = float(snapshot.numeric("REPLACEMENT_COST")[candidates].sum())
         
         narrative = f"""## {self.PERSONA['emoji']} Asset Replacement Priorities
 
@@ -163,7 +162,7 @@ Prioritize assets with:
     async def get_asset_detail(self, asset_id: str) -> Dict[str, Any]:
         """Get detailed information for a specific asset."""
         
-        asset = self.sf.get_asset_detail(asset_id)
+        asset = await self.sf.run_async(self.sf.get_asset_detail, asset_id)
         
         if not asset:
             return {
@@ -173,8 +172,8 @@ Prioritize assets with:
             }
         
         # Get related data
-        work_orders = self.sf.get_work_orders_for_asset(asset_id)
-        risk_assessment = self.sf.get_risk_assessment_for_asset(asset_id)
+        work_orders = await self.sf.run_async(self.sf.get_work_orders_for_asset, asset_id)
+        risk_assessment = await self.sf.run_async(self.sf.get_risk_assessment_for_asset, asset_id)
         
         health = asset.get("HEALTH_SCORE", 0) or 0
         health_status = "🔴 Critical" if health < 40 else "🟠 Poor" if health < 60 else "🟡 Fair" if health < 80 else "🟢 Good"
@@ -226,22 +225,20 @@ Prioritize assets with:
     async def get_inspection_schedule(self) -> Dict[str, Any]:
         """Get upcoming inspection schedule."""
         
-        assets = self.sf.get_assets()
+        snapshot = await self.sf.snapshots.get_async("assets")
         
         # Filter to assets with upcoming inspections
         from datetime import date, timedelta
         today = date.today()
         next_30_days = today + timedelta(days=30)
         
-        upcoming = [
-            a for a in assets 
-            if a.get("NEXT_INSPECTION_DUE") and a.get("NEXT_INSPECTION_DUE") <= next_30_days.isoformat()
-        ]
+        upcoming = snapshot.take(snapshot.where(
+            "NEXT_INSPECTION_DUE", lambda due: due and due <= next_30_days.isoformat()
+        ))
         
-        overdue = [
-            a for a in assets
-            if a.get("NEXT_INSPECTION_DUE") and a.get("NEXT_INSPECTION_DUE") < today.isoformat()
-        ]
+        overdue = snapshot.take(snapshot.where(
+            "NEXT_INSPECTION_DUE", lambda due: due and due < today.isoformat()
+        ))
         
         narrative = f"""## {self.PERSONA['emoji']} Inspection Schedule
 
@@ -54,10 +54,10 @@ class WaterTreeingDetective:
         """
         
         # Get cable failure predictions with Water Treeing indicators
-        cables = self.sf.get_water_treeing_candidates()
+        cables = await self.sf.run_async(self.sf.get_water_treeing_candidates)
         
         # Get AMI readings with rain correlation
-        ami_anomalies = self.sf.get_rain_correlated_dips()
+        ami_anomalies = await self.sf.run_async(self.sf.get_rain_correlated_dips)
         
         # Calculate impact
         affected_cables = len([c for c in cables if c.get("RAIN_CORRELATION_SCORE", 0) > 0.5])
@@ -147,8 +147,8 @@ This pattern indicates **Water Treeing** - moisture-induced insulation degradati
     async def analyze_cable_health(self) -> Dict[str, Any]:
         """Get detailed cable health analysis with Water Treeing focus."""
         
-        cables = self.sf.get_underground_cables()
-        predictions = self.sf.get_cable_predictions()
+        cables = await self.sf.run_async(self.sf.get_underground_cables)
+        predictions = await self.sf.run_async(self.sf.get_cable_predictions)
         
         total = len(cables)
         xlpe = len([c for c in cables if c.get("MATERIAL") == "XLPE"])
@@ -222,7 +222,7 @@ Traditional inspections cannot see Water Treeing. We detect it by:
     async def get_ami_correlation_analysis(self) -> Dict[str, Any]:
         """Analyze AMI readings for rain-voltage correlation patterns."""
         
-        ami_data = self.sf.get_ami_readings()
+        ami_data = await self.sf.run_async(self.sf.get_ami_readings)
         
         # Calculate statistics
         total_readings = len(ami_data)
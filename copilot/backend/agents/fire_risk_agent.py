@@ -4,10 +4,13 @@ VIGIL Risk Planning - Fire Risk Analyst Agent
 Persona: Urgent voice of wildfire prevention. Speaks with authority about fire districts.
 """
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 from datetime import date
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,17 +57,26 @@ class FireRiskAnalyst:
         """Get comprehensive fire risk overview."""
         
         fire_season = self._get_fire_season_countdown()
-        assets = self.sf.get_assets()
-        encroachments = self.sf.get_vegetation_encroachments()
+        assets, encroachments = await asyncio.gather(
+            self.sf.snapshots.get_async("assets"),
+            self.sf.snapshots.get_async("vegetation")
+        )
         
         # Fire district breakdown
-        tier_3_assets = [a for a in assets if a.get("FIRE_THREAT_DISTRICT") == "TIER_3"]
-        tier_2_assets = [a for a in assets if a.get("FIRE_THREAT_DISTRICT") == "TIER_2"]
-        tier_1_assets = [a for a in assets if a.get("FIRE_THREAT_DISTRICT") == "TIER_1"]
+        tier_3 = assets.isin("FIRE_THREAT_DISTRICT", "TIER_3")
+        tier_2 = assets.isin("FIRE_THREAT_DISTRICT", "TIER_2")
+        tier_1_count = int(np.count_nonzero(assets.isin("FIRE_THREAT_DISTRICT", "TIER_1")))
+        tier_3_count = int(np.count_nonzero(tier_3))
+        tier_2_count = int(np.count_nonzero(tier_2))
         
         # High risk items in Tier 3
-        tier_3_high_risk = [a for a in tier_3_assets if (a.get("RISK_SCORE") or 0) > 70]
-        tier_3_non_compliant = [e for e in encroachments if e.get("FIRE_THREAT_DISTRICT") == "TIER_3" and e.get("COMPLIANCE_STATUS") in ("NON_COMPLIANT", "CRITICAL")]
+        risk = assets.numeric("RISK_SCORE")
+        tier_3_high_risk = tier_3 & (risk > 70)
+        tier_3_high_risk_count = int(np.count_nonzero(tier_3_high_risk))
+        veg_tier_3 = encroachments.isin("FIRE_THREAT_DISTRICT", "TIER_3")
+        tier_3_non_compliant = int(np.count_nonzero(
+            veg_tier_3 & encroachments.isin("COMPLIANCE_STATUS", "NON_COMPLIANT", "CRITICAL")
+        ))
         
         # Urgency indicator
         urgency_emoji = "🔴" if fire_season["days_remaining"] < 30 else "🟠" if fire_season["days_remaining"] < 60 else "🟡"
@@ -78,16 +90,16 @@ class FireRiskAnalyst:
 ### Fire Threat District Summary
 | District | Assets | High Risk | Non-Compliant Veg |
 |----------|--------|-----------|-------------------|
-| 🔴 Tier 3 (Extreme) | {len(tier_3_assets)} | {len(tier_3_high_risk)} | {len(tier_3_non_compliant)} |
-| 🟠 Tier 2 (Elevated) | {len(tier_2_assets)} | {len([a for a in tier_2_assets if (a.get('RISK_SCORE') or 0) > 70])} | - |
-| 🟡 Tier 1 (Moderate) | {len(tier_1_assets)} | - | - |
-| ⚪ Non-HFTD | {len(assets) - len(tier_3_assets) - len(tier_2_assets) - len(tier_1_assets)} | - | - |
+| 🔴 Tier 3 (Extreme) | {tier_3_count} | {tier_3_high_risk_count} | {tier_3_non_compliant} |
+| 🟠 Tier 2 (Elevated) | {tier_2_count} | {int(np.count_nonzero(tier_2 & (risk > 70)))} | - |
+| 🟡 Tier 1 (Moderate) | {tier_1_count} | - | - |
+| ⚪ Non-HFTD | {len(assets) - tier_3_count - tier_2_count - tier_1_count} | - | - |
 
 ### Tier 3 Immediate Action Required
 """
         
         # List critical Tier 3 issues
-        critical_items = sorted(tier_3_high_risk, key=lambda x: x.get("RISK_SCORE", 0), reverse=True)[:10]
+        critical_items = assets.take(assets.top(tier_3_high_risk, risk, limit=10))
         if critical_items:
             for item in critical_items:
                 narrative += f"- **{item.get('ASSET_ID')}** ({item.get('ASSET_TYPE')}): Risk {item.get('RISK_SCORE', 0):.0f}, Health {item.get('HEALTH_SCORE', 0):.0f}\n"
@@ -95,8 +107,8 @@ class FireRiskAnalyst:
             narrative += "_No critical Tier 3 items requiring immediate action._\n"
         
         # Readiness score
-        compliant_tier_3 = len([e for e in encroachments if e.get("FIRE_THREAT_DISTRICT") == "TIER_3" and e.get("COMPLIANCE_STATUS") == "COMPLIANT"])
-        total_tier_3_veg = len([e for e in encroachments if e.get("FIRE_THREAT_DISTRICT") == "TIER_3"])
+        compliant_tier_3 = int(np.count_nonzero(veg_tier_3 & encroachments.isin("COMPLIANCE_STATUS", "COMPLIANT")))
+        total_tier_3_veg = int(np.count_nonzero(veg_tier_3))
         readiness_score = (compliant_tier_3 / total_tier_3_veg * 100) if total_tier_3_veg > 0 else 100
         
         narrative += f"""
@@ -104,7 +116,7 @@ class FireRiskAnalyst:
 | Metric | Value | Target |
 |--------|-------|--------|
 | Tier 3 Vegetation Compliance | {readiness_score:.1f}% | 100% |
-| Tier 3 High-Risk Assets Mitigated | {len(tier_3_assets) - len(tier_3_high_risk)}/{len(tier_3_assets)} | 100% |
+| Tier 3 High-Risk Assets Mitigated | {tier_3_count - tier_3_high_risk_count}/{tier_3_count} | 100% |
 | Days Remaining | {fire_season['days_remaining']} | - |
 
 > _{self.PERSONA['catchphrase']}_
@@ -114,9 +126,9 @@ class FireRiskAnalyst:
             "narrative": narrative,
             "data": {
                 "fire_season": fire_season,
-                "tier_3_count": len(tier_3_assets),
-                "tier_3_high_risk": len(tier_3_high_risk),
-                "tier_3_non_compliant": len(tier_3_non_compliant),
+                "tier_3_count": tier_3_count,
+                "tier_3_high_risk": tier_3_high_risk_count,
+                "tier_3_non_compliant": tier_3_non_compliant,
                 "readiness_score": readiness_score,
                 "critical_assets": critical_items
             },
@@ -126,7 +138,7 @@ class FireRiskAnalyst:
     async def get_ignition_risk_analysis(self) -> Dict[str, Any]:
         """Get ML-based ignition risk predictions."""
         
-        predictions = self.sf.get_ignition_predictions()
+        predictions = await self.sf.run_async(self.sf.get_ignition_predictions)
         
         # Group by risk tier
         critical = [p for p in predictions if p.get("RISK_TIER") == "CRITICAL"]
@@ -174,7 +186,7 @@ Model: XGBoost Classifier (F1: 0.87)
     async def get_psps_circuits(self) -> Dict[str, Any]:
         """Get circuits likely to require PSPS (Public Safety Power Shutoff)."""
         
-        circuits = self.sf.get_circuits()
+        circuits = await self.sf.run_async(self.sf.get_circuits)
         
         # Filter to high-risk circuits in fire districts
         psps_candidates = [
@@ -212,7 +224,7 @@ Model: XGBoost Classifier (F1: 0.87)
     async def get_weather_risk(self) -> Dict[str, Any]:
         """Get current weather risk conditions."""
         
-        forecasts = self.sf.get_weather_forecasts()
+        forecasts = await self.sf.run_async(self.sf.get_weather_forecasts)
         
         red_flag = [f for f in forecasts if f.get("RED_FLAG_WARNING")]
         high_wind = [f for f in forecasts if (f.get("WIND_SPEED_MPH") or 0) > 25]
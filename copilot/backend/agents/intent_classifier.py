@@ -0,0 +1,130 @@
+"""
+VIGIL Risk Planning - Intent Classifier
+
+Scores a chat message against every intent in one pass:
+
+- all keyword patterns are compiled into a single alternation regex, one
+  named group per keyword, factored by first letter ("f(?:ire\\s*season|
+  ire\\s*risk|...)|w(?:ildfire|ater\\s*tree|...)") so the regex engine tries
+  only the handful of keywords sharing the current character instead of
+  every keyword at every position
+- "a ... b" keywords are written as a(?=.*b) so they consume only their
+  first word and never hide keywords that follow
+- each keyword carries a weight: specific terms (GO95, PSPS, water tree)
+  count more than generic ones (priority, condition, schedule)
+- an intent's score is the sum of its distinct matched keyword weights;
+  intents are ranked by score, ties broken by routing priority
+- confidence is the top intent's share of the total score
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_INTENT = "data_query"
+
+# (intent, [(pattern, weight), ...]) in routing priority order.
+# Patterns start with a lowercase literal (optionally preceded by \b) and
+# must not contain capturing groups.
+INTENT_KEYWORDS: List[Tuple[str, List[Tuple[str, float]]]] = [
+    # Hidden Discovery / Water Treeing
+    ("hidden_discovery", [
+        (r"hidden", 2.0), (r"discovery", 2.0), (r"water\s*tree", 3.0), (r"underground\s*cable", 3.0),
+        (r"rain(?=.*voltage)", 3.0), (r"voltage(?=.*rain)", 3.0), (r"ami(?=.*correlat)", 3.0),
+        (r"moisture(?=.*degrad)", 3.0), (r"xlpe(?=.*fail)", 3.0), (r"cable(?=.*fail)", 3.0)
+    ]),
+    # Fire Risk
+    ("fire_risk", [
+        (r"fire\s*season", 3.0), (r"fire\s*risk", 3.0), (r"ignition", 3.0), (r"tier\s*3", 2.0), (r"hftd", 2.0),
+        (r"fire\s*district", 2.0), (r"wildfire", 3.0), (r"psps", 3.0), (r"red\s*flag", 3.0)
+    ]),
+    # Vegetation
+    ("vegetation", [
+        (r"vegetation", 3.0), (r"clearance", 2.0), (r"encroach", 3.0), (r"trim", 2.0), (r"go\s*95", 3.0),
+        (r"\btrees?\b", 2.0), (r"eucalyptus", 2.0), (r"species", 2.0), (r"growth\s*rate", 2.0)
+    ]),
+    # Asset Health
+    ("asset_health", [
+        (r"asset\s*health", 3.0), (r"\bpoles?\b", 2.0), (r"transformer", 2.0), (r"conductor", 2.0),
+        (r"equipment", 1.0), (r"condition", 1.0), (r"replace", 2.0), (r"inspection", 2.0), (r"\bage\b", 1.0)
+    ]),
+    # Work Orders
+    ("work_order", [
+        (r"work\s*orders?", 3.0), (r"priority", 1.0), (r"backlog", 2.0), (r"schedule", 1.0), (r"crew", 2.0),
+        (r"issue(?=.*order)", 2.0), (r"create(?=.*order)", 2.0)
+    ]),
+    # Compliance
+    ("compliance", [
+        (r"compliance", 2.0), (r"violation", 2.0), (r"cpuc", 3.0), (r"regulat", 2.0), (r"standard", 1.0)
+    ]),
+]
+
+
+class IntentMatch(NamedTuple):
+    """Classifier output for one message."""
+    intent: str
+    confidence: float
+    ranked: List[Tuple[str, float]]
+    keywords: Dict[str, List[str]]
+
+    def intents(self, min_share: float = 0.0) -> List[str]:
+        """Matched intents scoring at least min_share of the top score, best first."""
+        if not self.ranked:
+            return []
+        floor = self.ranked[0][1] * min_share
+        return [intent for intent, score in self.ranked if score >= floor]
+
+
+class IntentClassifier:
+    """Weighted keyword classifier backed by one compiled regex."""
+
+    def __init__(
+        self,
+        intents: Sequence[Tuple[str, Sequence[Tuple[str, float]]]] = INTENT_KEYWORDS,
+        default: str = DEFAULT_INTENT
+    ):
+        self.default = default
+        self._priority: Dict[str, int] = {}
+        self._keywords: Dict[str, Tuple[str, str, float]] = {}
+        branches: Dict[str, List[str]] = {}
+        for priority, (intent, keywords) in enumerate(intents):
+            self._priority[intent] = priority
+            for pattern, weight in keywords:
+                name = f"k{len(self._keywords)}"
+                self._keywords[name] = (intent, pattern, weight)
+                first, rest = pattern[0], pattern[1:]
+                if pattern.startswith(r"\b"):
+                    # Word start, checked once the first letter is consumed
+                    first, rest = pattern[2], r"(?<![a-z0-9_].)" + pattern[3:]
+                if not first.isalnum():
+                    raise ValueError(f"Keyword pattern must start with a literal: {pattern!r}")
+                branches.setdefault(first, []).append(f"(?P<{name}>{rest})")
+        self._regex = re.compile("|".join(
+            f"{first}(?:{'|'.join(alternatives)})" for first, alternatives in branches.items()
+        ))
+
+    def classify(self, message: str) -> IntentMatch:
+        hits = {match.lastgroup for match in self._regex.finditer(message.lower())}
+        if not hits:
+            return IntentMatch(self.default, 0.0, [], {})
+
+        scores: Dict[str, float] = {}
+        keywords: Dict[str, List[str]] = {}
+        for name in hits:
+            intent, pattern, weight = self._keywords[name]
+            scores[intent] = scores.get(intent, 0.0) + weight
+            keywords.setdefault(intent, []).append(pattern)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._priority[item[0]]))
+        confidence = round(ranked[0][1] / sum(scores.values()), 3)
+        return IntentMatch(ranked[0][0], confidence, ranked, keywords)
+
+
+_classifier: Optional[IntentClassifier] = None
+
+
+def get_intent_classifier() -> IntentClassifier:
+    """Get or create the intent classifier singleton"""
+    global _classifier
+    if _classifier is None:
+        _classifier = IntentClassifier()
+    return _classifier
@@ -6,20 +6,40 @@ The Orchestrator classifies user intent and routes to specialized agents:
 - Asset Inspector: Asset health, condition assessment, replacement planning
 - Fire Risk Analyst: Ignition risk, fire season readiness, Tier 3 monitoring
 - Water Treeing Detective: Hidden Discovery - underground cable failure detection
+
+Compound questions that match several intents ("fire risk and vegetation
+backlog in NorCal") fan out to every matching agent concurrently, each under
+its own time budget, and the answers are merged into one response.
 """
 
-import re
+import asyncio
+import os
+import time
+import uuid
 import logging
-from typing import Any, Dict, List, Optional
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from datetime import datetime, date
 
 from .vegetation_agent import VegetationGuardian
 from .asset_agent import AssetInspector
 from .fire_risk_agent import FireRiskAnalyst
 from .discovery_agent import WaterTreeingDetective
+from .session_store import SessionStore, has_state, new_context
+from .intent_classifier import get_intent_classifier
 
 logger = logging.getLogger(__name__)
 
+AGENT_FANOUT_ENABLED = os.getenv("AGENT_FANOUT_ENABLED", "true").lower() == "true"
+AGENT_FANOUT_TIMEOUT = float(os.getenv("AGENT_FANOUT_TIMEOUT", "8"))
+AGENT_FANOUT_MAX_AGENTS = int(os.getenv("AGENT_FANOUT_MAX_AGENTS", "4"))
+# Secondary intents must score at least this share of the top intent to join
+AGENT_FANOUT_MIN_SHARE = float(os.getenv("AGENT_FANOUT_MIN_SHARE", "0.5"))
+
+# Conversation state for the request being processed. asyncio tasks copy it,
+# so fan-out handlers see their own request's session.
+_active_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("vigil_conversation_context", default=None)
+
 
 class AgentOrchestrator:
     """
@@ -29,7 +49,7 @@ class AgentOrchestrator:
     1. Classify user intent from message
     2. Route to appropriate agent(s)
     3. Aggregate responses with sources
-    4. Maintain conversation context
+    4. Maintain conversation context (per conversation id, see SessionStore)
     """
     
     # Agent personas for different interaction styles
@@ -69,17 +89,32 @@ class AgentOrchestrator:
         self.fire_risk_agent = FireRiskAnalyst(snowflake_service)
         self.discovery_agent = WaterTreeingDetective(snowflake_service)
         
-        # Conversation context
-        self.context = {
-            "current_asset": None,
-            "current_region": None,
-            "last_intent": None,
-            "last_results": None,
-            "persona": "safety_guardian"
+        # Conversation context, one per conversation id
+        self.sessions = SessionStore()
+        
+        self.classifier = get_intent_classifier()
+        self._handlers: Dict[str, Callable[[str], Awaitable[Dict[str, Any]]]] = {
+            "hidden_discovery": self._handle_hidden_discovery,
+            "water_treeing": self._handle_water_treeing,
+            "vegetation": self._handle_vegetation,
+            "fire_risk": self._handle_fire_risk,
+            "asset_health": self._handle_asset_health,
+            "work_order": self._handle_work_order,
+            "compliance": self._handle_compliance,
         }
         
         logger.info("VIGIL AgentOrchestrator initialized with 4 specialized agents")
     
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Conversation state of the request being processed."""
+        context = _active_context.get()
+        if context is None:
+            # Called outside process_message: use a throwaway context
+            context = new_context()
+            _active_context.set(context)
+        return context
+    
     def set_persona(self, persona_id: str):
         """Set the agent persona for responses."""
         if persona_id in self.PERSONAS:
@@ -118,9 +153,38 @@ class AgentOrchestrator:
         persona: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         asset_id: Optional[str] = None,
-        region: Optional[str] = None
+        region: Optional[str] = None,
+        conversation_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Process a user message and return appropriate response.
+        
+        State (persona, current asset/region) is kept per conversation_id. A
+        request without one runs on a throwaway context and gets a new id in
+        the result; that context is stored under the id only if the turn set
+        state for a follow-up to use.
+        """
+        session = self.sessions.get(conversation_id) if conversation_id else new_context()
+        token = _active_context.set(session)
+        try:
+            result = await self._process_message(message, persona, context, asset_id, region)
+        finally:
+            _active_context.reset(token)
+        if not conversation_id:
+            conversation_id = uuid.uuid4().hex
+            if has_state(session):
+                self.sessions.put(conversation_id, session)
+        result["conversation_id"] = conversation_id
+        return result
+    
+    async def _process_message(
+        self,
+        message: str,
+        persona: Optional[str],
+        context: Optional[Dict[str, Any]],
+        asset_id: Optional[str],
+        region: Optional[str]
     ) -> Dict[str, Any]:
-        """Process a user message and return appropriate response."""
         # Update persona
         if persona:
             self.set_persona(persona)
@@ -139,38 +203,39 @@ class AgentOrchestrator:
             self.context["current_region"] = region
         
         # Classify intent
-        intent = self._classify_intent(message)
+        match = self.classifier.classify(message)
+        intents = match.intents(AGENT_FANOUT_MIN_SHARE)
+        intent = match.intent
         self.context["last_intent"] = intent
         
-        logger.info(f"Classified intent: {intent}")
+        logger.info(f"Classified intent: {intent} (confidence {match.confidence}, ranked: {match.ranked})")
         
         # Add fire season context to all responses
         fire_season = self._get_fire_season_countdown()
         
         try:
-            # Route to appropriate handler
-            if intent == "hidden_discovery":
-                result = await self._handle_hidden_discovery(message)
-            elif intent == "water_treeing":
-                result = await self._handle_water_treeing(message)
-            elif intent == "vegetation":
-                result = await self._handle_vegetation(message)
-            elif intent == "fire_risk":
-                result = await self._handle_fire_risk(message)
-            elif intent == "asset_health":
-                result = await self._handle_asset_health(message)
-            elif intent == "work_order":
-                result = await self._handle_work_order(message)
-            elif intent == "compliance":
-                result = await self._handle_compliance(message)
+            if AGENT_FANOUT_ENABLED:
+                intents = self._distinct_targets(message, intents)
+            if AGENT_FANOUT_ENABLED and len(intents) > 1:
+                # Compound question: ask every matching agent at once
+                result = await self._fan_out(message, intents[:AGENT_FANOUT_MAX_AGENTS])
+            elif intent in self._handlers:
+                # Route to appropriate handler
+                result = await self._handlers[intent](message)
             else:
                 # Default to Cortex Analyst for data queries
                 result = await self._handle_cortex_analyst(message)
             
             # Add fire season context
             result["fire_season"] = fire_season
+            result["intent_confidence"] = match.confidence
             
-            self.context["last_results"] = result
+            # Keep a summary only; full payloads would pin memory per session
+            self.context["last_results"] = {
+                "intent": result.get("intent"),
+                "agent": result.get("agent"),
+                "sources": result.get("sources", [])
+            }
             return result
             
         except Exception as e:
@@ -186,66 +251,78 @@ class AgentOrchestrator:
                 "fire_season": fire_season
             }
     
-    def _classify_intent(self, message: str) -> str:
-        """Classify user intent to route to appropriate agent."""
-        message_lower = message.lower()
-        
-        # Hidden Discovery / Water Treeing (highest priority)
-        water_treeing_keywords = [
-            r"hidden", r"discovery", r"water\s*tree", r"underground\s*cable",
-            r"rain.*voltage", r"voltage.*rain", r"ami.*correlat", r"moisture.*degrad",
-            r"xlpe.*fail", r"cable.*fail"
-        ]
-        for pattern in water_treeing_keywords:
-            if re.search(pattern, message_lower):
-                return "hidden_discovery"
-        
-        # Fire Risk
-        fire_keywords = [
-            r"fire\s*season", r"fire\s*risk", r"ignition", r"tier\s*3", r"hftd",
-            r"fire\s*district", r"wildfire", r"psps", r"red\s*flag"
-        ]
-        for pattern in fire_keywords:
-            if re.search(pattern, message_lower):
-                return "fire_risk"
-        
-        # Vegetation
-        veg_keywords = [
-            r"vegetation", r"clearance", r"encroach", r"trim", r"go95", r"go\s*95",
-            r"tree", r"eucalyptus", r"species", r"growth\s*rate"
-        ]
-        for pattern in veg_keywords:
-            if re.search(pattern, message_lower):
-                return "vegetation"
-        
-        # Asset Health
-        asset_keywords = [
-            r"asset\s*health", r"pole", r"transformer", r"conductor", r"equipment",
-            r"condition", r"replace", r"inspection", r"age"
-        ]
-        for pattern in asset_keywords:
-            if re.search(pattern, message_lower):
-                return "asset_health"
-        
-        # Work Orders
-        work_keywords = [
-            r"work\s*order", r"priority", r"backlog", r"schedule", r"crew",
-            r"issue.*order", r"create.*order"
-        ]
-        for pattern in work_keywords:
-            if re.search(pattern, message_lower):
-                return "work_order"
+    # =========================================================================
+    # Multi-Agent Fan-Out
+    # =========================================================================
+    
+    def _target_intent(self, intent: str, message: str) -> str:
+        """The intent whose agent call actually answers `intent` for this message."""
+        if intent == "vegetation" and ("compliance" in message.lower() or "go95" in message.lower()):
+            # _handle_vegetation answers these with the compliance summary
+            return "compliance"
+        return intent
+    
+    def _distinct_targets(self, message: str, intents: List[str]) -> List[str]:
+        """Collapse intents that resolve to the same agent call, keeping rank order."""
+        targets: List[str] = []
+        for intent in intents:
+            target = self._target_intent(intent, message)
+            if target not in targets:
+                targets.append(target)
+        return targets
+    
+    async def _run_agent_with_budget(self, intent: str, message: str) -> Dict[str, Any]:
+        """Run one intent handler under the fan-out time budget; never raises."""
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(self._handlers[intent](message), timeout=AGENT_FANOUT_TIMEOUT)
+            status, error = "ok", None
+        except asyncio.TimeoutError:
+            result, status, error = None, "timeout", f"no answer within {AGENT_FANOUT_TIMEOUT:g}s"
+        except Exception as e:
+            result, status, error = None, "error", str(e)
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+        if status != "ok":
+            logger.warning(f"Fan-out agent {intent} {status}: {error}")
+        return {"intent": intent, "status": status, "error": error, "elapsed_ms": elapsed_ms, "result": result}
+    
+    async def _fan_out(self, message: str, intents: List[str]) -> Dict[str, Any]:
+        """Run the handlers for several intents concurrently and merge their answers."""
+        runs = await asyncio.gather(*(self._run_agent_with_budget(intent, message) for intent in intents))
+        answered = [run for run in runs if run["status"] == "ok"]
+        if not answered:
+            raise RuntimeError("; ".join(f"{run['intent']}: {run['error']}" for run in runs))
         
-        # Compliance
-        compliance_keywords = [
-            r"compliance", r"violation", r"cpuc", r"regulat", r"standard"
-        ]
-        for pattern in compliance_keywords:
-            if re.search(pattern, message_lower):
-                return "compliance"
+        sections, sources, agents, data = [], [], [], {}
+        for run in answered:
+            result = run["result"]
+            agent = result.get("agent", run["intent"])
+            sections.append(f"### {agent}\n\n{result['narrative']}")
+            data[run["intent"]] = result.get("data", {})
+            for source in result.get("sources", []):
+                if source not in sources:
+                    sources.append(source)
+            if agent not in agents:
+                agents.append(agent)
+        for run in runs:
+            if run["status"] != "ok":
+                sections.append(f"_{run['intent'].replace('_', ' ').title()} analysis unavailable ({run['error']})._")
         
-        # Default to data query
-        return "data_query"
+        persona = self.PERSONAS.get(self.context.get("persona", "safety_guardian"))
+        return {
+            "narrative": "\n\n---\n\n".join(sections),
+            "agent": " + ".join(agents),
+            "persona": persona,
+            "sources": sources,
+            "data": data,
+            "intent": "multi_agent",
+            "intents": intents,
+            "agents": [
+                {key: run[key] for key in ("intent", "status", "error", "elapsed_ms")}
+                for run in runs
+            ],
+            "visualization": answered[0]["result"].get("visualization")
+        }
     
     # =========================================================================
     # Intent Handlers
@@ -372,7 +449,7 @@ class AgentOrchestrator:
         
         # Try direct SQL with pattern matching first
         try:
-            result = self.sf.direct_sql_query(message)
+            result = await self.sf.run_async(self.sf.direct_sql_query, message)
             
             if result.get("results") and len(result["results"]) > 0:
                 return self._format_query_response(
@@ -386,7 +463,7 @@ class AgentOrchestrator:
         
         # Try Cortex Analyst LLM
         try:
-            result = self.sf.cortex_analyst(message)
+            result = await self.sf.run_async(self.sf.cortex_analyst, message)
             
             if result.get("data") and len(result["data"]) > 0:
                 return self._format_query_response(
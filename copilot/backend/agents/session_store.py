@@ -0,0 +1,120 @@
+"""
+VIGIL Risk Planning - Conversation Session Store
+
+Per-conversation orchestrator state (current asset/region, persona, last
+intent) keyed by conversation id, so concurrent users no longer share one
+mutable context dict.
+
+Requests without an id run on a throwaway context; it is kept (under a newly
+issued id) only when the turn set state worth carrying over, so one-shot
+questions never fill the store.
+
+Memory is bounded two ways: sessions idle for longer than SESSION_TTL
+seconds expire, and at most SESSION_MAX_ENTRIES sessions are kept, evicting
+the least recently used.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+SESSION_TTL = float(os.getenv("SESSION_TTL", "3600"))
+SESSION_MAX_ENTRIES = int(os.getenv("SESSION_MAX_ENTRIES", "1000"))
+
+
+def new_context() -> Dict[str, Any]:
+    """Fresh conversation state."""
+    return {
+        "current_asset": None,
+        "current_region": None,
+        "last_intent": None,
+        "last_results": None,
+        "persona": "safety_guardian"
+    }
+
+
+def has_state(context: Dict[str, Any]) -> bool:
+    """True when a context carries state a follow-up turn would use."""
+    initial = new_context()
+    return any(context.get(key) != initial[key] for key in ("current_asset", "current_region", "persona"))
+
+
+class SessionStore:
+    """LRU + TTL map of conversation id -> context dict."""
+
+    def __init__(self, max_entries: int = SESSION_MAX_ENTRIES, ttl: float = SESSION_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+
+        self._created = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def get(self, conversation_id: Optional[str]) -> Dict[str, Any]:
+        """Context for a conversation, created on first use (ephemeral if id is None)."""
+        if not conversation_id:
+            return new_context()
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            context = self._sessions.get(conversation_id)
+            if context is None:
+                context = new_context()
+                self._insert(conversation_id, context, now)
+            else:
+                self._sessions.move_to_end(conversation_id)
+                self._touched[conversation_id] = now
+            return context
+
+    def put(self, conversation_id: str, context: Dict[str, Any]):
+        """Keep a context (e.g. a throwaway one that turned out stateful) under an id."""
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            self._sessions.pop(conversation_id, None)
+            self._insert(conversation_id, context, now)
+
+    def _insert(self, conversation_id: str, context: Dict[str, Any], now: float):
+        self._sessions[conversation_id] = context
+        self._touched[conversation_id] = now
+        self._created += 1
+        while len(self._sessions) > self.max_entries:
+            evicted, _ = self._sessions.popitem(last=False)
+            self._touched.pop(evicted, None)
+            self._evicted += 1
+
+    def drop(self, conversation_id: str) -> bool:
+        """Forget a conversation."""
+        with self._lock:
+            self._touched.pop(conversation_id, None)
+            return self._sessions.pop(conversation_id, None) is not None
+
+    def _expire(self, now: float):
+        # Sessions are ordered by last access, so expired ones are at the front
+        while self._sessions:
+            oldest = next(iter(self._sessions))
+            if now - self._touched[oldest] < self.ttl:
+                break
+            del self._sessions[oldest]
+            del self._touched[oldest]
+            self._expired += 1
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire(time.monotonic())
+            return {
+                "active": len(self._sessions),
+                "max_entries": self.max_entries,
+                "ttl_s": self.ttl,
+                "created": self._created,
+                "expired": self._expired,
+                "evicted": self._evicted,
+            }
@@ -9,6 +9,8 @@ import logging
 from typing import Any, Dict, List, Optional
 from datetime import datetime, date
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,16 +42,19 @@ class VegetationGuardian:
         """Get comprehensive vegetation management overview."""
         
         # Get vegetation data
-        encroachments = self.sf.get_vegetation_encroachments(region=region)
+        encroachments = await self.sf.snapshots.get_async("vegetation", region)
         
         # Calculate statistics
         total = len(encroachments)
-        non_compliant = len([e for e in encroachments if e.get("COMPLIANCE_STATUS") in ("NON_COMPLIANT", "CRITICAL")])
-        critical = len([e for e in encroachments if e.get("COMPLIANCE_STATUS") == "CRITICAL"])
-        at_risk = len([e for e in encroachments if e.get("COMPLIANCE_STATUS") == "AT_RISK"])
+        non_compliant_mask = encroachments.isin("COMPLIANCE_STATUS", "NON_COMPLIANT", "CRITICAL")
+        critical_mask = encroachments.isin("COMPLIANCE_STATUS", "CRITICAL")
+        non_compliant = int(np.count_nonzero(non_compliant_mask))
+        critical = int(np.count_nonzero(critical_mask))
+        at_risk = int(np.count_nonzero(encroachments.isin("COMPLIANCE_STATUS", "AT_RISK")))
         
         # Fire district breakdown
-        tier_3_count = len([e for e in encroachments if e.get("FIRE_THREAT_DISTRICT") == "TIER_3"])
+        tier_3_mask = encroachments.isin("FIRE_THREAT_DISTRICT", "TIER_3")
+        tier_3_count = int(np.count_nonzero(tier_3_mask))
         
         # Days to fire season
         today = date.today()
@@ -74,13 +79,13 @@ class VegetationGuardian:
 
 ### Fire Threat District Analysis
 - **Tier 3 (Extreme)**: {tier_3_count} encroachments requiring priority attention
-- Non-compliant in Tier 3: {len([e for e in encroachments if e.get('FIRE_THREAT_DISTRICT') == 'TIER_3' and e.get('COMPLIANCE_STATUS') in ('NON_COMPLIANT', 'CRITICAL')])}
+- Non-compliant in Tier 3: {int(np.count_nonzero(tier_3_mask & non_compliant_mask))}
 
 > _{self.PERSONA['catchphrase']}_
 """
         
         # Add top priority items
-        critical_items = [e for e in encroachments if e.get("COMPLIANCE_STATUS") == "CRITICAL"][:5]
+        critical_items = encroachments.take(np.flatnonzero(critical_mask)[:5])
         if critical_items:
             narrative += "\n### ⚠️ Immediate Action Required\n"
             for item in critical_items:
@@ -94,7 +99,7 @@ class VegetationGuardian:
                 "critical": critical,
                 "tier_3_count": tier_3_count,
                 "days_to_fire_season": days_to_fire_season,
-                "encroachments": encroachments[:50]
+                "encroachments": encroachments.rows[:50]
             },
             "sources": ["ATOMIC.VEGETATION_ENCROACHMENT", "ATOMIC.ASSET"]
         }
@@ -102,7 +107,7 @@ class VegetationGuardian:
     async def get_compliance_summary(self) -> Dict[str, Any]:
         """Get GO95 compliance summary by region."""
         
-        compliance_data = self.sf.get_compliance_by_region()
+        compliance_data = await self.sf.run_async(self.sf.get_compliance_by_region)
         
         narrative = f"""## {self.PERSONA['emoji']} CPUC GO95 Compliance Summary
 
@@ -153,7 +158,7 @@ class VegetationGuardian:
     async def get_trim_priorities(self) -> Dict[str, Any]:
         """Get prioritized list of vegetation trim work."""
         
-        priorities = self.sf.get_trim_priorities()
+        priorities = await self.sf.run_async(self.sf.get_trim_priorities)
         
         # Calculate estimated costs
         total_cost = sum(p.get("ESTIMATED_TRIM_COST", 0) or 0 for p in priorities)
@@ -192,7 +197,7 @@ class VegetationGuardian:
     async def get_work_order_backlog(self) -> Dict[str, Any]:
         """Get work order backlog summary."""
         
-        work_orders = self.sf.get_work_orders(status="OPEN")
+        work_orders = await self.sf.run_async(self.sf.get_work_orders, status="OPEN")
         
         # Group by priority
         by_priority = {}
@@ -253,8 +258,8 @@ class VegetationGuardian:
             }
         
         # Get asset and encroachment details
-        asset = self.sf.get_asset_detail(asset_id)
-        encroachment = self.sf.get_encroachment_for_asset(asset_id)
+        asset = await self.sf.run_async(self.sf.get_asset_detail, asset_id)
+        encroachment = await self.sf.run_async(self.sf.get_encroachment_for_asset, asset_id)
         
         if not asset:
             return {
@@ -5,15 +5,16 @@ Vegetation & Infrastructure Grid Intelligence Layer
 A risk-based planning platform for utility wildfire mitigation.
 """
 
+import asyncio
 import os
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi import FastAPI, HTTPException, Path, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
 import json
@@ -24,14 +25,26 @@ import os
 
 # Support both SPCS deployment and local development imports
 try:
-    from backend.services.snowflake_service_spcs import get_snowflake_service, SnowflakeServiceSPCS
+    from backend.services.snowflake_service_spcs import (
+        get_snowflake_service, SnowflakeServiceSPCS, MAP_CLUSTER_MAX_ZOOM, MAP_POINT_LIMIT
+    )
     from backend.services.cortex_agent_client import get_cortex_agent_client, CortexAgentClient
+    from backend.services.pagination import InvalidCursorError
+    from backend.services.vector_tiles import get_tile_service, VectorTileService
+    from backend.services.semantic_cache import get_semantic_cache
+    from backend.api.responses import BulkJSONResponse, dumps_bulk
     from backend.agents.orchestrator import get_orchestrator, AgentOrchestrator
 except ImportError:
     # Local development - add parent to path
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from services.snowflake_service_spcs import get_snowflake_service, SnowflakeServiceSPCS
+    from services.snowflake_service_spcs import (
+        get_snowflake_service, SnowflakeServiceSPCS, MAP_CLUSTER_MAX_ZOOM, MAP_POINT_LIMIT
+    )
     from services.cortex_agent_client import get_cortex_agent_client, CortexAgentClient
+    from services.pagination import InvalidCursorError
+    from services.vector_tiles import get_tile_service, VectorTileService
+    from services.semantic_cache import get_semantic_cache
+    from api.responses import BulkJSONResponse, dumps_bulk
     from agents.orchestrator import get_orchestrator, AgentOrchestrator
 
 # Configure logging
@@ -45,12 +58,13 @@ logger = logging.getLogger(__name__)
 snowflake_service: Optional[SnowflakeServiceSPCS] = None
 cortex_client: Optional[CortexAgentClient] = None
 orchestrator: Optional[AgentOrchestrator] = None
+tile_service: Optional[VectorTileService] = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler for startup/shutdown."""
-    global snowflake_service, cortex_client, orchestrator
+    global snowflake_service, cortex_client, orchestrator, tile_service
     
     logger.info("🔥 VIGIL Risk Planning API starting up...")
     
@@ -58,7 +72,9 @@ async def lifespan(app: FastAPI):
     try:
         snowflake_service = get_snowflake_service()
         cortex_client = get_cortex_agent_client()
+        await cortex_client.start()
         orchestrator = get_orchestrator(snowflake_service)
+        tile_service = get_tile_service(snowflake_service)
         
         # Log fire season status
         fire_status = snowflake_service.get_fire_season_countdown()
@@ -73,6 +89,10 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("🔥 VIGIL Risk Planning API shutting down...")
+    if cortex_client:
+        await cortex_client.aclose()
+    if snowflake_service:
+        snowflake_service.close()
 
 
 # Create FastAPI app
@@ -120,6 +140,7 @@ class ChatMessage(BaseModel):
     message: str = Field(..., description="User's message to the copilot")
     persona: Optional[str] = Field(None, description="Desired agent persona")
     context: Optional[Dict[str, Any]] = Field(None, description="Additional context")
+    conversation_id: Optional[str] = Field(None, description="Conversation to continue (new one if omitted)")
 
 
 class ChatResponse(BaseModel):
@@ -129,6 +150,7 @@ class ChatResponse(BaseModel):
     persona: Dict[str, Any]
     data: Optional[Dict[str, Any]] = None
     sources: Optional[List[str]] = None
+    conversation_id: Optional[str] = None
     fire_season: Dict[str, Any]
     timestamp: str
 
@@ -177,10 +199,44 @@ async def health_check():
             "cortex": cortex_client is not None,
             "orchestrator": orchestrator is not None
         },
+        "connection_pool": snowflake_service.pool_stats() if snowflake_service else {},
+        "cortex_http": cortex_client.http_stats() if cortex_client else {},
+        "sessions": orchestrator.sessions.stats() if orchestrator else {},
         "timestamp": datetime.now().isoformat()
     }
 
 
+@app.get("/cache/stats", tags=["Health"])
+async def get_cache_stats():
+    """Query result cache hit/miss counters."""
+    return snowflake_service.cache.stats()
+
+
+@app.get("/cache/semantic", tags=["Health"])
+async def get_semantic_cache_stats():
+    """Copilot semantic response cache counters."""
+    return get_semantic_cache().stats()
+
+
+@app.get("/cache/sql-plans", tags=["Health"])
+async def get_sql_plan_cache_stats():
+    """Generated-SQL plan cache counters, including LLM calls avoided."""
+    return snowflake_service.sql_plans.stats()
+
+
+@app.get("/cache/snapshots", tags=["Health"])
+async def get_snapshot_stats():
+    """Agent data snapshots (rows, age) and load/hit counters."""
+    return snowflake_service.snapshots.stats()
+
+
+@app.post("/cache/invalidate", tags=["Health"])
+async def invalidate_cache(tables: Optional[List[str]] = Query(None)):
+    """Drop cached query results for the given tables (all tables if omitted)."""
+    removed = snowflake_service.invalidate_cache(tables)
+    return {"removed": removed, "stats": snowflake_service.cache.stats()}
+
+
 @app.get("/fire-season", tags=["Risk"])
 async def get_fire_season():
     """Get current fire season status and countdown."""
@@ -206,7 +262,8 @@ async def chat(request: ChatMessage):
         response = await orchestrator.process_message(
             message=request.message,
             persona=request.persona,
-            context=request.context
+            context=request.context,
+            conversation_id=request.conversation_id
         )
         
         return ChatResponse(
@@ -215,6 +272,7 @@ async def chat(request: ChatMessage):
             persona=response["persona"],
             data=response.get("data"),
             sources=response.get("sources"),
+            conversation_id=response.get("conversation_id"),
             fire_season=snowflake_service.get_fire_season_countdown(),
             timestamp=datetime.now().isoformat()
         )
@@ -238,8 +296,14 @@ async def chat_stream(request: ChatMessage):
     - chart: Vega-Lite chart specifications
     - complete: Final response with metadata
     - error: Error information
+    
+    complete and error events carry conversation_id for the client to send
+    back on its next turn. Only the orchestrator fallback keeps conversation
+    state and issues new ids; the Cortex Agent path holds none, so there it
+    is just an echo of the request's id (None on a first turn).
     """
     async def event_generator():
+        conversation_id = request.conversation_id
         try:
             fire_status = snowflake_service.get_fire_season_countdown()
             yield {
@@ -250,8 +314,12 @@ async def chat_stream(request: ChatMessage):
             try:
                 messages = [{"role": "user", "content": request.message}]
                 accumulated_text = ""
+                timing = None
+                cached = False
                 
-                async for event in cortex_client.run_agent_stream(messages):
+                async for event in cortex_client.run_agent_stream(
+                    messages, data_version=snowflake_service.cache.data_version
+                ):
                     event_type = event.get("type", "")
                     
                     if event_type == "text":
@@ -303,6 +371,8 @@ async def chat_stream(request: ChatMessage):
                         }
                     
                     elif event_type == "done":
+                        timing = event.get("timing")
+                        cached = event.get("cached", False)
                         break
                 
                 yield {
@@ -311,6 +381,9 @@ async def chat_stream(request: ChatMessage):
                         "agent": "VIGIL Agent",
                         "persona": {"name": "Safety Guardian", "emoji": "🛡️"},
                         "narrative": accumulated_text,
+                        "timing": timing,
+                        "cached": cached,
+                        "conversation_id": conversation_id,
                         "done": True
                     })
                 }
@@ -321,8 +394,10 @@ async def chat_stream(request: ChatMessage):
                 response = await orchestrator.process_message(
                     message=request.message,
                     persona=request.persona,
-                    context=request.context
+                    context=request.context,
+                    conversation_id=request.conversation_id
                 )
+                conversation_id = response.get("conversation_id")
                 
                 narrative = response["narrative"]
                 chunk_size = 100
@@ -340,6 +415,7 @@ async def chat_stream(request: ChatMessage):
                         "persona": response.get("persona", {}),
                         "data": response.get("data"),
                         "sources": response.get("sources"),
+                        "conversation_id": conversation_id,
                         "done": True
                     })
                 }
@@ -348,7 +424,7 @@ async def chat_stream(request: ChatMessage):
             logger.error(f"Stream error: {e}")
             yield {
                 "event": "error",
-                "data": json.dumps({"error": str(e)})
+                "data": json.dumps({"error": str(e), "conversation_id": conversation_id})
             }
     
     return EventSourceResponse(event_generator())
@@ -362,62 +438,199 @@ async def chat_stream(request: ChatMessage):
 async def get_dashboard_metrics():
     """Get all metrics for the main dashboard."""
     try:
-        return snowflake_service.get_dashboard_metrics()
+        return await snowflake_service.get_dashboard_metrics_async()
     except Exception as e:
         logger.error(f"Dashboard metrics error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/dashboard/map", tags=["Dashboard"])
-async def get_map_data():
-    """Get asset locations with risk data for 3D map visualization."""
+def _map_features(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """GeoJSON point features for the asset map layer."""
+    return [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [row["LONGITUDE"], row["LATITUDE"]]
+            },
+            "properties": {
+                "asset_id": row["ASSET_ID"],
+                "asset_type": row["ASSET_TYPE"],
+                "condition_score": row["CONDITION_SCORE"],
+                "risk_score": row["COMPOSITE_RISK_SCORE"],
+                "risk_tier": row["RISK_TIER"],
+                "fire_district": row["FIRE_THREAT_DISTRICT"],
+                "region": row["REGION"]
+            }
+        }
+        for row in data
+    ]
+
+
+def _map_cluster_features(cells: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """GeoJSON features for aggregated grid cells, placed at each cell's asset centroid."""
+    return [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": [cell["LONGITUDE"], cell["LATITUDE"]]
+            },
+            "properties": {
+                "cluster": True,
+                "cell_id": f"{int(cell['CELL_X'])}:{int(cell['CELL_Y'])}",
+                "point_count": cell["ASSET_COUNT"],
+                "condition_score": cell["AVG_CONDITION_SCORE"],
+                "risk_score": cell["AVG_RISK_SCORE"],
+                "max_risk_score": cell["MAX_RISK_SCORE"],
+                "critical_count": cell["CRITICAL_COUNT"],
+                "high_count": cell["HIGH_COUNT"]
+            }
+        }
+        for cell in cells
+    ]
+
+
+def _parse_bbox(bbox: Optional[str]) -> Optional[Tuple[float, float, float, float]]:
+    """Parse a min_lon,min_lat,max_lon,max_lat viewport string."""
+    if not bbox:
+        return None
     try:
-        data = snowflake_service.get_map_data()
-        return {
+        values = tuple(float(v) for v in bbox.split(","))
+    except ValueError:
+        values = ()
+    if len(values) != 4 or values[0] > values[2] or values[1] > values[3]:
+        raise HTTPException(status_code=400, detail="bbox must be min_lon,min_lat,max_lon,max_lat")
+    return values
+
+
+@app.get("/dashboard/map", tags=["Dashboard"], response_class=BulkJSONResponse)
+async def get_map_data(
+    bbox: Optional[str] = Query(None, description="Viewport as min_lon,min_lat,max_lon,max_lat"),
+    zoom: Optional[int] = Query(None, ge=0, le=22, description="Map zoom; lower zooms return aggregated grid cells")
+):
+    """
+    Get asset locations with risk data for 3D map visualization.
+    
+    Below zoom MAP_CLUSTER_MAX_ZOOM assets are aggregated server-side into
+    grid cells; at higher zoom (or without zoom) individual assets inside
+    the bbox are returned, capped at MAP_POINT_LIMIT.
+    """
+    viewport = _parse_bbox(bbox)
+    try:
+        if zoom is not None and zoom < MAP_CLUSTER_MAX_ZOOM:
+            cells = await snowflake_service.run_async(snowflake_service.get_map_clusters, zoom, bbox=viewport)
+            features = _map_cluster_features(cells)
+            mode, truncated = "clusters", False
+        else:
+            data = await snowflake_service.run_async(
+                snowflake_service.get_map_data, bbox=viewport, limit=MAP_POINT_LIMIT + 1)
+            truncated = len(data) > MAP_POINT_LIMIT
+            features = _map_features(data[:MAP_POINT_LIMIT])
+            mode = "points"
+        
+        return BulkJSONResponse({
             "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [row["LONGITUDE"], row["LATITUDE"]]
-                    },
-                    "properties": {
-                        "asset_id": row["ASSET_ID"],
-                        "asset_type": row["ASSET_TYPE"],
-                        "condition_score": row["CONDITION_SCORE"],
-                        "risk_score": row["COMPOSITE_RISK_SCORE"],
-                        "risk_tier": row["RISK_TIER"],
-                        "fire_district": row["FIRE_THREAT_DISTRICT"],
-                        "region": row["REGION"]
-                    }
-                }
-                for row in data
-            ],
+            "features": features,
+            "mode": mode,
+            "zoom": zoom,
+            "bbox": list(viewport) if viewport else None,
+            "truncated": truncated,
             "fire_season": snowflake_service.get_fire_season_countdown()
-        }
+        })
     except Exception as e:
         logger.error(f"Map data error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/tiles/stats", tags=["Dashboard"])
+async def get_tile_stats():
+    """Vector tile index and cache counters."""
+    return tile_service.stats()
+
+
+@app.get("/tiles/{z}/{x}/{y}.mvt", tags=["Dashboard"])
+async def get_vector_tile(
+    z: int = Path(..., ge=0, le=22),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0)
+):
+    """
+    Mapbox Vector Tile of assets (layer "assets") with risk_tier, risk_score,
+    condition_score, asset_type, fire_district and region attributes.
+    """
+    if x >= 1 << z or y >= 1 << z:
+        raise HTTPException(status_code=400, detail=f"Tile {z}/{x}/{y} is outside the tile grid")
+    try:
+        tile = await snowflake_service.run_async(tile_service.get_tile, z, x, y)
+        return Response(
+            content=tile,
+            media_type="application/vnd.mapbox-vector-tile",
+            headers={"Cache-Control": "public, max-age=300"}
+        )
+    except Exception as e:
+        logger.error(f"Vector tile error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# ===================
+# List Helpers
+# ===================
+
+# List endpoints return their legacy capped result unless `limit` or `cursor`
+# is given, in which case they switch to keyset pagination. Summaries come from
+# aggregate queries over the whole filtered listing, never from the page.
+# format=ndjson is the export path: without `limit` it deliberately streams
+# every matching row (from `cursor` onward, if given) with constant memory,
+# since rows are fetched in batches and written as they arrive. Such exports
+# run on their own connection, outside the pool that serves other requests.
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+LIST_FORMAT_PATTERN = "^(json|ndjson)$"
+
+
+def _ndjson_response(rows: Iterator[Dict[str, Any]]) -> StreamingResponse:
+    """Stream rows as newline-delimited JSON while the cursor is still fetching."""
+    def lines():
+        for row in rows:
+            yield dumps_bulk(row) + b"\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # ===================
 # Asset Endpoints
 # ===================
 
-@app.get("/assets", tags=["Assets"])
+@app.get("/assets", tags=["Assets"], response_class=BulkJSONResponse)
 async def get_assets(
     region: Optional[str] = Query(None, description="Filter by region"),
-    asset_type: Optional[str] = Query(None, description="Filter by asset type")
+    asset_type: Optional[str] = Query(None, description="Filter by asset type"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    format: str = Query("json", pattern=LIST_FORMAT_PATTERN, description="json, or ndjson to stream rows (unbounded export unless limit is set)")
 ):
     """Get assets with optional filtering."""
     try:
-        items = snowflake_service.get_assets(region=region, asset_type=asset_type)
-        return {
+        if format == "ndjson":
+            return _ndjson_response(snowflake_service.iter_assets(
+                region=region, asset_type=asset_type, limit=limit, cursor=cursor))
+        
+        next_cursor = None
+        if limit or cursor:
+            page = await snowflake_service.run_async(
+                snowflake_service.get_assets_page, region=region, asset_type=asset_type,
+                limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor)
+            items, next_cursor = page["items"], page["next_cursor"]
+        else:
+            items = await snowflake_service.run_async(snowflake_service.get_assets, region=region, asset_type=asset_type)
+        return BulkJSONResponse({
             "items": items,
             "total": len(items),
+            "next_cursor": next_cursor,
             "fire_season": snowflake_service.get_fire_season_countdown()
-        }
+        })
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -427,7 +640,7 @@ async def get_asset_summary():
     """Get asset summary by region and type."""
     try:
         return {
-            "summary": snowflake_service.get_asset_summary(),
+            "summary": await snowflake_service.run_async(snowflake_service.get_asset_summary),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -439,7 +652,7 @@ async def get_replacement_priorities(limit: int = Query(50, le=200)):
     """Get assets prioritized for replacement."""
     try:
         return {
-            "priorities": snowflake_service.get_replacement_priorities(limit=limit),
+            "priorities": await snowflake_service.run_async(snowflake_service.get_replacement_priorities, limit=limit),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -450,25 +663,44 @@ async def get_replacement_priorities(limit: int = Query(50, le=200)):
 # Vegetation Endpoints
 # ===================
 
-@app.get("/vegetation", tags=["Vegetation"])
-async def get_vegetation(region: Optional[str] = Query(None)):
+@app.get("/vegetation", tags=["Vegetation"], response_class=BulkJSONResponse)
+async def get_vegetation(
+    region: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    format: str = Query("json", pattern=LIST_FORMAT_PATTERN, description="json, or ndjson to stream rows (unbounded export unless limit is set)")
+):
     """Get vegetation encroachment data."""
     try:
-        items = snowflake_service.get_vegetation_encroachments(region=region)
-        compliance = snowflake_service.get_compliance_summary()
+        if format == "ndjson":
+            return _ndjson_response(snowflake_service.iter_vegetation_encroachments(
+                region=region, limit=limit, cursor=cursor))
+        
+        next_cursor = None
+        if limit or cursor:
+            page = await snowflake_service.run_async(
+                snowflake_service.get_vegetation_page, region=region,
+                limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor)
+            items, next_cursor = page["items"], page["next_cursor"]
+        else:
+            items = await snowflake_service.run_async(snowflake_service.get_vegetation_encroachments, region=region)
+        totals = await snowflake_service.run_async(snowflake_service.get_vegetation_totals, region=region)
         total_summary = {
-            "total_encroachments": len(items),
-            "critical": sum(1 for i in items if i.get("TRIM_PRIORITY") == "CRITICAL"),
-            "high_priority": sum(1 for i in items if i.get("TRIM_PRIORITY") == "HIGH"),
-            "out_of_compliance": sum(1 for i in items if i.get("TRIM_PRIORITY") in ["CRITICAL", "HIGH"]),
-            "total_trim_cost": sum(i.get("ESTIMATED_TRIM_COST", 0) or 0 for i in items),
-            "avg_clearance_ft": sum(i.get("CURRENT_CLEARANCE_FT", 0) or 0 for i in items) / max(len(items), 1)
+            "total_encroachments": totals.get("TOTAL_ENCROACHMENTS") or 0,
+            "critical": totals.get("CRITICAL") or 0,
+            "high_priority": totals.get("HIGH_PRIORITY") or 0,
+            "out_of_compliance": totals.get("OUT_OF_COMPLIANCE") or 0,
+            "total_trim_cost": totals.get("TOTAL_TRIM_COST") or 0,
+            "avg_clearance_ft": totals.get("AVG_CLEARANCE_FT") or 0
         }
-        return {
+        return BulkJSONResponse({
             "summary": total_summary,
             "items": items,
+            "next_cursor": next_cursor,
             "fire_season": snowflake_service.get_fire_season_countdown()
-        }
+        })
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -478,7 +710,7 @@ async def get_compliance_summary():
     """Get GO95 compliance summary by region and fire district."""
     try:
         return {
-            "compliance": snowflake_service.get_compliance_summary(),
+            "compliance": await snowflake_service.run_async(snowflake_service.get_compliance_summary),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -490,7 +722,7 @@ async def get_trim_priorities(limit: int = Query(50, le=200)):
     """Get vegetation trim priorities."""
     try:
         return {
-            "priorities": snowflake_service.get_trim_priorities(limit=limit),
+            "priorities": await snowflake_service.run_async(snowflake_service.get_trim_priorities, limit=limit),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -513,14 +745,34 @@ async def get_clearance_requirement(
 # Risk Endpoints
 # ===================
 
-@app.get("/risk", tags=["Risk"])
-async def get_risk_assessments(region: Optional[str] = Query(None)):
+@app.get("/risk", tags=["Risk"], response_class=BulkJSONResponse)
+async def get_risk_assessments(
+    region: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    format: str = Query("json", pattern=LIST_FORMAT_PATTERN, description="json, or ndjson to stream rows (unbounded export unless limit is set)")
+):
     """Get risk assessment data."""
     try:
-        return {
-            "assessments": snowflake_service.get_risk_assessments(region=region),
+        if format == "ndjson":
+            return _ndjson_response(snowflake_service.iter_risk_assessments(
+                region=region, limit=limit, cursor=cursor))
+        
+        if limit or cursor:
+            page = await snowflake_service.run_async(
+                snowflake_service.get_risk_assessments_page, region=region,
+                limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor)
+            return BulkJSONResponse({
+                "assessments": page["items"],
+                "next_cursor": page["next_cursor"],
+                "fire_season": snowflake_service.get_fire_season_countdown()
+            })
+        return BulkJSONResponse({
+            "assessments": await snowflake_service.run_async(snowflake_service.get_risk_assessments, region=region),
             "fire_season": snowflake_service.get_fire_season_countdown()
-        }
+        })
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -530,7 +782,7 @@ async def get_risk_summary():
     """Get risk summary by region and tier."""
     try:
         return {
-            "summary": snowflake_service.get_risk_summary(),
+            "summary": await snowflake_service.run_async(snowflake_service.get_risk_summary),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -542,7 +794,7 @@ async def get_psps_candidates():
     """Get circuits that are PSPS (Public Safety Power Shutoff) candidates."""
     try:
         return {
-            "candidates": snowflake_service.get_psps_candidates(),
+            "candidates": await snowflake_service.run_async(snowflake_service.get_psps_candidates),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -553,31 +805,56 @@ async def get_psps_candidates():
 # Work Order Endpoints
 # ===================
 
-@app.get("/work-orders", tags=["Work Orders"])
-async def get_work_orders(status: Optional[str] = Query(None)):
+@app.get("/work-orders", tags=["Work Orders"], response_class=BulkJSONResponse)
+async def get_work_orders(
+    status: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size (enables cursor pagination)"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    format: str = Query("json", pattern=LIST_FORMAT_PATTERN, description="json, or ndjson to stream rows (unbounded export unless limit is set)")
+):
     """Get work orders with optional status filter."""
     try:
-        items = snowflake_service.get_work_orders(status=status)
+        if format == "ndjson":
+            return _ndjson_response(snowflake_service.iter_work_orders(
+                status=status, limit=limit, cursor=cursor))
+        
+        next_cursor = None
+        if limit or cursor:
+            page = await snowflake_service.run_async(
+                snowflake_service.get_work_orders_page, status=status,
+                limit=limit or DEFAULT_PAGE_SIZE, cursor=cursor)
+            items, next_cursor = page["items"], page["next_cursor"]
+        else:
+            items = await snowflake_service.run_async(snowflake_service.get_work_orders, status=status)
+        totals = await snowflake_service.run_async(snowflake_service.get_work_order_totals, status=status)
         summary = {
-            "total": len(items),
-            "open": sum(1 for i in items if i.get("STATUS") == "OPEN"),
-            "in_progress": sum(1 for i in items if i.get("STATUS") == "IN_PROGRESS"),
-            "completed": sum(1 for i in items if i.get("STATUS") == "COMPLETED"),
-            "overdue": sum(1 for i in items if i.get("STATUS") == "OVERDUE")
+            "total": totals.get("TOTAL") or 0,
+            "open": totals.get("OPEN") or 0,
+            "in_progress": totals.get("IN_PROGRESS") or 0,
+            "completed": totals.get("COMPLETED") or 0,
+            "overdue": totals.get("OVERDUE") or 0
         }
-        return {
+        return BulkJSONResponse({
             "summary": summary,
             "items": items,
+            "next_cursor": next_cursor,
             "fire_season": snowflake_service.get_fire_season_countdown()
-        }
+        })
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/workorders", tags=["Work Orders"])
-async def get_workorders_alias(status: Optional[str] = Query(None)):
+@app.get("/workorders", tags=["Work Orders"], response_class=BulkJSONResponse)
+async def get_workorders_alias(
+    status: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None),
+    format: str = Query("json", pattern=LIST_FORMAT_PATTERN)
+):
     """Alias for /work-orders endpoint."""
-    return await get_work_orders(status)
+    return await get_work_orders(status, limit=limit, cursor=cursor, format=format)
 
 
 @app.get("/work-orders/backlog", tags=["Work Orders"])
@@ -585,7 +862,7 @@ async def get_work_order_backlog():
     """Get work order backlog summary."""
     try:
         return {
-            "backlog": snowflake_service.get_work_order_backlog(),
+            "backlog": await snowflake_service.run_async(snowflake_service.get_work_order_backlog),
             "fire_season": snowflake_service.get_fire_season_countdown()
         }
     except Exception as e:
@@ -600,7 +877,7 @@ async def create_work_order(request: WorkOrderRequest):
     This is the "Issue Work Order" functionality that creates actual records.
     """
     try:
-        work_order_id = snowflake_service.create_work_order({
+        work_order_id = await snowflake_service.run_async(snowflake_service.create_work_order, {
             "asset_id": request.asset_id,
             "work_order_type": request.work_order_type,
             "priority": request.priority,
@@ -634,8 +911,8 @@ async def get_water_treeing_candidates():
     """
     try:
         return {
-            "candidates": snowflake_service.get_water_treeing_candidates(),
-            "ami_anomalies": snowflake_service.get_rain_correlated_dips()[:100],
+            "candidates": await snowflake_service.run_async(snowflake_service.get_water_treeing_candidates),
+            "ami_anomalies": (await snowflake_service.run_async(snowflake_service.get_rain_correlated_dips))[:100],
             "fire_season": snowflake_service.get_fire_season_countdown(),
             "discovery_info": {
                 "name": "Water Treeing Detection",
@@ -656,7 +933,7 @@ async def get_water_treeing_candidates():
 async def get_ami_correlation():
     """Get AMI readings analysis for rain-voltage correlation patterns."""
     try:
-        ami_data = snowflake_service.get_ami_readings()
+        ami_data = await snowflake_service.run_async(snowflake_service.get_ami_readings)
         
         # Calculate correlation statistics by asset
         by_asset = {}
@@ -705,7 +982,7 @@ async def get_ami_correlation():
 async def get_asset_health_predictions(limit: int = Query(100, le=500)):
     """Get ML-predicted asset health scores and degradation trends."""
     try:
-        results = snowflake_service.execute_query(f"""
+        results = await snowflake_service.execute_query_async(f"""
             SELECT 
                 PREDICTION_ID, ASSET_ID, ASSET_TYPE,
                 ACTUAL_HEALTH_SCORE, PREDICTED_HEALTH_SCORE,
@@ -734,7 +1011,7 @@ async def get_asset_health_predictions(limit: int = Query(100, le=500)):
 async def get_vegetation_growth_predictions(limit: int = Query(100, le=500)):
     """Get ML-predicted vegetation growth rates and trim timing."""
     try:
-        results = snowflake_service.execute_query(f"""
+        results = await snowflake_service.execute_query_async(f"""
             SELECT 
                 PREDICTION_ID, ENCROACHMENT_ID, ASSET_ID, SPECIES,
                 ACTUAL_GROWTH_RATE, PREDICTED_GROWTH_RATE,
@@ -765,7 +1042,7 @@ async def get_vegetation_growth_predictions(limit: int = Query(100, le=500)):
 async def get_ignition_risk_predictions(limit: int = Query(100, le=500)):
     """Get ML-predicted wildfire ignition risk classifications."""
     try:
-        results = snowflake_service.execute_query(f"""
+        results = await snowflake_service.execute_query_async(f"""
             SELECT 
                 PREDICTION_ID, ASSET_ID, ASSET_TYPE,
                 ACTUAL_RISK, PREDICTED_IGNITION_RISK,
@@ -803,7 +1080,7 @@ async def get_cable_failure_predictions(limit: int = Query(100, le=500)):
     identifying invisible insulation degradation before catastrophic failure.
     """
     try:
-        results = snowflake_service.execute_query(f"""
+        results = await snowflake_service.execute_query_async(f"""
             SELECT 
                 PREDICTION_ID, ASSET_ID, MATERIAL, ASSET_AGE_YEARS,
                 MOISTURE_EXPOSURE, RAIN_CORRELATED_DIPS,
@@ -838,30 +1115,30 @@ async def get_cable_failure_predictions(limit: int = Query(100, le=500)):
 async def get_ml_summary():
     """Get summary of all ML model predictions and insights."""
     try:
-        asset_health = snowflake_service.execute_query("""
+        asset_health = (await snowflake_service.execute_query_cached_async("""
             SELECT COUNT(*) as total,
                    SUM(CASE WHEN PREDICTED_CONDITION = 'CRITICAL' THEN 1 ELSE 0 END) as critical
             FROM RISK_PLANNING_DB.ML.ASSET_HEALTH_PREDICTION
-        """)[0]
+        """))[0]
         
-        veg_growth = snowflake_service.execute_query("""
+        veg_growth = (await snowflake_service.execute_query_cached_async("""
             SELECT COUNT(*) as total,
                    SUM(CASE WHEN GROWTH_RISK = 'HIGH' THEN 1 ELSE 0 END) as high_risk,
                    SUM(CASE WHEN PREDICTED_DAYS_TO_CONTACT < 30 THEN 1 ELSE 0 END) as urgent
             FROM RISK_PLANNING_DB.ML.VEGETATION_GROWTH_PREDICTION
-        """)[0]
+        """))[0]
         
-        ignition = snowflake_service.execute_query("""
+        ignition = (await snowflake_service.execute_query_cached_async("""
             SELECT COUNT(*) as total,
                    SUM(CASE WHEN RISK_LEVEL = 'HIGH' THEN 1 ELSE 0 END) as high_risk
             FROM RISK_PLANNING_DB.ML.IGNITION_RISK_PREDICTION
-        """)[0]
+        """))[0]
         
-        cable = snowflake_service.execute_query("""
+        cable = (await snowflake_service.execute_query_cached_async("""
             SELECT COUNT(*) as total,
                    SUM(CASE WHEN RISK_LEVEL = 'HIGH' THEN 1 ELSE 0 END) as at_risk
             FROM RISK_PLANNING_DB.ML.CABLE_FAILURE_PREDICTION
-        """)[0]
+        """))[0]
         
         return {
             "models": {
@@ -911,7 +1188,7 @@ async def get_ml_summary():
 async def get_combined_risk_summary(limit: int = Query(100, le=500)):
     """Get combined ML risk view from dynamic table with all predictions merged."""
     try:
-        results = snowflake_service.execute_query(f"""
+        results = await snowflake_service.execute_query_async(f"""
             SELECT 
                 ASSET_ID, ASSET_TYPE, ACTUAL_CONDITION, ASSET_AGE_YEARS,
                 REGION, FIRE_THREAT_DISTRICT, TOTAL_CUSTOMERS,
@@ -951,7 +1228,7 @@ async def get_combined_risk_summary(limit: int = Query(100, le=500)):
 async def get_combined_risk_by_region():
     """Get aggregated ML risk metrics by region for dashboard visualization."""
     try:
-        results = snowflake_service.execute_query("""
+        results = await snowflake_service.execute_query_async("""
             SELECT 
                 REGION,
                 COUNT(*) as ASSET_COUNT,
@@ -978,7 +1255,7 @@ async def get_combined_risk_by_region():
 async def get_urgent_ml_actions(limit: int = Query(50, le=200)):
     """Get assets requiring urgent action based on ML predictions."""
     try:
-        results = snowflake_service.execute_query(f"""
+        results = await snowflake_service.execute_query_async(f"""
             SELECT 
                 ASSET_ID, ASSET_TYPE, REGION, FIRE_THREAT_DISTRICT,
                 HEALTH_STATUS, IGNITION_RISK_LEVEL, WATER_TREEING_RISK,
@@ -1013,6 +1290,48 @@ class AssetPredictionsRequest(BaseModel):
     asset_ids: List[str] = Field(..., description="List of asset IDs to fetch predictions for")
 
 
+# Per-asset ML prediction sets, keyed by the response field they populate
+_ASSET_PREDICTION_QUERIES = {
+    "health": """
+        SELECT ASSET_ID, PREDICTED_HEALTH_SCORE, PREDICTED_CONDITION, 
+               HEALTH_DELTA, MODEL_CONFIDENCE
+        FROM RISK_PLANNING_DB.ML.ASSET_HEALTH_PREDICTION
+        WHERE ASSET_ID IN ({ids})
+    """,
+    "vegetation": """
+        SELECT ASSET_ID, PREDICTED_DAYS_TO_CONTACT, GROWTH_RISK, 
+               PREDICTED_GROWTH_RATE, SPECIES
+        FROM RISK_PLANNING_DB.ML.VEGETATION_GROWTH_PREDICTION
+        WHERE ASSET_ID IN ({ids})
+    """,
+    "ignition": """
+        SELECT ASSET_ID, RISK_LEVEL, CONDITION_SCORE, AVG_CLEARANCE_DEFICIT
+        FROM RISK_PLANNING_DB.ML.IGNITION_RISK_PREDICTION
+        WHERE ASSET_ID IN ({ids})
+    """,
+    "cable": """
+        SELECT ASSET_ID, PREDICTED_WATER_TREEING, RAIN_VOLTAGE_CORRELATION,
+               RISK_LEVEL, RAIN_CORRELATED_DIPS, MOISTURE_EXPOSURE
+        FROM RISK_PLANNING_DB.ML.CABLE_FAILURE_PREDICTION
+        WHERE ASSET_ID IN ({ids})
+    """,
+    "combined": """
+        SELECT ASSET_ID, COMPOSITE_ML_RISK_SCORE, MAINTENANCE_PRIORITY,
+               HEALTH_STATUS, IGNITION_RISK_LEVEL, WATER_TREEING_RISK
+        FROM RISK_PLANNING_DB.ML.COMBINED_RISK_SUMMARY
+        WHERE ASSET_ID IN ({ids})
+    """,
+}
+
+
+def _index_by_asset(rows: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map ASSET_ID -> first row for that asset (O(rows) instead of a scan per asset)."""
+    index: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        index.setdefault(row["ASSET_ID"], row)
+    return index
+
+
 @app.post("/ml/asset-predictions", tags=["ML Predictions"])
 async def get_asset_ml_predictions(request: AssetPredictionsRequest):
     """
@@ -1026,60 +1345,23 @@ async def get_asset_ml_predictions(request: AssetPredictionsRequest):
         
         ids_str = ",".join(f"'{aid}'" for aid in asset_ids)
         
-        health = snowflake_service.execute_query(f"""
-            SELECT ASSET_ID, PREDICTED_HEALTH_SCORE, PREDICTED_CONDITION, 
-                   HEALTH_DELTA, MODEL_CONFIDENCE
-            FROM RISK_PLANNING_DB.ML.ASSET_HEALTH_PREDICTION
-            WHERE ASSET_ID IN ({ids_str})
-        """)
-        
-        vegetation = snowflake_service.execute_query(f"""
-            SELECT ASSET_ID, PREDICTED_DAYS_TO_CONTACT, GROWTH_RISK, 
-                   PREDICTED_GROWTH_RATE, SPECIES
-            FROM RISK_PLANNING_DB.ML.VEGETATION_GROWTH_PREDICTION
-            WHERE ASSET_ID IN ({ids_str})
-        """)
-        
-        ignition = snowflake_service.execute_query(f"""
-            SELECT ASSET_ID, RISK_LEVEL, CONDITION_SCORE, AVG_CLEARANCE_DEFICIT
-            FROM RISK_PLANNING_DB.ML.IGNITION_RISK_PREDICTION
-            WHERE ASSET_ID IN ({ids_str})
-        """)
-        
-        cable = snowflake_service.execute_query(f"""
-            SELECT ASSET_ID, PREDICTED_WATER_TREEING, RAIN_VOLTAGE_CORRELATION,
-                   RISK_LEVEL, RAIN_CORRELATED_DIPS, MOISTURE_EXPOSURE
-            FROM RISK_PLANNING_DB.ML.CABLE_FAILURE_PREDICTION
-            WHERE ASSET_ID IN ({ids_str})
-        """)
-        
-        combined = snowflake_service.execute_query(f"""
-            SELECT ASSET_ID, COMPOSITE_ML_RISK_SCORE, MAINTENANCE_PRIORITY,
-                   HEALTH_STATUS, IGNITION_RISK_LEVEL, WATER_TREEING_RISK
-            FROM RISK_PLANNING_DB.ML.COMBINED_RISK_SUMMARY
-            WHERE ASSET_ID IN ({ids_str})
-        """)
+        # The five prediction sets are independent - fetch them concurrently
+        results = await asyncio.gather(*(
+            snowflake_service.execute_query_async(sql.format(ids=ids_str))
+            for sql in _ASSET_PREDICTION_QUERIES.values()
+        ))
+        rows_by_set = dict(zip(_ASSET_PREDICTION_QUERIES, results))
+        indexes = {name: _index_by_asset(rows) for name, rows in rows_by_set.items()}
         
-        predictions = {}
-        for aid in asset_ids:
-            predictions[aid] = {
-                "health": next((h for h in health if h["ASSET_ID"] == aid), None),
-                "vegetation": next((v for v in vegetation if v["ASSET_ID"] == aid), None),
-                "ignition": next((i for i in ignition if i["ASSET_ID"] == aid), None),
-                "cable": next((c for c in cable if c["ASSET_ID"] == aid), None),
-                "combined": next((r for r in combined if r["ASSET_ID"] == aid), None)
-            }
+        predictions = {
+            aid: {name: index.get(aid) for name, index in indexes.items()}
+            for aid in asset_ids
+        }
         
         return {
             "predictions": predictions,
             "total_assets": len(asset_ids),
-            "coverage": {
-                "health": len(health),
-                "vegetation": len(vegetation),
-                "ignition": len(ignition),
-                "cable": len(cable),
-                "combined": len(combined)
-            }
+            "coverage": {name: len(rows) for name, rows in rows_by_set.items()}
         }
     except Exception as e:
         logger.error(f"Asset predictions error: {e}")
@@ -0,0 +1,47 @@
+"""
+VIGIL Risk Planning - Response Classes
+
+BulkJSONResponse renders large payloads (map layers, list endpoints) with
+orjson when it is installed, falling back to the standard encoder otherwise.
+
+Endpoints opt in by returning BulkJSONResponse(payload) directly, which also
+skips FastAPI's jsonable_encoder pass over every row. NDJSON streams encode
+each row with dumps_bulk so both formats render values the same way.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps_bulk(content: Any) -> bytes:
+    """Encode a row payload exactly as BulkJSONResponse does (Decimal as float)."""
+    if orjson is None:
+        import json
+        return json.dumps(content, default=_default, separators=(",", ":")).encode("utf-8")
+    return orjson.dumps(
+        content,
+        default=_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class BulkJSONResponse(JSONResponse):
+    """JSON response for bulk row payloads, encoded with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bulk(content)
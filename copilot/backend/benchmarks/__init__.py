@@ -0,0 +1 @@
+"""VIGIL Risk Planning - Benchmarks Package"""
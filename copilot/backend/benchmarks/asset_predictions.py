@@ -0,0 +1,134 @@
+"""
+VIGIL Risk Planning - Asset Predictions Benchmark
+
+Compares /ml/asset-predictions against the previous implementation
+(five sequential queries, then a next() scan per asset per prediction set).
+
+Two numbers are reported for each implementation:
+- join_ms: response assembly only, with zero warehouse latency
+- request_ms: end-to-end latency with a simulated warehouse round-trip
+
+Usage (from copilot/backend):
+    python -m benchmarks.asset_predictions --assets 500 --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from api import main
+from services import snowflake_service_spcs
+from services.snowflake_service_spcs import SnowflakeServiceSPCS
+
+# Never try to open a real warehouse session from the benchmark.
+snowflake_service_spcs.IS_SPCS = False
+
+_IN_LIST = re.compile(r"ASSET_ID IN \((.*?)\)", re.DOTALL)
+
+
+class SimulatedPredictionService(SnowflakeServiceSPCS):
+    """Returns one prediction row per requested asset after a fixed delay."""
+
+    def __init__(self, latency_s: float):
+        super().__init__()
+        self.latency_s = latency_s
+
+    def execute_query(self, query: str) -> List[Dict[str, Any]]:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        match = _IN_LIST.search(query)
+        ids = [i.strip().strip("'") for i in match.group(1).split(",")] if match else []
+        rng = random.Random(len(ids))
+        rows = [{"ASSET_ID": aid, "SCORE": rng.random(), "RISK_LEVEL": "HIGH"} for aid in ids]
+        rng.shuffle(rows)
+        return rows
+
+
+@main.app.post("/bench/asset-predictions-legacy", include_in_schema=False)
+async def _legacy_asset_predictions(request: main.AssetPredictionsRequest):
+    """Previous behaviour: sequential queries and a linear scan per lookup."""
+    asset_ids = request.asset_ids[:500]
+    ids_str = ",".join(f"'{aid}'" for aid in asset_ids)
+    sets = {}
+    for name, sql in main._ASSET_PREDICTION_QUERIES.items():
+        sets[name] = await main.snowflake_service.execute_query_async(sql.format(ids=ids_str))
+
+    predictions = {}
+    for aid in asset_ids:
+        predictions[aid] = {
+            name: next((r for r in rows if r["ASSET_ID"] == aid), None)
+            for name, rows in sets.items()
+        }
+    return {"predictions": predictions, "total_assets": len(asset_ids)}
+
+
+def _join_timings(asset_ids: List[str], repeat: int) -> Dict[str, float]:
+    """Time only the response assembly for both approaches."""
+    service = SimulatedPredictionService(0)
+    ids_str = ",".join(f"'{aid}'" for aid in asset_ids)
+    sets = {
+        name: service.execute_query(sql.format(ids=ids_str))
+        for name, sql in main._ASSET_PREDICTION_QUERIES.items()
+    }
+    service.close()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        {aid: {name: next((r for r in rows if r["ASSET_ID"] == aid), None) for name, rows in sets.items()}
+         for aid in asset_ids}
+    scan_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        indexes = {name: main._index_by_asset(rows) for name, rows in sets.items()}
+        {aid: {name: index.get(aid) for name, index in indexes.items()} for aid in asset_ids}
+    index_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    return {"scan_join_ms": round(scan_ms, 2), "indexed_join_ms": round(index_ms, 2)}
+
+
+async def _request_timings(asset_ids: List[str], latency_ms: float, repeat: int) -> Dict[str, float]:
+    main.snowflake_service = SimulatedPredictionService(latency_ms / 1000)
+    transport = httpx.ASGITransport(app=main.app)
+    timings = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        for label, path in (("legacy_request_ms", "/bench/asset-predictions-legacy"),
+                            ("request_ms", "/ml/asset-predictions")):
+            started = time.perf_counter()
+            for _ in range(repeat):
+                response = await client.post(path, json={"asset_ids": asset_ids})
+                response.raise_for_status()
+            timings[label] = round((time.perf_counter() - started) * 1000 / repeat, 1)
+    main.snowflake_service.close()
+    return timings
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", type=int, default=500, help="Asset IDs per request (endpoint caps at 500)")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Simulated warehouse latency per query")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asset_ids = [f"AST-{i:06d}" for i in range(args.assets)]
+    result = {
+        "assets": args.assets,
+        "simulated_query_latency_ms": args.latency_ms,
+        **_join_timings(asset_ids, args.repeat),
+        **asyncio.run(_request_timings(asset_ids, args.latency_ms, args.repeat)),
+    }
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main_cli()
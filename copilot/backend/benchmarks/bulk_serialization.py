@@ -0,0 +1,173 @@
+"""
+VIGIL Risk Planning - Bulk Fetch/Serialization Benchmark
+
+Measures /dashboard/map at N rows two ways:
+- row:   cursor.fetchall() tuples -> per-value isoformat loop -> FastAPI
+         jsonable_encoder + stdlib json (the previous behaviour)
+- arrow: cursor.fetch_arrow_all() -> vectorized conversion -> BulkJSONResponse
+
+The connector is simulated by an in-memory Arrow table. fetchall() converts it
+to Python tuples, standing in for the connector's own Arrow -> row decoding.
+A second scenario times record conversion alone for an asset-shaped table
+with DATE/TIMESTAMP columns.
+
+Usage (from copilot/backend):
+    python -m benchmarks.bulk_serialization --rows 5000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+import pyarrow as pa
+
+from api import main
+from services import snowflake_service_spcs
+from services.columnar import arrow_to_records
+from services.connection_pool import ConnectionPool
+from services.snowflake_service_spcs import SnowflakeServiceSPCS
+
+# Never try to open a real warehouse session from the benchmark.
+snowflake_service_spcs.IS_SPCS = False
+
+
+def _map_table(rows: int) -> pa.Table:
+    rng = random.Random(7)
+    return pa.table({
+        "ASSET_ID": [f"AST-{i:06d}" for i in range(rows)],
+        "ASSET_TYPE": [rng.choice(["POLE", "TRANSFORMER", "CONDUCTOR", "UG_CABLE"]) for _ in range(rows)],
+        "CONDITION_SCORE": pa.array([Decimal(f"{rng.random():.2f}") for _ in range(rows)], pa.decimal128(5, 2)),
+        "COMPOSITE_RISK_SCORE": pa.array([Decimal(f"{rng.uniform(0, 100):.2f}") for _ in range(rows)], pa.decimal128(6, 2)),
+        "RISK_TIER": [rng.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"]) for _ in range(rows)],
+        "FIRE_THREAT_DISTRICT": [rng.choice(["TIER_1", "TIER_2", "TIER_3"]) for _ in range(rows)],
+        "REGION": [rng.choice(["NORCAL", "SOCAL", "PNW", "SOUTHWEST", "MOUNTAIN"]) for _ in range(rows)],
+        "LATITUDE": [rng.uniform(32, 48) for _ in range(rows)],
+        "LONGITUDE": [rng.uniform(-124, -104) for _ in range(rows)],
+    })
+
+
+def _asset_table(rows: int) -> pa.Table:
+    rng = random.Random(11)
+    base = datetime(2024, 1, 1)
+    return pa.table({
+        "ASSET_ID": [f"AST-{i:06d}" for i in range(rows)],
+        "INSTALLATION_DATE": [date(1970, 1, 1) + timedelta(days=rng.randrange(20000)) for _ in range(rows)],
+        "LAST_INSPECTION_DATE": pa.array([base + timedelta(seconds=rng.randrange(10**7)) for _ in range(rows)], pa.timestamp("ns")),
+        "CONDITION_SCORE": pa.array([Decimal(f"{rng.random():.2f}") for _ in range(rows)], pa.decimal128(5, 2)),
+        "REPLACEMENT_COST": pa.array([Decimal(f"{rng.uniform(1e3, 1e6):.2f}") for _ in range(rows)], pa.decimal128(12, 2)),
+    })
+
+
+class _FakeCursor:
+    def __init__(self, table: pa.Table):
+        self._table = table
+        self.description = [(name,) for name in table.column_names]
+
+    def execute(self, query: str):
+        pass
+
+    def fetchall(self):
+        return list(zip(*(column.to_pylist() for column in self._table.columns)))
+
+    def fetch_arrow_all(self):
+        return self._table
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, table: pa.Table):
+        self._table = table
+
+    def cursor(self):
+        return _FakeCursor(self._table)
+
+    def close(self):
+        pass
+
+
+class InMemoryWarehouseService(SnowflakeServiceSPCS):
+    """Service whose pooled connections serve a fixed Arrow table."""
+
+    def __init__(self, table: pa.Table):
+        super().__init__()
+        self.cache.enabled = False
+        self._pool = ConnectionPool(factory=lambda: _FakeConnection(table), min_size=1, max_size=4)
+
+
+@main.app.get("/bench/map-rows", include_in_schema=False)
+async def _map_rows():
+    """Previous behaviour: row fetch, dict payload through FastAPI's default encoder."""
+    data = await main.snowflake_service.run_async(main.snowflake_service.get_map_data)
+    return {
+        "type": "FeatureCollection",
+        "features": main._map_features(data),
+        "fire_season": main.snowflake_service.get_fire_season_countdown()
+    }
+
+
+async def _time_endpoint(path: str, arrow: bool, repeat: int) -> Dict[str, Any]:
+    main.snowflake_service._arrow_fetch = arrow
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        await client.get(path)  # warm-up
+        started = time.perf_counter()
+        for _ in range(repeat):
+            response = await client.get(path)
+            response.raise_for_status()
+        elapsed = (time.perf_counter() - started) / repeat
+    return {"ms_per_request": round(elapsed * 1000, 1), "bytes": len(response.content)}
+
+
+def _time_conversion(table: pa.Table, repeat: int) -> Dict[str, float]:
+    cursor = _FakeCursor(table)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        SnowflakeServiceSPCS._cursor_to_dicts(cursor)
+    row_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        arrow_to_records(cursor.fetch_arrow_all())
+    arrow_ms = (time.perf_counter() - started) * 1000 / repeat
+    return {"row_convert_ms": round(row_ms, 2), "arrow_convert_ms": round(arrow_ms, 2)}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    main.snowflake_service = InMemoryWarehouseService(_map_table(args.rows))
+    before = asyncio.run(_time_endpoint("/bench/map-rows", arrow=False, repeat=args.repeat))
+    after = asyncio.run(_time_endpoint("/dashboard/map", arrow=True, repeat=args.repeat))
+    main.snowflake_service.close()
+
+    rows_per_s = lambda r: round(args.rows / (r["ms_per_request"] / 1000))
+    print(json.dumps({
+        "scenario": "dashboard_map",
+        "rows": args.rows,
+        "row_path": {**before, "rows_per_s": rows_per_s(before)},
+        "arrow_path": {**after, "rows_per_s": rows_per_s(after)},
+    }))
+    print(json.dumps({
+        "scenario": "asset_record_conversion",
+        "rows": args.rows,
+        **_time_conversion(_asset_table(args.rows), args.repeat),
+    }))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,253 @@
+"""
+VIGIL Risk Planning - Local Cortex Agent Stand-in
+
+Serves the Cortex Agents `:run` endpoint locally so /chat/stream can be
+measured and profiled offline. Point the API at it with
+CORTEX_AGENT_BASE_URL=http://127.0.0.1:<port>; any bearer token is accepted.
+
+Each run streams an agent-shaped SSE response:
+- response.status (planning, then streaming_analyst_results)
+- response.thinking.delta reasoning tokens
+- response.tool_result.status and response.tool_result with the SQL and a
+  result set of --tool-rows rows
+- response.chart with a Vega-Lite spec (a JSON string, as Snowflake sends it)
+- response.output_text.delta answer tokens
+- a final [DONE]
+
+Timing is configurable: --latency-ms before the first event, then thinking
+and answer deltas paced at --token-rate tokens per second (0 = unpaced).
+With --replay, a recorded SSE body (raw text/event-stream, e.g. captured from
+the live endpoint or written by `benchmarks.sse_stream --save`) is replayed
+instead, with its text and thinking deltas paced the same way.
+
+GET /stats reports runs served, so a load test can tell stand-in traffic
+from semantic-cache replays.
+
+Usage (from copilot/backend):
+    python -m benchmarks.cortex_stub --port 8700 --token-rate 40 --latency-ms 400
+    python -m benchmarks.cortex_stub --replay /tmp/agent_stream.txt --token-rate 0
+    CORTEX_AGENT_BASE_URL=http://127.0.0.1:8700 uvicorn api.main:app
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from services.sse_decoder import SSEDecoder, SSEEvent
+
+AGENT_RUN_PATH = "/api/v2/databases/{database}/schemas/{schema}/agents/{agent}:run"
+
+# Event types paced at the token rate
+_DELTA_EVENTS = {"response.output_text.delta", "response.text.delta", "response.thinking.delta"}
+
+_WORDS = [
+    "Circuit", "HFTD", "Tier 3", "clearance", "GO95", "trim", "overdue", "poles",
+    "ignition", "risk", "vegetation", "feeder", "conductor", "inspection", "priority",
+    "the", "and", "with", "across", "NORCAL", "fire season", "critical", "assets",
+]
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 300.0
+    token_rate: float = 50.0
+    tokens: int = 150
+    tokens_per_event: int = 1
+    thinking_tokens: int = 40
+    tool_rows: int = 25
+    chart: bool = True
+    replay: Optional[List[SSEEvent]] = None
+    seed: int = 7
+
+
+def _sse(event: str, data: Any) -> bytes:
+    payload = data if isinstance(data, str) else json.dumps(data, ensure_ascii=False)
+    lines = "".join(f"data: {line}\n" for line in payload.split("\n"))
+    return f"event: {event}\n{lines}\n".encode("utf-8")
+
+
+def load_recording(path: str) -> List[SSEEvent]:
+    """Decode a recorded text/event-stream body into its events."""
+    with open(path, "rb") as f:
+        body = f.read()
+    decoder = SSEDecoder()
+    events = decoder.feed(body)
+    events.extend(decoder.flush())
+    if not events:
+        raise ValueError(f"No SSE events in {path}")
+    return events
+
+
+def _question(body: Dict[str, Any]) -> str:
+    for message in reversed(body.get("messages") or []):
+        for item in message.get("content") or []:
+            if isinstance(item, dict) and item.get("text"):
+                return item["text"]
+    return ""
+
+
+def _tool_result(rng: random.Random, rows: int) -> Dict[str, Any]:
+    data = [
+        [
+            f"AST-{rng.randrange(1_000_000):06d}",
+            rng.choice(["POLE", "TRANSFORMER", "CONDUCTOR", "CABLE_UNDERGROUND"]),
+            round(rng.random(), 2),
+            round(rng.uniform(0, 100), 1),
+            rng.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"]),
+            rng.choice(["NORCAL", "SOCAL", "PNW", "SOUTHWEST", "MOUNTAIN"]),
+        ]
+        for _ in range(rows)
+    ]
+    return {"content": [{"json": {
+        "sql": "SELECT ASSET_ID, ASSET_TYPE, CONDITION_SCORE, COMPOSITE_RISK_SCORE, RISK_TIER, REGION "
+               "FROM RISK_PLANNING_DB.ATOMIC.ASSET ORDER BY COMPOSITE_RISK_SCORE DESC LIMIT 50",
+        "data": data,
+    }}]}
+
+
+def _chart_spec() -> str:
+    return json.dumps({
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "REGION", "type": "nominal"},
+            "y": {"field": "COMPOSITE_RISK_SCORE", "type": "quantitative", "aggregate": "mean"},
+        },
+    })
+
+
+class _Pacer:
+    """Sleeps so that delta tokens leave at the configured rate."""
+
+    def __init__(self, token_rate: float):
+        self.interval = 1 / token_rate if token_rate > 0 else 0.0
+        self.next_at = time.perf_counter()
+
+    async def tokens(self, count: int):
+        if not self.interval:
+            return
+        self.next_at = max(self.next_at, time.perf_counter()) + count * self.interval
+        delay = self.next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def synthetic_events(config: StubConfig, question: str, rng: random.Random) -> AsyncIterator[bytes]:
+    pacer = _Pacer(config.token_rate)
+    per_event = max(1, config.tokens_per_event)
+
+    yield _sse("response.status", {"status": "planning", "message": "Planning the next steps"})
+    for start in range(0, config.thinking_tokens, per_event):
+        count = min(per_event, config.thinking_tokens - start)
+        await pacer.tokens(count)
+        yield _sse("response.thinking.delta", {"text": " ".join(rng.choice(_WORDS) for _ in range(count)) + " "})
+
+    if config.tool_rows:
+        yield _sse("response.status", {"status": "streaming_analyst_results", "message": "Running SQL"})
+        yield _sse("response.tool_result.status", {"status": "executing_sql", "message": "Executing SQL"})
+        yield _sse("response.tool_result", _tool_result(rng, config.tool_rows))
+    if config.chart:
+        yield _sse("response.chart", {"chart_spec": _chart_spec()})
+
+    words = [f"Answering: {question}."] if question else []
+    words += [rng.choice(_WORDS) for _ in range(max(0, config.tokens - len(words)))]
+    for start in range(0, len(words), per_event):
+        chunk = words[start:start + per_event]
+        await pacer.tokens(len(chunk))
+        yield _sse("response.output_text.delta", {"text": " ".join(chunk) + " "})
+
+
+async def replayed_events(config: StubConfig) -> AsyncIterator[bytes]:
+    pacer = _Pacer(config.token_rate)
+    for event in config.replay:
+        if event.event in _DELTA_EVENTS:
+            try:
+                text = json.loads(event.data).get("text", "")
+            except (ValueError, AttributeError):
+                text = ""
+            await pacer.tokens(max(1, len(text.split())))
+        if event.data.strip() == "[DONE]":
+            return
+        yield _sse(event.event or "message", event.data)
+
+
+def create_app(config: StubConfig) -> FastAPI:
+    app = FastAPI(title="Cortex Agent stand-in")
+    stats = {"runs": 0, "active": 0, "bytes": 0}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/stats")
+    async def get_stats():
+        return stats
+
+    @app.post(AGENT_RUN_PATH)
+    async def run_agent(database: str, schema: str, agent: str, request: Request):
+        body = await request.json()
+        stats["runs"] += 1
+        rng = random.Random(config.seed * 1_000_003 + stats["runs"])
+
+        async def stream():
+            stats["active"] += 1
+            try:
+                if config.latency_ms:
+                    await asyncio.sleep(config.latency_ms / 1000)
+                events = replayed_events(config) if config.replay else synthetic_events(config, _question(body), rng)
+                async for chunk in events:
+                    stats["bytes"] += len(chunk)
+                    yield chunk
+                yield _sse("done", "[DONE]")
+            finally:
+                stats["active"] -= 1
+
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    return app
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="Delay before the first event")
+    parser.add_argument("--token-rate", type=float, default=50.0, help="Delta tokens per second (0 = unpaced)")
+    parser.add_argument("--tokens", type=int, default=150, help="Answer tokens per run")
+    parser.add_argument("--tokens-per-event", type=int, default=1, help="Tokens per delta event")
+    parser.add_argument("--thinking-tokens", type=int, default=40, help="Reasoning tokens per run")
+    parser.add_argument("--tool-rows", type=int, default=25, help="Rows in the tool_result payload (0 = none)")
+    parser.add_argument("--no-chart", action="store_true", help="Skip the response.chart event")
+    parser.add_argument("--replay", help="Recorded SSE body to replay instead of synthetic events")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        latency_ms=args.latency_ms,
+        token_rate=args.token_rate,
+        tokens=args.tokens,
+        tokens_per_event=args.tokens_per_event,
+        thinking_tokens=args.thinking_tokens,
+        tool_rows=args.tool_rows,
+        chart=not args.no_chart,
+        replay=load_recording(args.replay) if args.replay else None,
+        seed=args.seed,
+    )
+    print(f"[STUB] Cortex Agent stand-in on http://{args.host}:{args.port}", flush=True)
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main_cli()
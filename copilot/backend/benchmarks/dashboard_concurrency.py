@@ -0,0 +1,124 @@
+"""
+VIGIL Risk Planning - Dashboard Concurrency Benchmark
+
+Fires N parallel /dashboard/metrics loads at the FastAPI app in-process and
+reports p50/p95/p99 latency, plus the latency of a /health probe issued while
+the dashboard loads are in flight (a direct measure of event-loop blocking).
+
+The warehouse is simulated with a blocking sleep per query, which is what the
+Snowflake connector does from the caller's point of view.
+
+Usage (from copilot/backend):
+    python -m benchmarks.dashboard_concurrency --requests 50 --latency-ms 80
+    python -m benchmarks.dashboard_concurrency --mode blocking
+    python -m benchmarks.dashboard_concurrency --mode serial --requests 1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from api import main
+from services import snowflake_service_spcs
+from services.snowflake_service_spcs import SnowflakeServiceSPCS
+
+# Never try to open a real warehouse session from the benchmark.
+snowflake_service_spcs.IS_SPCS = False
+
+
+class SimulatedWarehouseService(SnowflakeServiceSPCS):
+    """Service whose queries block for a fixed warehouse round-trip."""
+    
+    def __init__(self, latency_s: float):
+        super().__init__()
+        self.latency_s = latency_s
+        # Measure the warehouse-bound path, not the result cache
+        self.cache.enabled = False
+    
+    def execute_query(self, query: str) -> List[Dict[str, Any]]:
+        time.sleep(self.latency_s)
+        return [{"REGION": "NORCAL", "ASSET_COUNT": 1}]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@main.app.get("/bench/dashboard-blocking", include_in_schema=False)
+async def _dashboard_blocking():
+    """Pre-async behaviour: the warehouse call runs on the event loop."""
+    return main.snowflake_service.get_dashboard_metrics()
+
+
+@main.app.get("/bench/dashboard-serial", include_in_schema=False)
+async def _dashboard_serial():
+    """Off the event loop, but the four summary queries run one after another."""
+    return await main.snowflake_service.run_async(main.snowflake_service.get_dashboard_metrics)
+
+
+async def _timed_get(client: httpx.AsyncClient, path: str, submitted: float, delay_s: float = 0.0) -> float:
+    """Latency as the caller sees it: from submission, not from when the loop got to it."""
+    if delay_s:
+        await asyncio.sleep(delay_s)
+    response = await client.get(path)
+    response.raise_for_status()
+    return (time.perf_counter() - submitted - delay_s) * 1000
+
+
+async def run(requests: int, latency_ms: float, mode: str) -> Dict[str, Any]:
+    main.snowflake_service = SimulatedWarehouseService(latency_ms / 1000)
+    path = {
+        "async": "/dashboard/metrics",
+        "serial": "/bench/dashboard-serial",
+        "blocking": "/bench/dashboard-blocking",
+    }[mode]
+    
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        started = time.perf_counter()
+        loads = [asyncio.create_task(_timed_get(client, path, started)) for _ in range(requests)]
+        probe_delay_s = latency_ms / 1000
+        health_ms = await _timed_get(client, "/health", time.perf_counter(), probe_delay_s)
+        latencies = await asyncio.gather(*loads)
+        wall_ms = (time.perf_counter() - started) * 1000
+    
+    main.snowflake_service.close()
+    return {
+        "mode": mode,
+        "requests": requests,
+        "simulated_query_latency_ms": latency_ms,
+        "query_workers": main.snowflake_service._executor._max_workers,
+        "wall_ms": round(wall_ms, 1),
+        "p50_ms": round(_percentile(latencies, 50), 1),
+        "p95_ms": round(_percentile(latencies, 95), 1),
+        "p99_ms": round(_percentile(latencies, 99), 1),
+        "health_probe_ms": round(health_ms, 1),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50, help="Parallel dashboard loads")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Simulated warehouse latency per query")
+    parser.add_argument("--mode", choices=["async", "serial", "blocking", "all"], default="all")
+    args = parser.parse_args()
+    
+    modes = ["blocking", "serial", "async"] if args.mode == "all" else [args.mode]
+    for mode in modes:
+        print(json.dumps(asyncio.run(run(args.requests, args.latency_ms, mode))))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,182 @@
+"""
+VIGIL Risk Planning - Intent Classifier Benchmark
+
+Routes a corpus of operator questions through two classifiers:
+- legacy:   lowercase, then one re.search per keyword pattern, intent by
+            intent, first match wins (the previous _classify_intent)
+- compiled: IntentClassifier, one first-letter-factored alternation regex with
+            weighted scoring
+
+Each corpus line carries the intent an operator would expect, so the report
+shows routing accuracy for both alongside µs per message, plus every
+question the two route differently and the ranked output for a sample.
+
+The built-in corpus is the copilot help-message examples plus questions in
+the same operator register (single-topic and compound). A recorded corpus can
+be supplied as a file of "expected_intent<TAB>question" lines.
+
+Usage (from copilot/backend):
+    python -m benchmarks.intent_classifier
+    python -m benchmarks.intent_classifier --input questions.tsv --repeat 2000
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.intent_classifier import DEFAULT_INTENT, IntentClassifier
+
+# Previous AgentOrchestrator.INTENT_PATTERNS, kept verbatim for comparison
+LEGACY_PATTERNS: List[Tuple[str, List[str]]] = [
+    ("hidden_discovery", [
+        r"hidden", r"discovery", r"water\s*tree", r"underground\s*cable",
+        r"rain.*voltage", r"voltage.*rain", r"ami.*correlat", r"moisture.*degrad",
+        r"xlpe.*fail", r"cable.*fail"
+    ]),
+    ("fire_risk", [
+        r"fire\s*season", r"fire\s*risk", r"ignition", r"tier\s*3", r"hftd",
+        r"fire\s*district", r"wildfire", r"psps", r"red\s*flag"
+    ]),
+    ("vegetation", [
+        r"vegetation", r"clearance", r"encroach", r"trim", r"go95", r"go\s*95",
+        r"tree", r"eucalyptus", r"species", r"growth\s*rate"
+    ]),
+    ("asset_health", [
+        r"asset\s*health", r"pole", r"transformer", r"conductor", r"equipment",
+        r"condition", r"replace", r"inspection", r"age"
+    ]),
+    ("work_order", [
+        r"work\s*order", r"priority", r"backlog", r"schedule", r"crew",
+        r"issue.*order", r"create.*order"
+    ]),
+    ("compliance", [
+        r"compliance", r"violation", r"cpuc", r"regulat", r"standard"
+    ]),
+]
+
+CORPUS: List[Tuple[str, str]] = [
+    # Help-message examples
+    ("fire_risk", "How many days until fire season?"),
+    ("fire_risk", "Show me Tier 3 fire district assets"),
+    ("fire_risk", "What is our fire season readiness?"),
+    ("vegetation", "Show vegetation compliance by region"),
+    ("vegetation", "What encroachments need priority attention?"),
+    ("vegetation", "List non-compliant GO95 clearances"),
+    ("data_query", "Show me high-risk assets"),
+    ("asset_health", "Which poles need replacement?"),
+    ("asset_health", "What is the average asset health score?"),
+    ("work_order", "Show work order backlog by priority"),
+    ("vegetation", "What vegetation work is planned?"),
+    ("hidden_discovery", "Show me the Water Treeing pattern"),
+    ("hidden_discovery", "Find rain-correlated voltage dips"),
+    ("hidden_discovery", "Which underground cables are at risk?"),
+    # Single-topic operator questions
+    ("fire_risk", "Which circuits are in the PSPS scope for the red flag warning tomorrow?"),
+    ("fire_risk", "List HFTD tier 2 segments with ignition history"),
+    ("fire_risk", "What is the wildfire risk score for the Paradise district?"),
+    ("vegetation", "Which eucalyptus spans have the fastest growth rate?"),
+    ("vegetation", "How many trees are within 4 feet of a primary conductor?"),
+    ("vegetation", "Show trim cycles overdue in SoCal"),
+    ("asset_health", "Which transformers are older than 40 years?"),
+    ("asset_health", "What is the average pole age in NorCal?"),
+    ("asset_health", "List conductors in poor condition"),
+    ("asset_health", "When was the last inspection on substation equipment in the PNW?"),
+    ("work_order", "How big is the crew backlog this week?"),
+    ("work_order", "Create a work order for pole P-10422"),
+    ("work_order", "What is scheduled for the Redding crew on Monday?"),
+    ("compliance", "How many CPUC violations did we log last quarter?"),
+    ("compliance", "Are we meeting the regulatory inspection standard?"),
+    ("hidden_discovery", "Correlate AMI voltage with rainfall for underground feeders"),
+    ("hidden_discovery", "Which XLPE cables failed after heavy rain?"),
+    ("hidden_discovery", "Show moisture degradation on buried cable segments"),
+    ("data_query", "How many assets do we have in the Mountain region?"),
+    ("data_query", "Top 10 highest risk circuits"),
+    # Wording the legacy substring patterns misroute
+    ("data_query", "Summarize storage usage by management area"),
+    ("data_query", "Show the risk page for the Sierra region"),
+    ("asset_health", "Break down pole coverage by district"),
+    # Compound questions
+    ("fire_risk", "Show tier 3 assets with vegetation encroachment and open work orders"),
+    ("vegetation", "Which GO95 clearance violations are on poles in the fire district?"),
+    ("fire_risk", "Compare wildfire ignition risk with transformer condition in NorCal"),
+    ("work_order", "Schedule crews for the work order backlog on high priority poles"),
+    ("hidden_discovery", "Are water treeing failures driving cable replacement work orders?"),
+]
+
+
+def legacy_classify(message: str) -> str:
+    message_lower = message.lower()
+    for intent, patterns in LEGACY_PATTERNS:
+        if any(re.search(pattern, message_lower) for pattern in patterns):
+            return intent
+    return DEFAULT_INTENT
+
+
+def load_corpus(path: str) -> List[Tuple[str, str]]:
+    corpus = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                expected, question = line.rstrip("\n").split("\t", 1)
+                corpus.append((expected, question))
+    return corpus
+
+
+def _time_us(classify: Callable[[str], object], questions: List[str], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for question in questions:
+            classify(question)
+    return round((time.perf_counter() - started) / (repeat * len(questions)) * 1e6, 2)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="TSV of expected_intent<TAB>question lines")
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--sample", type=int, default=6, help="Ranked outputs to print")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.input) if args.input else CORPUS
+    questions = [question for _, question in corpus]
+    classifier = IntentClassifier()
+
+    legacy_us = _time_us(legacy_classify, questions, args.repeat)
+    compiled_us = _time_us(classifier.classify, questions, args.repeat)
+
+    legacy_correct = compiled_correct = agree = 0
+    changed = []
+    for expected, question in corpus:
+        old = legacy_classify(question)
+        match = classifier.classify(question)
+        legacy_correct += old == expected
+        compiled_correct += match.intent == expected
+        agree += old == match.intent
+        if old != match.intent:
+            changed.append({"question": question, "expected": expected, "legacy": old, "compiled": match.intent})
+
+    sample = []
+    for _, question in corpus[-args.sample:]:
+        match = classifier.classify(question)
+        sample.append({"question": question, "confidence": match.confidence, "ranked": match.ranked})
+
+    print(json.dumps({
+        "scenario": "intent_classifier",
+        "questions": len(corpus),
+        "legacy": {"us_per_message": legacy_us, "accuracy": round(legacy_correct / len(corpus), 3)},
+        "compiled": {"us_per_message": compiled_us, "accuracy": round(compiled_correct / len(corpus), 3)},
+        "speedup": round(legacy_us / compiled_us, 1) if compiled_us else None,
+        "primary_agreement": round(agree / len(corpus), 3),
+        "changed": changed,
+        "sample": sample,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,456 @@
+"""
+VIGIL Risk Planning - API Load Test
+
+Boots the real API (uvicorn running api.main:app in a subprocess) on the
+embedded warehouse (SNOWFLAKE_LOCAL_BACKEND=duckdb), so it runs offline
+against generated data, and drives a weighted mix of dashboard, map, list,
+ML and /chat/stream traffic at it from concurrent HTTP clients.
+
+For each dataset scale it reports throughput and p50/p95/p99 latency per
+traffic class, the server's startup time and resident memory (after load and
+peak), as one JSON document for comparing commits. Cortex is never reached:
+the embedded backend answers Cortex Complete with an empty string, and the
+agent behind /chat/stream is the local stand-in from benchmarks.cortex_stub
+(CORTEX_AGENT_BASE_URL), streaming at the configured --cortex-* pace.
+--cortex none leaves the agent unconfigured, so chat measures the app's own
+fallback path instead. Repeated chat questions are answered from the
+semantic cache; pass --env SEMANTIC_CACHE_ENABLED=false to stream every one.
+
+Synthetic data for each scale is generated on first use under --data-root
+and reused afterwards (same seed + scale = same data).
+
+Usage (from copilot/backend):
+    python -m benchmarks.load_test --assets 5000 --duration 30
+    python -m benchmarks.load_test --assets 5000,100000,1000000 --concurrency 16 --output bench.json
+    python -m benchmarks.load_test --mix chat=1 --requests 200 --cortex-token-rate 0 \
+        --env SEMANTIC_CACHE_ENABLED=false
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(os.path.dirname(BACKEND_DIR))
+GENERATOR = os.path.join(REPO_ROOT, "scripts", "generate_synthetic_data.py")
+DEFAULT_DATA_ROOT = os.path.join(REPO_ROOT, "data", "bench")
+
+# Assets the generator produces at --scale 1
+BASE_ASSET_COUNT = 5000
+
+# Requests per traffic class; one is picked at random per request
+TRAFFIC = {
+    "dashboard": [
+        ("GET", "/dashboard/metrics"),
+        ("GET", "/fire-season"),
+    ],
+    "map": [
+        ("GET", "/dashboard/map?zoom=5"),
+        ("GET", "/dashboard/map?zoom=12&bbox=-122.6,37.2,-121.8,38.0"),
+        ("GET", "/tiles/5/5/12.mvt"),
+    ],
+    "list": [
+        ("GET", "/assets?limit=100"),
+        ("GET", "/vegetation?limit=100"),
+        ("GET", "/risk?limit=100"),
+        ("GET", "/work-orders?limit=100"),
+        ("GET", "/assets/replacement-priorities"),
+    ],
+    "ml": [
+        ("GET", "/ml/summary"),
+        ("GET", "/ml/combined-risk"),
+        ("GET", "/ml/urgent-actions"),
+        ("GET", "/ml/asset-health"),
+    ],
+    "chat": [
+        ("POST", "/chat/stream"),
+    ],
+}
+
+CHAT_QUESTIONS = [
+    "Which circuits have the highest fire risk?",
+    "How many vegetation violations are there in NORCAL?",
+    "Show me cables with water treeing risk",
+    "What work orders are overdue?",
+]
+
+DEFAULT_MIX = "dashboard=3,map=2,list=3,ml=2,chat=1"
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in TRAFFIC:
+            raise ValueError(f"Unknown traffic class '{name}' (expected one of {', '.join(TRAFFIC)})")
+        mix[name] = float(weight or 1)
+    if not any(mix.values()):
+        raise ValueError("Traffic mix has no positive weights")
+    return mix
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _memory_mb(pid: int) -> Dict[str, Optional[float]]:
+    """Resident and peak resident memory of a process (Linux /proc; None elsewhere)."""
+    memory = {"rss_mb": None, "peak_rss_mb": None}
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    kb = float(value.split()[0])
+                    memory["rss_mb" if key == "VmRSS" else "peak_rss_mb"] = round(kb / 1024, 1)
+    except OSError:
+        pass
+    return memory
+
+
+def _log(message: str):
+    print(f"[BENCH] {message}", file=sys.stderr, flush=True)
+
+
+def ensure_dataset(assets: int, data_root: str, seed: int, workers: int) -> Tuple[str, Optional[float]]:
+    """Directory with generated data for this asset count; returns (path, generation seconds or None if reused)."""
+    data_dir = os.path.join(data_root, f"assets-{assets}-seed-{seed}")
+    if os.path.exists(os.path.join(data_dir, "assets.parquet")):
+        _log(f"Reusing dataset {data_dir}")
+        return data_dir, None
+
+    scale = assets / BASE_ASSET_COUNT
+    _log(f"Generating {assets:,} assets (scale {scale:g}) into {data_dir}...")
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, GENERATOR, "--scale", f"{scale:g}", "--seed", str(seed),
+         "--workers", str(workers), "--output-dir", data_dir],
+        check=True, stdout=subprocess.DEVNULL
+    )
+    return data_dir, round(time.perf_counter() - started, 1)
+
+
+class _Subprocess:
+    """A local HTTP service in a subprocess, bound to 127.0.0.1 on a free port."""
+
+    def __init__(self, argv: List[str], env: Dict[str, str], log_path: str):
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.argv = [arg.format(port=self.port) for arg in argv]
+        self.env = env
+        self.process: Optional[subprocess.Popen] = None
+        self.log_path = log_path
+        self._log = None
+
+    def start(self, timeout: float) -> float:
+        """Start the service and wait until /health answers; returns startup seconds."""
+        started = time.perf_counter()
+        self._log = open(self.log_path, "w")
+        self.process = subprocess.Popen(
+            self.argv, cwd=BACKEND_DIR, env=self.env, stdout=self._log, stderr=subprocess.STDOUT
+        )
+        deadline = started + timeout
+        while time.perf_counter() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"Server exited with {self.process.returncode} (see {self.log_path})")
+            try:
+                if httpx.get(f"{self.base_url}/health", timeout=2).status_code == 200:
+                    return round(time.perf_counter() - started, 2)
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.25)
+        self.stop()
+        raise RuntimeError(f"Server not healthy after {timeout:.0f}s (see {self.log_path})")
+
+    def memory(self) -> Dict[str, Optional[float]]:
+        return _memory_mb(self.process.pid) if self.process else {"rss_mb": None, "peak_rss_mb": None}
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process = None
+        if self._log:
+            self._log.close()
+            self._log = None
+
+
+class Server(_Subprocess):
+    """The API under uvicorn, on the embedded warehouse."""
+
+    def __init__(self, data_dir: str, env_overrides: Dict[str, str], cortex_url: Optional[str]):
+        env = {
+            **os.environ,
+            "SNOWFLAKE_LOCAL_BACKEND": "duckdb",
+            "LOCAL_DATA_DIR": data_dir,
+            # Offline: never reach an account or the SPCS session token
+            "SNOWFLAKE_HOST": "",
+            "CORTEX_AGENT_BASE_URL": cortex_url or "",
+            **env_overrides,
+        }
+        super().__init__(
+            [sys.executable, "-m", "uvicorn", "api.main:app", "--host", "127.0.0.1",
+             "--port", "{port}", "--log-level", "warning"],
+            env, os.path.join(data_dir, "server.log")
+        )
+
+
+class CortexStub(_Subprocess):
+    """The Cortex Agent stand-in (benchmarks.cortex_stub)."""
+
+    def __init__(self, args: argparse.Namespace):
+        argv = [
+            sys.executable, "-m", "benchmarks.cortex_stub", "--port", "{port}",
+            "--latency-ms", str(args.cortex_latency_ms),
+            "--token-rate", str(args.cortex_token_rate),
+            "--tokens", str(args.cortex_tokens),
+            "--tool-rows", str(args.cortex_tool_rows),
+        ]
+        if args.cortex_replay:
+            argv += ["--replay", os.path.abspath(args.cortex_replay)]
+        os.makedirs(args.data_root, exist_ok=True)
+        super().__init__(argv, dict(os.environ), os.path.join(args.data_root, "cortex_stub.log"))
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        try:
+            return httpx.get(f"{self.base_url}/stats", timeout=5).json()
+        except httpx.HTTPError:
+            return None
+
+
+async def _send(client: httpx.AsyncClient, method: str, path: str, rng: random.Random) -> int:
+    """One request, body fully read (SSE streams to their end); returns the status code."""
+    if method == "POST":
+        payload = {"message": rng.choice(CHAT_QUESTIONS)}
+        async with client.stream("POST", path, json=payload) as response:
+            async for _ in response.aiter_bytes():
+                pass
+            return response.status_code
+    response = await client.get(path)
+    return response.status_code
+
+
+async def drive(base_url: str, mix: Dict[str, float], concurrency: int, duration: Optional[float],
+                requests: Optional[int], warmup: int, seed: int) -> Dict[str, Any]:
+    """Run the traffic mix from `concurrency` clients; latencies per traffic class."""
+    classes = [name for name, weight in mix.items() if weight > 0]
+    weights = [mix[name] for name in classes]
+    samples: Dict[str, List[float]] = {name: [] for name in classes}
+    errors: Dict[str, int] = {name: 0 for name in classes}
+    issued = 0
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+        # Warm caches, pools and lazy indexes once per endpoint before measuring
+        for name in classes:
+            for method, path in TRAFFIC[name]:
+                for _ in range(warmup):
+                    await _send(client, method, path, random.Random(seed))
+
+        started = time.perf_counter()
+        deadline = started + duration if duration else None
+
+        async def worker(index: int):
+            nonlocal issued
+            rng = random.Random(seed * 1000 + index)
+            while True:
+                if requests is not None:
+                    if issued >= requests:
+                        return
+                    issued += 1
+                elif time.perf_counter() >= deadline:
+                    return
+                name = rng.choices(classes, weights)[0]
+                method, path = rng.choice(TRAFFIC[name])
+                sent = time.perf_counter()
+                try:
+                    status = await _send(client, method, path, rng)
+                except httpx.HTTPError:
+                    status = 0
+                if status == 200:
+                    samples[name].append((time.perf_counter() - sent) * 1000)
+                else:
+                    errors[name] += 1
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        wall_s = time.perf_counter() - started
+
+    def summarize(latencies: List[float], failed: int) -> Dict[str, Any]:
+        return {
+            "requests": len(latencies) + failed,
+            "errors": failed,
+            "throughput_rps": round(len(latencies) / wall_s, 2) if wall_s else 0.0,
+            "mean_ms": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "p50_ms": round(_percentile(latencies, 50), 1),
+            "p95_ms": round(_percentile(latencies, 95), 1),
+            "p99_ms": round(_percentile(latencies, 99), 1),
+            "max_ms": round(max(latencies), 1) if latencies else 0.0,
+        }
+
+    overall = [ms for name in classes for ms in samples[name]]
+    return {
+        "wall_s": round(wall_s, 2),
+        "overall": summarize(overall, sum(errors.values())),
+        "by_class": {name: summarize(samples[name], errors[name]) for name in classes},
+    }
+
+
+def run_scale(assets: int, args: argparse.Namespace, mix: Dict[str, float],
+              env_overrides: Dict[str, str], cortex: Optional[CortexStub]) -> Dict[str, Any]:
+    data_dir, generate_s = ensure_dataset(assets, args.data_root, args.seed, args.generator_workers)
+    server = Server(data_dir, env_overrides, cortex.base_url if cortex else None)
+    cortex_before = cortex.stats() if cortex else None
+    _log(f"Starting API on {server.base_url} ({assets:,} assets)...")
+    try:
+        startup_s = server.start(args.startup_timeout)
+        memory_loaded = server.memory()
+        _log(f"Ready in {startup_s}s, rss {memory_loaded['rss_mb']} MB; driving traffic...")
+        result = asyncio.run(drive(
+            server.base_url, mix, args.concurrency, None if args.requests else args.duration,
+            args.requests, args.warmup, args.seed
+        ))
+        memory_after = server.memory()
+    finally:
+        server.stop()
+    cortex_after = cortex.stats() if cortex else None
+
+    overall = result["overall"]
+    _log(f"{assets:,} assets: {overall['throughput_rps']} req/s, p50 {overall['p50_ms']}ms, "
+         f"p95 {overall['p95_ms']}ms, p99 {overall['p99_ms']}ms, errors {overall['errors']}")
+    return {
+        "assets": assets,
+        "data_dir": data_dir,
+        "generate_s": generate_s,
+        "startup_s": startup_s,
+        "memory": {
+            "loaded_rss_mb": memory_loaded["rss_mb"],
+            "final_rss_mb": memory_after["rss_mb"],
+            "peak_rss_mb": memory_after["peak_rss_mb"],
+        },
+        # Agent runs streamed by the stand-in, warmup included (other chat requests hit the semantic cache)
+        "cortex_runs": cortex_after["runs"] - cortex_before["runs"] if cortex_before and cortex_after else None,
+        **result,
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--assets", default="5000",
+                        help="Comma-separated dataset sizes in assets, e.g. 5000,100000,1000000")
+    parser.add_argument("--mix", default=DEFAULT_MIX,
+                        help=f"Traffic weights per class ({', '.join(TRAFFIC)})")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of measured traffic per scale")
+    parser.add_argument("--requests", type=int, default=None, help="Fixed request count instead of --duration")
+    parser.add_argument("--warmup", type=int, default=1, help="Unmeasured requests per endpoint before timing")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for data generation and the request sequence")
+    parser.add_argument("--data-root", default=DEFAULT_DATA_ROOT, help="Where generated datasets are kept")
+    parser.add_argument("--generator-workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for data generation")
+    parser.add_argument("--startup-timeout", type=float, default=900.0, help="Seconds to wait for /health")
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra server environment (repeatable), e.g. QUERY_CACHE_ENABLED=false")
+    parser.add_argument("--cortex", choices=["stub", "none"], default="stub",
+                        help="Agent behind /chat/stream: the local stand-in, or none (app fallback path)")
+    parser.add_argument("--cortex-latency-ms", type=float, default=300.0, help="Stand-in delay before the first event")
+    parser.add_argument("--cortex-token-rate", type=float, default=50.0,
+                        help="Stand-in tokens per second (0 = unpaced)")
+    parser.add_argument("--cortex-tokens", type=int, default=150, help="Stand-in answer tokens per run")
+    parser.add_argument("--cortex-tool-rows", type=int, default=25, help="Rows in the stand-in's tool_result")
+    parser.add_argument("--cortex-replay", help="Recorded agent SSE body for the stand-in to replay")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        mix = _parse_mix(args.mix)
+        scales = [int(float(value)) for value in args.assets.split(",")]
+        env_overrides = dict(item.split("=", 1) for item in args.env)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    report = {
+        "benchmark": "load_test",
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            "mix": mix,
+            "concurrency": args.concurrency,
+            "duration_s": None if args.requests else args.duration,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "env": env_overrides,
+            "cortex": None if args.cortex == "none" else {
+                "latency_ms": args.cortex_latency_ms,
+                "token_rate": args.cortex_token_rate,
+                "tokens": args.cortex_tokens,
+                "tool_rows": args.cortex_tool_rows,
+                "replay": args.cortex_replay,
+            },
+        },
+    }
+
+    cortex = CortexStub(args) if args.cortex == "stub" else None
+    try:
+        if cortex:
+            _log(f"Starting Cortex Agent stand-in on {cortex.base_url}...")
+            cortex.start(args.startup_timeout)
+        report["scales"] = [run_scale(assets, args, mix, env_overrides, cortex) for assets in scales]
+    finally:
+        if cortex:
+            cortex.stop()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        _log(f"Report written to {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main_cli()
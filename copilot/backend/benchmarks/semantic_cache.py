@@ -0,0 +1,98 @@
+"""
+VIGIL Risk Planning - Semantic Cache Matching Check
+
+Scores question pairs with the semantic cache's embed_question/similarity
+at the configured SEMANTIC_CACHE_THRESHOLD and reports every pair whose
+outcome is wrong:
+- "same" pairs are rewordings that must share one cached answer
+- "different" pairs select different rows (asset type, condition grade,
+  time window, region, tier, status...) and must never match, however
+  similar the rest of the wording is
+
+Exits non-zero when any pair is misjudged, so it can gate changes to the
+normalization rules. A recorded corpus can be supplied as a file of
+"same|different<TAB>question<TAB>question" lines.
+
+Usage (from copilot/backend):
+    python -m benchmarks.semantic_cache
+    python -m benchmarks.semantic_cache --input pairs.tsv --threshold 0.8
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.semantic_cache import SEMANTIC_CACHE_THRESHOLD, embed_question, similarity
+
+PAIRS: List[Tuple[str, str, str]] = [
+    # Rewordings
+    ("same", "show high risk assets in Tier 3", "which tier3 assets are high risk"),
+    ("same", "List overdue work orders in NorCal", "what are the overdue work orders in norcal?"),
+    ("same", "How many poles are in SoCal?", "poles in socal"),
+    ("same", "Show me critical vegetation encroachments", "critical vegetation encroachment"),
+    # Asset types
+    ("different",
+     "What is the average condition score and age of transformers in the norcal tier 3 region by circuit",
+     "What is the average condition score and age of poles in the norcal tier 3 region by circuit"),
+    ("different", "List conductors with clearance violations", "List switches with clearance violations"),
+    # Condition grades
+    ("different",
+     "Show cables in poor condition with water treeing risk in socal tier 2",
+     "Show cables in good condition with water treeing risk in socal tier 2"),
+    ("different", "Count fair condition poles in PNW", "Count poor condition poles in PNW"),
+    # Time windows
+    ("different",
+     "How many vegetation trims are scheduled on tier 3 circuits in socal this week",
+     "How many vegetation trims are scheduled on tier 3 circuits in socal this month"),
+    ("different", "Outages in the last day by region", "Outages in the last year by region"),
+    # Species
+    ("different", "Encroachments by eucalyptus near tier 3 lines", "Encroachments by oak near tier 3 lines"),
+    # Filters covered before
+    ("different", "show high risk assets in Tier 3", "show high risk assets in Tier 2"),
+    ("different", "show high risk assets in NorCal", "show low risk assets in NorCal"),
+    ("different", "List overdue work orders", "List completed work orders"),
+    ("different", "assets with vegetation encroachment", "assets without vegetation encroachment"),
+]
+
+
+def load_pairs(path: str) -> List[Tuple[str, str, str]]:
+    pairs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"):
+                expected, first, second = line.rstrip("\n").split("\t", 2)
+                pairs.append((expected, first, second))
+    return pairs
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", help="TSV of same|different<TAB>question<TAB>question lines")
+    parser.add_argument("--threshold", type=float, default=SEMANTIC_CACHE_THRESHOLD)
+    args = parser.parse_args()
+
+    pairs = load_pairs(args.input) if args.input else PAIRS
+    wrong = []
+    for expected, first, second in pairs:
+        score = similarity(embed_question(first), embed_question(second))
+        matched = score >= args.threshold
+        if matched != (expected == "same"):
+            wrong.append({"expected": expected, "score": round(score, 4), "questions": [first, second]})
+
+    print(json.dumps({
+        "scenario": "semantic_cache",
+        "threshold": args.threshold,
+        "pairs": len(pairs),
+        "correct": len(pairs) - len(wrong),
+        "wrong": wrong,
+    }, indent=2))
+    if wrong:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
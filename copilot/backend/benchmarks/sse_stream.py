@@ -0,0 +1,173 @@
+"""
+VIGIL Risk Planning - SSE Stream Parsing Benchmark
+
+Replays a Cortex Agent event stream through two parsers:
+- legacy:  aiter_text() chunks -> `buffer += chunk` / `buffer.split("\\n\\n", 1)`
+           -> per-event line split (the previous run_agent_stream behaviour)
+- decoder: aiter_bytes() chunks -> SSEDecoder.feed()
+
+Both feed the same CortexAgentClient._parse_sse_event, and the resulting
+event lists are checked for equality.
+
+Without --input, a synthetic stream shaped like a recorded agent response is
+generated: status / thinking / text deltas plus a response.tool_result whose
+SQL result set makes up most of the bytes (one ~MB data line).
+
+Usage (from copilot/backend):
+    python -m benchmarks.sse_stream --size-mb 5
+    python -m benchmarks.sse_stream --input recorded_stream.txt
+    python -m benchmarks.sse_stream --save /tmp/agent_stream.txt
+"""
+
+import argparse
+import codecs
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cortex_agent_client import CortexAgentClient
+from services.sse_decoder import SSEDecoder, SSEEvent
+
+
+def _sse(event: str, payload: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+def synthetic_stream(size_mb: float, seed: int = 7) -> bytes:
+    """Agent-shaped SSE body of roughly size_mb megabytes."""
+    rng = random.Random(seed)
+    parts: List[str] = []
+    for status in ("planning", "reasoning_agent_start", "streaming_analyst_results"):
+        parts.append(_sse("response.status", {"status": status, "message": status}))
+    for i in range(200):
+        parts.append(_sse("response.thinking.delta", {"text": f"Checking circuit {i} clearance history. "}))
+
+    row_bytes = 0
+    rows = []
+    target = int(size_mb * 1024 * 1024 * 0.9)
+    while row_bytes < target:
+        row = [
+            f"AST-{len(rows):06d}",
+            rng.choice(["POLE", "TRANSFORMER", "UG_CABLE"]),
+            round(rng.random(), 2),
+            round(rng.uniform(0, 100), 2),
+            rng.choice(["LOW", "MEDIUM", "HIGH", "CRITICAL"]),
+            rng.choice(["NorCal – Sierra foothills", "SoCal – Santa Ana corridor", "PNW"]),
+        ]
+        row_bytes += len(json.dumps(row, ensure_ascii=False)) + 2
+        rows.append(row)
+    parts.append(_sse("response.tool_result", {"content": [{"json": {
+        "sql": "SELECT ASSET_ID, ASSET_TYPE, CONDITION_SCORE, COMPOSITE_RISK_SCORE, RISK_TIER, REGION FROM ...",
+        "data": rows,
+    }}]}))
+
+    chunks = ["".join(parts).encode("utf-8")]
+    size = len(chunks[0])
+    while size < size_mb * 1024 * 1024:
+        word = rng.choice(["Circuit ", "HFTD ", "Tier 3 ", "trim ", "overdue. "])
+        chunks.append(_sse("response.output_text.delta", {"text": word}).encode("utf-8"))
+        size += len(chunks[-1])
+    chunks.append(_sse("response.done", {}).encode("utf-8"))
+    return b"".join(chunks)
+
+
+def network_chunks(body: bytes, seed: int = 11) -> List[bytes]:
+    """Split a body into 1-16 KiB chunks, as the socket would deliver it."""
+    rng = random.Random(seed)
+    chunks, pos = [], 0
+    while pos < len(body):
+        size = rng.randint(1024, 16384)
+        chunks.append(body[pos:pos + size])
+        pos += size
+    return chunks
+
+
+def legacy_events(chunks: List[bytes]) -> Iterator[SSEEvent]:
+    """The previous text-buffer framing, including its per-event line split."""
+    def to_event(event_str: str) -> Optional[SSEEvent]:
+        event_type, data = None, None
+        for line in event_str.strip().split("\n"):
+            if line.startswith("event:"):
+                event_type = line[6:].strip()
+            elif line.startswith("data:"):
+                data = line[5:].strip()
+        return SSEEvent(event_type, data) if data is not None else None
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    for raw in chunks:
+        buffer += decoder.decode(raw)
+        while "\n\n" in buffer:
+            event_str, buffer = buffer.split("\n\n", 1)
+            event = to_event(event_str)
+            if event:
+                yield event
+    if buffer.strip():
+        event = to_event(buffer)
+        if event:
+            yield event
+
+
+def decoder_events(chunks: List[bytes]) -> Iterator[SSEEvent]:
+    decoder = SSEDecoder()
+    for raw in chunks:
+        yield from decoder.feed(raw)
+    yield from decoder.flush()
+
+
+def _run(parser, chunks: List[bytes], client: CortexAgentClient, repeat: int):
+    best_frame, best_total, parsed = float("inf"), float("inf"), []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        events = list(parser(chunks))
+        framed = time.perf_counter()
+        parsed = [client._parse_sse_event(event) for event in events]
+        done = time.perf_counter()
+        best_frame = min(best_frame, framed - started)
+        best_total = min(best_total, done - started)
+    return parsed, round(best_frame * 1000, 1), round(best_total * 1000, 1)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=5.0)
+    parser.add_argument("--input", help="Recorded SSE body to replay instead of the synthetic stream")
+    parser.add_argument("--save", help="Write the synthetic stream to this path and exit")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.input:
+        with open(args.input, "rb") as f:
+            body = f.read()
+    else:
+        body = synthetic_stream(args.size_mb)
+    if args.save:
+        with open(args.save, "wb") as f:
+            f.write(body)
+        print(f"wrote {len(body)} bytes to {args.save}")
+        return
+
+    chunks = network_chunks(body)
+    client = CortexAgentClient()
+    legacy, legacy_frame, legacy_total = _run(legacy_events, chunks, client, args.repeat)
+    decoded, decoder_frame, decoder_total = _run(decoder_events, chunks, client, args.repeat)
+
+    print(json.dumps({
+        "scenario": "cortex_agent_sse",
+        "bytes": len(body),
+        "chunks": len(chunks),
+        "events": len(decoded),
+        "identical_events": legacy == decoded,
+        "legacy": {"framing_ms": legacy_frame, "total_ms": legacy_total},
+        "decoder": {"framing_ms": decoder_frame, "total_ms": decoder_total},
+        "decoder_mb_per_s": round(len(body) / 1024 / 1024 / (decoder_total / 1000), 1),
+    }))
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,70 @@
+"""
+VIGIL Risk Planning - Columnar Result Conversion
+
+Turns Arrow tables fetched from Snowflake into the same list-of-dicts shape
+the row path produces, with the per-value work done column-at-a-time in
+Arrow compute instead of a Python loop over every field:
+
+- DATE / TIMESTAMP / TIME columns become ISO-8601 strings
+  (matching datetime.isoformat(): no ".000000", "+HH:MM" offsets)
+- NUMBER(p, s>0) decimals become float64
+- NUMBER(p, 0) decimals (counts, IDs, integer sums) become int64, as the
+  connector returns int for them on the row path; values beyond int64 fall
+  back to float64
+"""
+
+from typing import Any, Dict, List
+
+
+def _iso_strings(column):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    col_type = column.type
+    if pa.types.is_date(col_type):
+        return pc.cast(column, pa.string())
+    if pa.types.is_time(col_type):
+        return pc.replace_substring_regex(pc.cast(column, pa.string()), r"\.0+$", "")
+    # Timestamps: normalize to microseconds so output matches isoformat()
+    column = pc.cast(column, pa.timestamp("us", tz=col_type.tz), safe=False)
+    if col_type.tz is None:
+        text = pc.strftime(column, format="%Y-%m-%dT%H:%M:%S")
+        return pc.replace_substring_regex(text, r"\.0+$", "")
+    text = pc.strftime(column, format="%Y-%m-%dT%H:%M:%S%z")
+    text = pc.replace_substring_regex(text, r"\.0+([+-]\d\d)(\d\d)$", r"\1:\2")
+    return pc.replace_substring_regex(text, r"([+-]\d\d)(\d\d)$", r"\1:\2")
+
+
+def _decimal_numbers(column):
+    import pyarrow as pa
+
+    if column.type.scale == 0:
+        try:
+            return column.cast(pa.int64())
+        except pa.ArrowInvalid:
+            pass
+    # Via text: a direct decimal->float64 cast is not correctly rounded
+    # (0.57 would come out as 0.5700000000000001)
+    return column.cast(pa.string()).cast(pa.float64())
+
+
+def normalize_arrow_table(table):
+    """Return a table whose columns are all JSON-native Arrow types."""
+    import pyarrow as pa
+
+    columns = []
+    for column in table.columns:
+        col_type = column.type
+        if pa.types.is_temporal(col_type) and not pa.types.is_duration(col_type):
+            column = _iso_strings(column)
+        elif pa.types.is_decimal(col_type):
+            column = _decimal_numbers(column)
+        columns.append(column)
+    return pa.Table.from_arrays(columns, names=table.column_names)
+
+
+def arrow_to_records(table) -> List[Dict[str, Any]]:
+    """Arrow table -> list of row dicts, with temporals/decimals converted in bulk."""
+    if table is None or table.num_rows == 0:
+        return []
+    return normalize_arrow_table(table).to_pylist()
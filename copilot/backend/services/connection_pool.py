@@ -0,0 +1,291 @@
+"""
+VIGIL Risk Planning - Snowflake Connection Pool
+
+Bounded pool of Snowflake connector connections so N concurrent requests can
+run N queries in parallel instead of serializing through a single session.
+
+- min/max size with lazy growth up to max_size
+- idle timeout: connections unused for longer are closed on the next acquire
+- health check: idle connections older than the check interval are probed
+  with SELECT 1 before being handed out
+- recycle(): bumps the pool generation so every connection opened with an
+  old (expired) OAuth token is closed instead of reused
+- dedicated(): a connection from the same factory that never counts against
+  max_size, for long-lived holders such as streaming exports
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no connection becomes available within the acquire timeout."""
+
+
+class _PooledConnection:
+    """A connector connection plus the bookkeeping the pool needs."""
+
+    __slots__ = ("conn", "generation", "created_at", "last_used", "needs_check")
+
+    def __init__(self, conn: Any, generation: int):
+        self.conn = conn
+        self.generation = generation
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.needs_check = False
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    `factory` opens a new connection; it is called outside the pool lock so a
+    slow login never blocks other threads from returning connections.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        min_size: int = 1,
+        max_size: int = 8,
+        idle_timeout: float = 300.0,
+        health_check_interval: float = 60.0,
+        acquire_timeout: float = 30.0
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self._factory = factory
+        self.min_size = max(0, min(min_size, max_size))
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.acquire_timeout = acquire_timeout
+
+        self._idle: Deque[_PooledConnection] = deque()
+        self._size = 0
+        self._generation = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        self._created = 0
+        self._recycled = 0
+        self._health_check_failures = 0
+        self._waits = 0
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def prefill(self):
+        """Open min_size connections up front so the first requests skip login."""
+        opened = []
+        try:
+            for _ in range(self.min_size):
+                opened.append(self._open(self._generation))
+        finally:
+            with self._cond:
+                for pooled in opened:
+                    self._idle.append(pooled)
+                self._size += len(opened)
+                self._cond.notify_all()
+
+    def recycle(self):
+        """
+        Retire every existing connection.
+
+        Idle connections are closed now; connections currently in use are
+        closed when they are released. New acquires open fresh connections,
+        which picks up a refreshed token.
+        """
+        with self._cond:
+            self._generation += 1
+            stale = list(self._idle)
+            self._idle.clear()
+            self._size -= len(stale)
+            self._recycled += len(stale)
+            self._cond.notify_all()
+        for pooled in stale:
+            self._close_quietly(pooled)
+        logger.info(f"Connection pool recycled (generation {self._generation})")
+
+    def close(self):
+        """Close all idle connections and refuse further acquires."""
+        with self._cond:
+            self._closed = True
+            stale = list(self._idle)
+            self._idle.clear()
+            self._size -= len(stale)
+            self._cond.notify_all()
+        for pooled in stale:
+            self._close_quietly(pooled)
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the duration of the with-block."""
+        pooled = self._acquire()
+        failed = False
+        try:
+            yield pooled.conn
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._release(pooled, failed)
+
+    @contextmanager
+    def dedicated(self) -> Iterator[Any]:
+        """
+        Open a connection outside the pool for the duration of the with-block.
+        
+        A slow client holding it for minutes cannot starve pooled request
+        traffic into PoolTimeoutError; it is closed, not returned, on exit.
+        """
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+        conn = self._factory()
+        with self._cond:
+            self._created += 1
+        try:
+            yield conn
+        finally:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _acquire(self) -> _PooledConnection:
+        deadline = time.monotonic() + self.acquire_timeout
+        while True:
+            to_close = []
+            candidate: Optional[_PooledConnection] = None
+            open_generation: Optional[int] = None
+
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+
+                    # Idle connections are reused LIFO, so the left end holds
+                    # the longest-idle ones: retire those past idle_timeout
+                    # (down to min_size) before taking the freshest.
+                    now = time.monotonic()
+                    while (self._idle and self._size > self.min_size
+                           and now - self._idle[0].last_used > self.idle_timeout):
+                        self._size -= 1
+                        to_close.append(self._idle.popleft())
+                    if self._idle:
+                        candidate = self._idle.pop()
+                        break
+
+                    if self._size < self.max_size:
+                        self._size += 1
+                        open_generation = self._generation
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeoutError(
+                            f"No Snowflake connection available within {self.acquire_timeout:.0f}s "
+                            f"(max_size={self.max_size})"
+                        )
+                    self._waits += 1
+                    self._cond.wait(remaining)
+
+            for pooled in to_close:
+                self._close_quietly(pooled)
+
+            if open_generation is not None:
+                try:
+                    return self._open(open_generation)
+                except Exception:
+                    with self._cond:
+                        self._size -= 1
+                        self._cond.notify()
+                    raise
+
+            if self._healthy(candidate):
+                return candidate
+
+            with self._cond:
+                self._size -= 1
+                self._health_check_failures += 1
+                self._cond.notify()
+            self._close_quietly(candidate)
+
+    def _release(self, pooled: _PooledConnection, failed: bool = False):
+        pooled.last_used = time.monotonic()
+        pooled.needs_check = pooled.needs_check or failed
+        with self._cond:
+            if self._closed or pooled.generation != self._generation:
+                self._size -= 1
+                self._recycled += 1
+                discard = True
+            else:
+                self._idle.append(pooled)
+                discard = False
+            self._cond.notify()
+        if discard:
+            self._close_quietly(pooled)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _open(self, generation: int) -> _PooledConnection:
+        conn = self._factory()
+        with self._cond:
+            self._created += 1
+        return _PooledConnection(conn, generation)
+
+    def _healthy(self, pooled: _PooledConnection) -> bool:
+        """Probe connections that failed last time or sat idle past the check interval."""
+        is_closed = getattr(pooled.conn, "is_closed", None)
+        if callable(is_closed) and is_closed():
+            return False
+        if not pooled.needs_check and time.monotonic() - pooled.last_used < self.health_check_interval:
+            return True
+        try:
+            cursor = pooled.conn.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchone()
+            finally:
+                cursor.close()
+            pooled.needs_check = False
+            return True
+        except Exception as e:
+            logger.warning(f"Pooled connection failed health check: {e}")
+            return False
+
+    @staticmethod
+    def _close_quietly(pooled: _PooledConnection):
+        try:
+            pooled.conn.close()
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool counters for monitoring and tuning."""
+        with self._cond:
+            return {
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._size - len(self._idle),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "generation": self._generation,
+                "created": self._created,
+                "recycled": self._recycled,
+                "health_check_failures": self._health_check_failures,
+                "waits": self._waits,
+            }
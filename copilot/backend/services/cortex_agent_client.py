@@ -7,16 +7,96 @@ including "thinking steps" back to the frontend via SSE.
 Also provides access to:
 - Cortex Analyst for semantic SQL generation
 - Cortex Search for document retrieval (GO95 regulations)
+
+Requests share one app-scoped httpx.AsyncClient (HTTP/2 when the h2 package
+is installed) so chat messages reuse the pooled TLS connection to the
+Snowflake REST host instead of reconnecting per message.
 """
 
 import os
 import json
 import logging
+import time
+import importlib.util
+from collections import deque
 import httpx
 from typing import AsyncGenerator, Optional, Dict, Any, List
 
+from .sse_decoder import SSEDecoder, SSEEvent
+from .token_provider import get_token_provider
+from .semantic_cache import get_semantic_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# HTTP client pool configuration
+CORTEX_HTTP2 = os.getenv("CORTEX_HTTP2", "true").lower() == "true"
+CORTEX_HTTP_MAX_CONNECTIONS = int(os.getenv("CORTEX_HTTP_MAX_CONNECTIONS", "20"))
+CORTEX_HTTP_MAX_KEEPALIVE = int(os.getenv("CORTEX_HTTP_MAX_KEEPALIVE", "10"))
+CORTEX_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("CORTEX_HTTP_KEEPALIVE_EXPIRY", "120"))
+CORTEX_HTTP_CONNECT_TIMEOUT = float(os.getenv("CORTEX_HTTP_CONNECT_TIMEOUT", "10"))
+CORTEX_HTTP_READ_TIMEOUT = float(os.getenv("CORTEX_HTTP_READ_TIMEOUT", "120"))
+
+# Send agent requests here instead of https://SNOWFLAKE_HOST, e.g. the local
+# stand-in from benchmarks/cortex_stub.py (http://127.0.0.1:8700)
+CORTEX_AGENT_BASE_URL = os.getenv("CORTEX_AGENT_BASE_URL", "").rstrip("/")
+
+# Recent per-request timings kept for http_stats()
+_TIMING_WINDOW = 200
+
+
+class _RequestTimer:
+    """
+    Splits one streamed request into connect / first byte / first token.
+
+    Connect time comes from httpcore's trace hook, so it is 0 when the
+    request rides an already-open pooled connection.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._connect_started: Optional[float] = None
+        self.connect_ms = 0.0
+        self.new_connection = False
+        self.ttfb_ms: Optional[float] = None
+        self.ttft_ms: Optional[float] = None
+        self.http_version: Optional[str] = None
+        self.recorded: Optional[Dict[str, Any]] = None
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+    async def trace(self, event_name: str, info: Dict[str, Any]):
+        if event_name == "connection.connect_tcp.started":
+            self._connect_started = time.perf_counter()
+            self.new_connection = True
+        elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            if self._connect_started is not None:
+                self.connect_ms = round((time.perf_counter() - self._connect_started) * 1000, 1)
+
+    def headers_received(self, response: httpx.Response):
+        self.ttfb_ms = self._elapsed_ms()
+        self.http_version = response.http_version
+
+    def token_received(self):
+        if self.ttft_ms is None:
+            self.ttft_ms = self._elapsed_ms()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "connect_ms": self.connect_ms,
+            "new_connection": self.new_connection,
+            "ttfb_ms": self.ttfb_ms,
+            "ttft_ms": self.ttft_ms,
+            "total_ms": self._elapsed_ms(),
+            "http_version": self.http_version,
+        }
+
 
 class CortexAgentClient:
     """
@@ -32,7 +112,10 @@ class CortexAgentClient:
         self.schema = os.environ.get("SNOWFLAKE_SCHEMA", "CONSTRUCTION_RISK")
         self.agent_name = os.environ.get("CORTEX_AGENT_NAME", "VIGIL_RISK_AGENT")
         self.host = os.environ.get("SNOWFLAKE_HOST", "")
+        self.base_url = CORTEX_AGENT_BASE_URL
         self._token = None
+        self._http: Optional[httpx.AsyncClient] = None
+        self._timings: deque = deque(maxlen=_TIMING_WINDOW)
         
         self.SEARCH_SERVICES = {
             "go95": f"{self.database}.DOCS.GO95_SEARCH_SERVICE",
@@ -43,16 +126,84 @@ class CortexAgentClient:
         
         logger.info(f"CortexAgentClient initialized: db={self.database}, schema={self.schema}, agent={self.agent_name}")
     
+    # ------------------------------------------------------------------
+    # HTTP client lifecycle
+    # ------------------------------------------------------------------
+    
+    async def start(self):
+        """Open the shared HTTP client (called from the FastAPI lifespan)."""
+        self._get_http()
+    
+    async def aclose(self):
+        """Close the shared HTTP client and its pooled connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            logger.info("Cortex HTTP client closed")
+    
+    def _get_http(self) -> httpx.AsyncClient:
+        """Shared keep-alive client; created on first use if start() was not called."""
+        if self._http is None or self._http.is_closed:
+            http2 = CORTEX_HTTP2 and importlib.util.find_spec("h2") is not None
+            if CORTEX_HTTP2 and not http2:
+                logger.warning("h2 package not installed - Cortex HTTP client using HTTP/1.1")
+            self._http = httpx.AsyncClient(
+                http2=http2,
+                timeout=httpx.Timeout(CORTEX_HTTP_READ_TIMEOUT, connect=CORTEX_HTTP_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=CORTEX_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=CORTEX_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=CORTEX_HTTP_KEEPALIVE_EXPIRY
+                )
+            )
+            print(f"[CORTEX] HTTP client opened (http2={http2}, max_connections={CORTEX_HTTP_MAX_CONNECTIONS})", flush=True)
+        return self._http
+    
+    def _record_timing(self, timer: _RequestTimer) -> Dict[str, Any]:
+        if timer.recorded is not None:
+            return timer.recorded
+        timing = timer.recorded = timer.summary()
+        self._timings.append(timing)
+        print(
+            f"[CORTEX] connect={timing['connect_ms']}ms ttfb={timing['ttfb_ms']}ms "
+            f"ttft={timing['ttft_ms']}ms total={timing['total_ms']}ms "
+            f"new_connection={timing['new_connection']} {timing['http_version']}",
+            flush=True
+        )
+        return timing
+    
+    def http_stats(self) -> Dict[str, Any]:
+        """Connection reuse and latency split over recent agent requests."""
+        timings = list(self._timings)
+        
+        def _median(values):
+            values = sorted(v for v in values if v is not None)
+            return values[len(values) // 2] if values else None
+        
+        new_connections = [t for t in timings if t["new_connection"]]
+        return {
+            "open": self._http is not None and not self._http.is_closed,
+            "requests": len(timings),
+            "new_connections": len(new_connections),
+            "median_connect_ms": _median(t["connect_ms"] for t in new_connections),
+            "median_ttfb_ms": _median(t["ttfb_ms"] for t in timings),
+            "median_ttft_ms": _median(t["ttft_ms"] for t in timings),
+        }
+    
     def _get_token(self) -> str:
-        """Get OAuth token from SPCS session file."""
-        token_path = "/snowflake/session/token"
-        if os.path.exists(token_path):
-            with open(token_path, "r") as f:
-                return f.read().strip()
+        """Get OAuth token from SPCS session file (cached until the file changes)."""
+        token = get_token_provider().get_token()
+        if token:
+            return token
+        if self.base_url:
+            # Local stand-ins accept any bearer token
+            return "local"
         raise RuntimeError("No SPCS token available - not running in SPCS?")
     
     def _get_base_url(self) -> str:
-        """Get the Snowflake REST API base URL."""
+        """Get the Snowflake REST API base URL (CORTEX_AGENT_BASE_URL overrides the host)."""
+        if self.base_url:
+            return self.base_url
         if not self.host:
             raise RuntimeError("SNOWFLAKE_HOST environment variable not set")
         return f"https://{self.host}"
@@ -88,7 +239,8 @@ class CortexAgentClient:
     async def run_agent_stream(
         self,
         messages: List[Dict[str, str]],
-        conversation_id: Optional[str] = None
+        conversation_id: Optional[str] = None,
+        data_version: Optional[int] = None
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """
         Call the Cortex Agent REST API with streaming enabled.
@@ -98,9 +250,51 @@ class CortexAgentClient:
         - type: "text" - Response text chunks
         - type: "tool_use" - SQL execution info
         - type: "chart" - Vega-Lite chart spec
-        - type: "done" - Stream complete
+        - type: "done" - Stream complete (with connect/TTFT "timing")
         - type: "error" - Error occurred
+        
+        When data_version is given, single-question runs go through the
+        semantic response cache: a similar question already answered against
+        the same data version is replayed from memory, and its "done" event
+        carries cached=True and the match similarity.
         """
+        cache = get_semantic_cache()
+        question = messages[-1]["content"] if len(messages) == 1 and not conversation_id else None
+        if data_version is None or question is None or not cache.enabled:
+            async for event in self._stream_agent(messages, conversation_id):
+                yield event
+            return
+        
+        hit = cache.lookup("agent", question, data_version)
+        if hit:
+            events, score = hit
+            logger.info(f"Semantic cache hit (similarity={score}) for: {question[:80]}")
+            for event in events:
+                yield dict(event)
+            yield {"type": "done", "cached": True, "similarity": score}
+            return
+        
+        recorded: List[Dict[str, Any]] = []
+        failed = stored = False
+        async for event in self._stream_agent(messages, conversation_id):
+            event_type = event.get("type")
+            if event_type == "error":
+                failed = True
+            elif event_type != "done":
+                recorded.append(event)
+            elif not (failed or stored) and any(e.get("type") == "text" for e in recorded):
+                # Store before yielding "done": consumers stop reading there
+                cache.store("agent", question, data_version, recorded)
+                stored = True
+            yield event
+    
+    async def _stream_agent(
+        self,
+        messages: List[Dict[str, str]],
+        conversation_id: Optional[str] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Uncached agent run: POST :run and decode the SSE response."""
+        timer = _RequestTimer()
         try:
             token = self._get_token()
             url = self._get_agent_url()
@@ -125,40 +319,49 @@ class CortexAgentClient:
             logger.info(f"Calling Cortex Agent: {url}")
             logger.debug(f"Request body: {json.dumps(body)[:200]}")
             
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                async with client.stream(
-                    "POST",
-                    url,
-                    headers=headers,
-                    json=body,
-                ) as response:
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        logger.error(f"Agent API error: {response.status_code} - {error_text}")
-                        yield {
-                            "type": "error",
-                            "content": f"Agent API error: {response.status_code}",
-                            "details": error_text.decode() if error_text else ""
-                        }
-                        return
-                    
-                    buffer = ""
-                    async for chunk in response.aiter_text():
-                        buffer += chunk
-                        
-                        while "\n\n" in buffer:
-                            event_str, buffer = buffer.split("\n\n", 1)
-                            
-                            event = self._parse_sse_event(event_str)
-                            if event:
-                                yield event
-                    
-                    if buffer.strip():
-                        event = self._parse_sse_event(buffer)
+            client = self._get_http()
+            async with client.stream(
+                "POST",
+                url,
+                headers=headers,
+                json=body,
+                extensions={"trace": timer.trace},
+            ) as response:
+                timer.headers_received(response)
+                if response.status_code != 200:
+                    if response.status_code == 401:
+                        # Stale token: re-read the session file on the next call
+                        get_token_provider().invalidate()
+                    error_text = await response.aread()
+                    logger.error(f"Agent API error: {response.status_code} - {error_text}")
+                    yield {
+                        "type": "error",
+                        "content": f"Agent API error: {response.status_code}",
+                        "details": error_text.decode() if error_text else ""
+                    }
+                    return
+                
+                decoder = SSEDecoder()
+                async for chunk in response.aiter_bytes():
+                    for sse in decoder.feed(chunk):
+                        event = self._parse_sse_event(sse)
                         if event:
+                            if event["type"] == "text":
+                                timer.token_received()
+                            elif event["type"] == "done":
+                                event["timing"] = self._record_timing(timer)
                             yield event
+                
+                for sse in decoder.flush():
+                    event = self._parse_sse_event(sse)
+                    if event:
+                        if event["type"] == "text":
+                            timer.token_received()
+                        elif event["type"] == "done":
+                            event["timing"] = self._record_timing(timer)
+                        yield event
             
-            yield {"type": "done"}
+            yield {"type": "done", "timing": self._record_timing(timer)}
             
         except Exception as e:
             logger.error(f"Cortex Agent stream error: {e}")
@@ -167,9 +370,9 @@ class CortexAgentClient:
                 "content": str(e)
             }
     
-    def _parse_sse_event(self, event_str: str) -> Optional[Dict[str, Any]]:
+    def _parse_sse_event(self, sse: SSEEvent) -> Optional[Dict[str, Any]]:
         """
-        Parse an SSE event string from Cortex Agent API.
+        Convert a decoded SSE event from Cortex Agent API into a stream event.
         
         Event types from Cortex Agent:
         - response.output_text.delta - ACTUAL OUTPUT TEXT (display to user)
@@ -179,24 +382,14 @@ class CortexAgentClient:
         - response.chart - Vega-Lite chart specification
         """
         try:
-            lines = event_str.strip().split("\n")
-            event_type = None
-            data = None
-            
-            for line in lines:
-                if line.startswith("event:"):
-                    event_type = line[6:].strip()
-                elif line.startswith("data:"):
-                    data_str = line[5:].strip()
-                    if data_str == "[DONE]":
-                        return {"type": "done"}
-                    try:
-                        data = json.loads(data_str)
-                    except json.JSONDecodeError:
-                        data = {"raw": data_str}
-            
-            if data is None:
-                return None
+            event_type = sse.event.strip() if sse.event else None
+            data_str = sse.data.strip()
+            if data_str == "[DONE]":
+                return {"type": "done"}
+            try:
+                data = _json_loads(data_str)
+            except ValueError:
+                data = {"raw": data_str}
             
             logger.debug(f"SSE: type={event_type}")
             
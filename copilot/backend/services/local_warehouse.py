@@ -0,0 +1,510 @@
+"""
+VIGIL Risk Planning - Embedded Local Warehouse
+
+DuckDB stand-in for the Snowflake warehouse, for CI, load tests and
+air-gapped laptops. It loads the parquet written by
+scripts/generate_synthetic_data.py into an in-memory database laid out like
+the deployed one, so the service's SQL runs unchanged:
+
+- RISK_PLANNING_DB.ATOMIC: ASSET, LOCATION, CIRCUIT, VEGETATION_ENCROACHMENT,
+  RISK_ASSESSMENT, WORK_ORDER (setup/sql column names, mapped from the
+  generator's columns) and an AMI_READING view over the readings parquet
+- RISK_PLANNING_DB.ML: the notebook prediction tables and
+  COMBINED_RISK_SUMMARY, derived with the notebooks' rule-based fallbacks
+
+Connections are DuckDB cursors behind a small DB-API facade with the Snowflake
+connector's surface (upper-case column names, fetch_arrow_all, rowcount), so
+they plug into ConnectionPool like connector connections. Both generator
+layouts are read: <table>.parquet files and <table>/ partitioned datasets.
+"""
+
+import logging
+import os
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Directory holding the generator's output (its default --output-dir)
+LOCAL_DATA_DIR = os.getenv(
+    "LOCAL_DATA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "data", "synthetic")
+)
+
+# Snowflake functions the service calls that DuckDB spells differently
+_COMPAT_MACROS = [
+    "CREATE MACRO current_timestamp() AS CAST(get_current_timestamp() AS TIMESTAMP)",
+]
+
+_DML = re.compile(r"^\s*(INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+# ATOMIC tables: setup/sql/02_create_tables.sql columns (plus the few extra
+# columns direct_sql_query reads) selected from the generator's tables.
+# {name} placeholders are parquet sources, {db}/{schema} the target schema.
+ATOMIC_TABLES = {
+    "LOCATION": """
+        SELECT
+            l.LOCATION_ID,
+            l.REGION,
+            l.COUNTY,
+            l.ZONE_NAME AS CITY,
+            CAST(NULL AS VARCHAR) AS ZIP_CODE,
+            l.CENTER_LATITUDE AS LATITUDE,
+            l.CENTER_LONGITUDE AS LONGITUDE,
+            e.ELEVATION_FT,
+            l.TERRAIN_TYPE,
+            l.ZONE_TYPE AS LAND_USE
+        FROM {locations} l
+        LEFT JOIN (
+            SELECT LOCATION_ID, ROUND(AVG(ELEVATION_FT), 1) AS ELEVATION_FT
+            FROM {assets} GROUP BY LOCATION_ID
+        ) e ON l.LOCATION_ID = e.LOCATION_ID
+    """,
+    "CIRCUIT": """
+        SELECT
+            CIRCUIT_ID,
+            CIRCUIT_NAME,
+            VOLTAGE_CLASS,
+            FIRE_THREAT_TIER AS FIRE_THREAT_DISTRICT,
+            LOCATION_ID AS PRIMARY_LOCATION_ID,
+            CUSTOMER_COUNT AS TOTAL_CUSTOMERS,
+            CAST(CUSTOMER_COUNT // 500 AS INTEGER) AS CRITICAL_FACILITIES,
+            CAST(CUSTOMER_COUNT * 3 // 100 AS INTEGER) AS MEDICAL_BASELINE_CUSTOMERS,
+            TOTAL_MILES AS CIRCUIT_MILES,
+            SUBSTATION_NAME,
+            FIRE_THREAT_TIER IN ('TIER_2', 'TIER_3') AS PSPS_ELIGIBLE
+        FROM {circuits}
+    """,
+    "ASSET": """
+        SELECT
+            a.ASSET_ID,
+            a.CIRCUIT_ID,
+            a.LOCATION_ID,
+            a.ASSET_TYPE,
+            a.ASSET_SUBTYPE,
+            COALESCE(a.INSULATION_TYPE, a.ASSET_SUBTYPE) AS MATERIAL,
+            a.MANUFACTURER,
+            a.MODEL AS MODEL_NUMBER,
+            a.VOLTAGE_CLASS,
+            a.INSTALL_DATE AS INSTALLATION_DATE,
+            CAST(a.AGE_YEARS AS DOUBLE) AS ASSET_AGE_YEARS,
+            -- Inspection grade 1 (worst) - 5 (best) on the warehouse's 0-1 scale
+            (a.CONDITION_SCORE - 1) / 4.0 AS CONDITION_SCORE,
+            a.LAST_INSPECTION_DATE,
+            CAST(a.LAST_INSPECTION_DATE + INTERVAL 12 MONTH AS DATE) AS NEXT_INSPECTION_DUE,
+            12 AS INSPECTION_CYCLE_MONTHS,
+            CASE a.ASSET_TYPE
+                WHEN 'CABLE_UNDERGROUND' THEN 90000.0
+                WHEN 'TRANSFORMER' THEN 25000.0
+                WHEN 'SWITCH' THEN 15000.0
+                WHEN 'POLE' THEN 12000.0
+                ELSE 8000.0
+            END AS REPLACEMENT_COST,
+            a.MOISTURE_EXPOSURE,
+            CASE
+                WHEN l.AVG_WIND_SPEED_MPH >= 18 THEN 'HIGH'
+                WHEN l.AVG_WIND_SPEED_MPH >= 10 THEN 'MEDIUM'
+                ELSE 'LOW'
+            END AS WIND_EXPOSURE
+        FROM {assets} a
+        LEFT JOIN {locations} l ON a.LOCATION_ID = l.LOCATION_ID
+    """,
+    "VEGETATION_ENCROACHMENT": """
+        SELECT
+            ENCROACHMENT_ID,
+            ASSET_ID,
+            TREE_SPECIES AS SPECIES,
+            DISTANCE_TO_CONDUCTOR_FT AS CURRENT_CLEARANCE_FT,
+            REQUIRED_CLEARANCE_FT,
+            REQUIRED_CLEARANCE_FT - DISTANCE_TO_CONDUCTOR_FT AS CLEARANCE_DEFICIT_FT,
+            GROWTH_RATE_ANNUAL_FT AS GROWTH_RATE_FT_YEAR,
+            DAYS_TO_CRITICAL AS DAYS_TO_CONTACT,
+            TREE_HEIGHT_FT,
+            TREE_HEIGHT_FT AS HEIGHT_FT,
+            TREE_HEALTH,
+            CASE CLEARANCE_STATUS
+                WHEN 'CRITICAL' THEN 'CRITICAL'
+                WHEN 'VIOLATION' THEN 'HIGH'
+                WHEN 'MARGINAL' THEN 'MEDIUM'
+                ELSE 'LOW'
+            END AS TRIM_PRIORITY,
+            CASE
+                WHEN CLEARANCE_STATUS IN ('CRITICAL', 'VIOLATION') THEN 'VIOLATION'
+                WHEN CLEARANCE_STATUS = 'MARGINAL' THEN 'WARNING'
+                ELSE 'COMPLIANT'
+            END AS COMPLIANCE_STATUS,
+            DAYS_TO_CRITICAL AS DAYS_UNTIL_VIOLATION,
+            STRIKE_POTENTIAL,
+            ROUND(250 + TREE_HEIGHT_FT * 15, 2) AS ESTIMATED_TRIM_COST,
+            MEASUREMENT_DATE AS SURVEY_DATE
+        FROM {vegetation}
+    """,
+    "RISK_ASSESSMENT": """
+        SELECT
+            ASSESSMENT_ID,
+            ASSET_ID,
+            ASSESSMENT_DATE,
+            LEAST(GREATEST(IGNITION_RISK, 0), 100) AS FIRE_RISK_SCORE,
+            LEAST(GREATEST(IGNITION_RISK, 0), 100) / 100 AS IGNITION_PROBABILITY,
+            OUTAGE_IMPACT_SCORE AS CONSEQUENCE_SCORE,
+            WEATHER_FACTOR AS WIND_EXPOSURE_FACTOR,
+            VEGETATION_FACTOR AS FUEL_LOAD_FACTOR,
+            CAST(NULL AS DOUBLE) AS TERRAIN_FACTOR,
+            CAST(NULL AS DOUBLE) AS ACCESS_DIFFICULTY_FACTOR,
+            COMPOSITE_RISK_SCORE,
+            RISK_TIER,
+            'MODEL' AS ASSESSED_BY,
+            MODEL_VERSION AS ASSESSMENT_METHOD,
+            RECOMMENDED_ACTION AS NOTES
+        FROM {risk_assessments}
+    """,
+    "WORK_ORDER": """
+        SELECT
+            WORK_ORDER_ID,
+            ASSET_ID,
+            ACTIVITY_TYPE AS WORK_ORDER_TYPE,
+            WORK_TYPE,
+            PRIORITY,
+            CASE STATUS
+                WHEN 'SUBMITTED' THEN 'PENDING'
+                WHEN 'APPROVED' THEN 'SCHEDULED'
+                ELSE STATUS
+            END AS STATUS,
+            DESCRIPTION,
+            ESTIMATED_COST,
+            ACTUAL_COST,
+            SCHEDULED_DATE,
+            CAST(NULL AS DATE) AS STARTED_DATE,
+            COMPLETION_DATE AS COMPLETED_DATE,
+            ASSIGNED_CREW,
+            CREATED_BY,
+            CAST(REQUESTED_DATE AS TIMESTAMP) AS CREATED_DATE
+        FROM {work_orders}
+    """,
+}
+
+# Readings can run to hundreds of millions of rows; read in place, not copied
+ATOMIC_VIEWS = {
+    "AMI_READING": """
+        SELECT
+            READING_ID,
+            ASSET_ID,
+            'MTR-' || ASSET_ID AS METER_ID,
+            READING_TIMESTAMP,
+            VOLTAGE_AVG AS VOLTAGE_READING,
+            VOLTAGE_DIP_FLAG,
+            VOLTAGE_DIP_PCT AS VOLTAGE_DIP_MAGNITUDE,
+            ROUND((CURRENT_A + CURRENT_B + CURRENT_C) / 3, 2) AS CURRENT_READING,
+            POWER_FACTOR,
+            ROUND(RAINFALL_MM / 25.4, 2) AS RAINFALL_24H_INCHES,
+            RAIN_CORRELATED_DIP,
+            TEMPERATURE_F,
+            CAST(NULL AS DOUBLE) AS HUMIDITY_PCT
+        FROM {ami_readings}
+    """,
+}
+
+# ML tables: the columns the notebooks write (and /ml/* reads), in dependency
+# order. Each notebook's rule-based fallback stands in for its model.
+ML_TABLES = {
+    "ASSET_HEALTH_PREDICTION": """
+        SELECT
+            'AHP_' || ASSET_ID AS PREDICTION_ID,
+            ASSET_ID,
+            ASSET_TYPE,
+            ACTUAL_HEALTH_SCORE,
+            PREDICTED_HEALTH_SCORE,
+            ROUND(ACTUAL_HEALTH_SCORE - PREDICTED_HEALTH_SCORE, 1) AS HEALTH_DELTA,
+            0.87 AS MODEL_CONFIDENCE,
+            CASE
+                WHEN PREDICTED_HEALTH_SCORE < 40 THEN 'CRITICAL'
+                WHEN PREDICTED_HEALTH_SCORE < 60 THEN 'POOR'
+                WHEN PREDICTED_HEALTH_SCORE < 80 THEN 'FAIR'
+                ELSE 'GOOD'
+            END AS PREDICTED_CONDITION,
+            CURRENT_DATE AS PREDICTION_DATE,
+            'GRADIENT_BOOSTING_V1' AS MODEL_VERSION
+        FROM (
+            SELECT
+                ASSET_ID,
+                ASSET_TYPE,
+                ROUND(20 + CONDITION_SCORE * 80, 1) AS ACTUAL_HEALTH_SCORE,
+                -- Health erodes with age: a 40-year-old asset keeps 90% of its score
+                ROUND((20 + CONDITION_SCORE * 80) * (1 - LEAST(ASSET_AGE_YEARS, 80) / 400), 1) AS PREDICTED_HEALTH_SCORE
+            FROM {db}.{schema}.ASSET
+        )
+    """,
+    "VEGETATION_GROWTH_PREDICTION": """
+        SELECT
+            'VGP_' || ENCROACHMENT_ID AS PREDICTION_ID,
+            ENCROACHMENT_ID,
+            ASSET_ID,
+            SPECIES,
+            ACTUAL_GROWTH_RATE,
+            PREDICTED_GROWTH_RATE,
+            CURRENT_CLEARANCE_FT,
+            CAST(ROUND(GREATEST(CURRENT_CLEARANCE_FT, 0) / PREDICTED_GROWTH_RATE * 365) AS INTEGER) AS PREDICTED_DAYS_TO_CONTACT,
+            CASE
+                WHEN PREDICTED_GROWTH_RATE > 3 THEN 'HIGH'
+                WHEN PREDICTED_GROWTH_RATE > 2 THEN 'MEDIUM'
+                ELSE 'LOW'
+            END AS GROWTH_RISK,
+            CURRENT_DATE AS PREDICTION_DATE,
+            'RANDOM_FOREST_V1' AS MODEL_VERSION
+        FROM (
+            SELECT
+                ENCROACHMENT_ID,
+                ASSET_ID,
+                SPECIES,
+                CURRENT_CLEARANCE_FT,
+                GROWTH_RATE_FT_YEAR AS ACTUAL_GROWTH_RATE,
+                -- Growing-season uplift over the surveyed annual rate
+                ROUND(GREATEST(GROWTH_RATE_FT_YEAR, 0.1) * 1.1, 2) AS PREDICTED_GROWTH_RATE
+            FROM {db}.{schema}.VEGETATION_ENCROACHMENT
+        )
+    """,
+    "IGNITION_RISK_PREDICTION": """
+        SELECT
+            'IRP_' || ASSET_ID AS PREDICTION_ID,
+            ASSET_ID,
+            ASSET_TYPE,
+            ACTUAL_RISK,
+            PREDICTED_IGNITION_RISK,
+            CONDITION_SCORE,
+            AVG_CLEARANCE_DEFICIT,
+            CASE WHEN PREDICTED_IGNITION_RISK = 1 THEN 'HIGH' ELSE 'LOW' END AS RISK_LEVEL,
+            CURRENT_DATE AS PREDICTION_DATE,
+            'GRADIENT_BOOSTING_V1' AS MODEL_VERSION
+        FROM (
+            SELECT
+                a.ASSET_ID,
+                a.ASSET_TYPE,
+                a.CONDITION_SCORE,
+                COALESCE(v.AVG_CLEARANCE_DEFICIT, 0) AS AVG_CLEARANCE_DEFICIT,
+                CASE WHEN r.RISK_TIER IN ('CRITICAL', 'HIGH') THEN 1 ELSE 0 END AS ACTUAL_RISK,
+                CASE
+                    WHEN c.FIRE_THREAT_DISTRICT IN ('TIER_2', 'TIER_3')
+                         AND (a.CONDITION_SCORE < 0.5 OR COALESCE(v.AVG_CLEARANCE_DEFICIT, 0) > 0) THEN 1
+                    ELSE 0
+                END AS PREDICTED_IGNITION_RISK
+            FROM {db}.{schema}.ASSET a
+            JOIN {db}.{schema}.CIRCUIT c ON a.CIRCUIT_ID = c.CIRCUIT_ID
+            LEFT JOIN {db}.{schema}.RISK_ASSESSMENT r ON a.ASSET_ID = r.ASSET_ID
+            LEFT JOIN (
+                SELECT ASSET_ID, ROUND(AVG(GREATEST(CLEARANCE_DEFICIT_FT, 0)), 2) AS AVG_CLEARANCE_DEFICIT
+                FROM {db}.{schema}.VEGETATION_ENCROACHMENT
+                GROUP BY ASSET_ID
+            ) v ON a.ASSET_ID = v.ASSET_ID
+        )
+    """,
+    "CABLE_FAILURE_PREDICTION": """
+        SELECT
+            'CFP_' || a.ASSET_ID AS PREDICTION_ID,
+            a.ASSET_ID,
+            a.MATERIAL,
+            a.ASSET_AGE_YEARS,
+            a.MOISTURE_EXPOSURE,
+            COALESCE(p.RAIN_EVENTS_WITH_DIPS, 0) AS RAIN_CORRELATED_DIPS,
+            COALESCE(p.RAIN_CORRELATION_SCORE, 0) AS RAIN_VOLTAGE_CORRELATION,
+            CASE WHEN p.WATER_TREEING_SEVERITY IN ('MODERATE', 'SEVERE') THEN 1 ELSE 0 END AS ACTUAL_RISK,
+            CASE WHEN p.WATER_TREEING_SEVERITY IN ('MODERATE', 'SEVERE') THEN 1 ELSE 0 END AS PREDICTED_WATER_TREEING,
+            CASE WHEN p.WATER_TREEING_SEVERITY IN ('MODERATE', 'SEVERE') THEN 'HIGH' ELSE 'LOW' END AS RISK_LEVEL,
+            CURRENT_DATE AS PREDICTION_DATE,
+            'WATER_TREEING_V1' AS MODEL_VERSION
+        FROM {db}.{schema}.ASSET a
+        LEFT JOIN {cable_predictions} p ON a.ASSET_ID = p.ASSET_ID
+        WHERE a.ASSET_TYPE = 'CABLE_UNDERGROUND'
+    """,
+    "COMBINED_RISK_SUMMARY": """
+        SELECT
+            *,
+            CASE
+                WHEN WATER_TREEING_RISK = 'HIGH'
+                     OR (HEALTH_STATUS = 'CRITICAL' AND IGNITION_RISK_LEVEL = 'HIGH') THEN 'EMERGENCY'
+                WHEN COMPOSITE_ML_RISK_SCORE >= 50 THEN 'HIGH'
+                WHEN COMPOSITE_ML_RISK_SCORE >= 30 THEN 'MEDIUM'
+                ELSE 'LOW'
+            END AS MAINTENANCE_PRIORITY
+        FROM (
+            SELECT
+                a.ASSET_ID,
+                a.ASSET_TYPE,
+                a.CONDITION_SCORE AS ACTUAL_CONDITION,
+                a.ASSET_AGE_YEARS,
+                l.REGION,
+                c.FIRE_THREAT_DISTRICT,
+                c.TOTAL_CUSTOMERS,
+                h.PREDICTED_HEALTH_SCORE,
+                h.PREDICTED_CONDITION AS HEALTH_STATUS,
+                h.HEALTH_DELTA,
+                i.RISK_LEVEL AS IGNITION_RISK_LEVEL,
+                i.AVG_CLEARANCE_DEFICIT,
+                cf.RISK_LEVEL AS WATER_TREEING_RISK,
+                cf.RAIN_VOLTAGE_CORRELATION,
+                ROUND(
+                    (100 - COALESCE(h.PREDICTED_HEALTH_SCORE, 100)) * 0.5
+                    + CASE WHEN i.RISK_LEVEL = 'HIGH' THEN 30 ELSE 0 END
+                    + CASE WHEN cf.RISK_LEVEL = 'HIGH' THEN 30 ELSE 0 END
+                    + CASE c.FIRE_THREAT_DISTRICT WHEN 'TIER_3' THEN 10 WHEN 'TIER_2' THEN 5 ELSE 0 END,
+                    1
+                ) AS COMPOSITE_ML_RISK_SCORE
+            FROM {db}.{schema}.ASSET a
+            JOIN {db}.{schema}.CIRCUIT c ON a.CIRCUIT_ID = c.CIRCUIT_ID
+            JOIN {db}.{schema}.LOCATION l ON a.LOCATION_ID = l.LOCATION_ID
+            LEFT JOIN {db}.ML.ASSET_HEALTH_PREDICTION h ON a.ASSET_ID = h.ASSET_ID
+            LEFT JOIN {db}.ML.IGNITION_RISK_PREDICTION i ON a.ASSET_ID = i.ASSET_ID
+            LEFT JOIN {db}.ML.CABLE_FAILURE_PREDICTION cf ON a.ASSET_ID = cf.ASSET_ID
+        )
+    """,
+}
+
+SOURCE_TABLES = [
+    "locations", "circuits", "assets", "vegetation", "ami_readings",
+    "work_orders", "risk_assessments", "cable_predictions",
+]
+
+
+def parquet_source(data_dir: str, table: str) -> str:
+    """read_parquet() over a generator table: <table>.parquet, else the <table>/ dataset."""
+    path = os.path.join(data_dir, f"{table}.parquet")
+    if not os.path.exists(path):
+        dataset_dir = os.path.join(data_dir, table)
+        if not os.path.isdir(dataset_dir):
+            raise FileNotFoundError(
+                f"No {table}.parquet or {table}/ dataset in {data_dir} "
+                f"(run scripts/generate_synthetic_data.py)"
+            )
+        # Partition directories only split the rows; the key is not a column
+        path = os.path.join(dataset_dir, "*", "*.parquet")
+    return "read_parquet('{}', hive_partitioning = false)".format(path.replace("'", "''"))
+
+
+class _LocalCursor:
+    """Snowflake-connector-shaped cursor over a DuckDB connection."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.description: Optional[List[tuple]] = None
+        self.rowcount = -1
+
+    def execute(self, sql: str, params: Optional[Any] = None) -> "_LocalCursor":
+        self._conn.execute(sql, params)
+        description = self._conn.description
+        if _DML.match(sql):
+            # DuckDB reports the affected-row count as a one-row result
+            row = self._conn.fetchone()
+            self.rowcount = int(row[0]) if row else 0
+            self.description = None
+        else:
+            self.rowcount = -1
+            # Snowflake folds unquoted identifiers to upper case
+            self.description = [(d[0].upper(),) + tuple(d[1:]) for d in description] if description else None
+        return self
+
+    def fetchone(self):
+        return self._conn.fetchone()
+
+    def fetchmany(self, size: int = 1):
+        return self._conn.fetchmany(size)
+
+    def fetchall(self):
+        return self._conn.fetchall()
+
+    def fetch_arrow_all(self):
+        fetch = getattr(self._conn, "to_arrow_table", None) or self._conn.fetch_arrow_table
+        table = fetch()
+        return table.rename_columns([name.upper() for name in table.column_names])
+
+    def close(self):
+        self.description = None
+
+
+class _LocalConnection:
+    """One DuckDB connection to the shared in-memory warehouse."""
+
+    def __init__(self, conn, search_path: str):
+        self._conn = conn
+        self._closed = False
+        self._conn.execute(f"SET search_path = '{search_path}'")
+
+    def cursor(self) -> _LocalCursor:
+        return _LocalCursor(self._conn)
+
+    def is_closed(self) -> bool:
+        return self._closed
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._conn.close()
+
+
+class LocalWarehouse:
+    """
+    In-memory DuckDB database shaped like {database}.{schema} and {database}.ML.
+
+    load() builds it once; connect() hands out independent connections that
+    can run queries concurrently (DuckDB serializes only conflicting writes).
+    """
+
+    def __init__(self, data_dir: str = LOCAL_DATA_DIR, database: str = "RISK_PLANNING_DB",
+                 schema: str = "ATOMIC"):
+        self.data_dir = os.path.abspath(data_dir)
+        self.database = database
+        self.schema = schema
+        self._db = None
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, int]:
+        """Create every table from the parquet files; returns row counts by table."""
+        import duckdb
+
+        sources = {table: parquet_source(self.data_dir, table) for table in SOURCE_TABLES}
+        db = duckdb.connect(":memory:")
+        try:
+            for macro in _COMPAT_MACROS:
+                db.execute(macro)
+            db.execute(f"ATTACH ':memory:' AS {self.database}")
+            db.execute(f"CREATE SCHEMA {self.database}.{self.schema}")
+            db.execute(f"CREATE SCHEMA {self.database}.ML")
+
+            names = {"db": self.database, "schema": self.schema, **sources}
+            for table, select in ATOMIC_TABLES.items():
+                db.execute(f"CREATE TABLE {self.database}.{self.schema}.{table} AS {select.format(**names)}")
+            for view, select in ATOMIC_VIEWS.items():
+                db.execute(f"CREATE VIEW {self.database}.{self.schema}.{view} AS {select.format(**names)}")
+            for table, select in ML_TABLES.items():
+                db.execute(f"CREATE TABLE {self.database}.ML.{table} AS {select.format(**names)}")
+
+            counts = {}
+            for schema, tables in ((self.schema, ATOMIC_TABLES), ("ML", ML_TABLES)):
+                for table in tables:
+                    counts[f"{schema}.{table}"] = db.execute(
+                        f"SELECT COUNT(*) FROM {self.database}.{schema}.{table}"
+                    ).fetchone()[0]
+        except Exception:
+            db.close()
+            raise
+
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+            self._db = db
+        logger.info(f"Local warehouse loaded from {self.data_dir}: {counts}")
+        return counts
+
+    def connect(self) -> _LocalConnection:
+        """New connection to the loaded warehouse (a ConnectionPool factory)."""
+        with self._lock:
+            if self._db is None:
+                raise RuntimeError("Local warehouse is not loaded")
+            conn = self._db.cursor()
+        # Unqualified names resolve like a session with USE DATABASE/SCHEMA
+        return _LocalConnection(conn, f"{self.database}.{self.schema},memory.main")
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
@@ -0,0 +1,117 @@
+"""
+VIGIL Risk Planning - Mapbox Vector Tile Encoder
+
+Minimal protobuf writer for point layers in the Mapbox Vector Tile 2.1 format
+(https://github.com/mapbox/vector-tile-spec). Only what the asset map needs:
+one or more layers of POINT features with string/number/bool attributes.
+Kept dependency-free so tile generation does not pull in a protobuf runtime.
+"""
+
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+MVT_VERSION = 2
+DEFAULT_EXTENT = 4096
+
+_GEOM_POINT = 1
+_CMD_MOVE_TO = 1
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(field: int, wire_type: int) -> bytes:
+    return _varint((field << 3) | wire_type)
+
+
+def _length_delimited(field: int, payload: bytes) -> bytes:
+    return _key(field, 2) + _varint(len(payload)) + payload
+
+
+def _packed(field: int, values: Iterable[int]) -> bytes:
+    return _length_delimited(field, b"".join(_varint(v) for v in values))
+
+
+def _encode_value(value: Any) -> bytes:
+    """Layer Value message: string=1, double=3, sint=6, bool=7."""
+    if isinstance(value, bool):
+        body = _key(7, 0) + _varint(int(value))
+    elif isinstance(value, int):
+        body = _key(6, 0) + _varint(_zigzag(value))
+    elif isinstance(value, float):
+        body = _key(3, 1) + struct.pack("<d", value)
+    else:
+        encoded = str(value).encode("utf-8")
+        body = _key(1, 2) + _varint(len(encoded)) + encoded
+    return body
+
+
+class PointLayerEncoder:
+    """
+    Accumulates point features for one layer.
+
+    Coordinates are in tile space (0..extent). Attribute keys and values are
+    de-duplicated into the layer's key/value tables as the spec requires.
+    """
+
+    def __init__(self, name: str, extent: int = DEFAULT_EXTENT):
+        self.name = name
+        self.extent = extent
+        self._keys: Dict[str, int] = {}
+        self._values: Dict[Tuple[type, Any], int] = {}
+        self._features: List[bytes] = []
+
+    def add_point(self, x: int, y: int, properties: Dict[str, Any], feature_id: Optional[int] = None):
+        tags: List[int] = []
+        for key, value in properties.items():
+            if value is None or (isinstance(value, float) and value != value):
+                continue
+            key_index = self._keys.setdefault(key, len(self._keys))
+            value_index = self._values.setdefault((type(value), value), len(self._values))
+            tags.append(key_index)
+            tags.append(value_index)
+
+        geometry = (
+            (_CMD_MOVE_TO & 0x7) | (1 << 3),
+            _zigzag(int(x)),
+            _zigzag(int(y)),
+        )
+
+        feature = b""
+        if feature_id is not None:
+            feature += _key(1, 0) + _varint(feature_id)
+        if tags:
+            feature += _packed(2, tags)
+        feature += _key(3, 0) + _varint(_GEOM_POINT)
+        feature += _packed(4, geometry)
+        self._features.append(feature)
+
+    def __len__(self) -> int:
+        return len(self._features)
+
+    def encode(self) -> bytes:
+        body = _key(15, 0) + _varint(MVT_VERSION)
+        body += _length_delimited(1, self.name.encode("utf-8"))
+        for feature in self._features:
+            body += _length_delimited(2, feature)
+        for key in self._keys:
+            body += _length_delimited(3, key.encode("utf-8"))
+        for (_, value) in self._values:
+            body += _length_delimited(4, _encode_value(value))
+        body += _key(5, 0) + _varint(self.extent)
+        return body
+
+
+def encode_tile(layers: Sequence[PointLayerEncoder]) -> bytes:
+    """Serialize non-empty layers into a Tile message."""
+    return b"".join(_length_delimited(3, layer.encode()) for layer in layers if len(layer))
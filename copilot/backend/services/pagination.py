@@ -0,0 +1,123 @@
+"""
+VIGIL Risk Planning - Keyset Pagination
+
+Cursor-based pagination over the ORDER BY keys of a list query.
+
+A cursor is the url-safe base64 of a JSON array holding the sort-key values of
+the last row on the previous page. The next page is selected with a
+lexicographic "comes after" predicate on those keys instead of OFFSET, so the
+warehouse never re-reads skipped rows and pages stay stable while new rows
+are inserted. The last key of every keyset must be a unique, non-null ID.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+
+class SortKey(NamedTuple):
+    """One ORDER BY key: SQL expression, result column holding its value, direction."""
+    expression: str
+    column: str
+    descending: bool = False
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded for the requested keyset."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps(list(values), separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str, keyset: Sequence[SortKey]) -> List[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception as e:
+        raise InvalidCursorError(f"Malformed cursor: {e}") from e
+    if not isinstance(values, list) or len(values) != len(keyset):
+        raise InvalidCursorError("Cursor does not match this listing")
+    return values
+
+
+def cursor_for_row(row: Dict[str, Any], keyset: Sequence[SortKey]) -> str:
+    return encode_cursor([row.get(key.column) for key in keyset])
+
+
+def order_by_clause(keyset: Sequence[SortKey]) -> str:
+    """ORDER BY with explicit NULLS LAST so it agrees with keyset_predicate."""
+    parts = [
+        f"{key.expression} {'DESC' if key.descending else 'ASC'} NULLS LAST"
+        for key in keyset
+    ]
+    return "ORDER BY " + ", ".join(parts)
+
+
+def sql_literal(value: Any) -> str:
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def keyset_predicate(keyset: Sequence[SortKey], values: Sequence[Any]) -> str:
+    """
+    SQL condition selecting rows strictly after `values` in keyset order.
+
+    Built as: k1 after v1 OR (k1 = v1 AND (k2 after v2 OR (...))).
+    With NULLS LAST, nothing sorts after a NULL except other NULLs, and
+    every NULL sorts after any non-NULL value.
+    """
+    clause = None
+    for key, value in reversed(list(zip(keyset, values))):
+        expr = key.expression
+        if value is None:
+            after = None
+            equal = f"{expr} IS NULL"
+        else:
+            literal = sql_literal(value)
+            op = "<" if key.descending else ">"
+            after = f"({expr} {op} {literal} OR {expr} IS NULL)"
+            equal = f"{expr} = {literal}"
+
+        if clause is None:
+            clause = after or "FALSE"
+        elif after:
+            clause = f"({after} OR ({equal} AND {clause}))"
+        else:
+            clause = f"({equal} AND {clause})"
+    return clause or "TRUE"
+
+
+def keyset_query(base_sql: str, keyset: Sequence[SortKey], cursor: Optional[str] = None,
+                 limit: Optional[int] = None) -> str:
+    """
+    Append the cursor predicate, ORDER BY and optional LIMIT to a filtered
+    query that ends in its WHERE clause.
+    """
+    sql = base_sql
+    if cursor:
+        sql += f" AND {keyset_predicate(keyset, decode_cursor(cursor, keyset))}"
+    sql += f" {order_by_clause(keyset)}"
+    if limit is not None:
+        sql += f" LIMIT {int(limit)}"
+    return sql
+
+
+def build_page(rows: List[Dict[str, Any]], keyset: Sequence[SortKey], limit: int) -> Dict[str, Any]:
+    """Trim the look-ahead row and attach next_cursor when another page exists."""
+    has_more = len(rows) > limit
+    items = rows[:limit]
+    return {
+        "items": items,
+        "next_cursor": cursor_for_row(items[-1], keyset) if has_more and items else None,
+    }
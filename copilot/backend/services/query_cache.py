@@ -0,0 +1,235 @@
+"""
+VIGIL Risk Planning - Query Result Cache
+
+In-process TTL + LRU cache for warehouse results that change rarely
+(dashboard summaries, ML prediction counts).
+
+- Keyed by normalized SQL, so whitespace/formatting differences share an entry
+- Per-entry TTL with a cache-wide default
+- LRU eviction once max_entries is reached
+- Table-tagged invalidation: each entry remembers which tables its SQL reads,
+  and writes to a table drop every entry that depends on it
+- Listeners are notified after each invalidation so derived caches can follow
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_READ_TABLES = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_][\w$.]*)", re.IGNORECASE)
+_WRITE_TABLES = re.compile(
+    r"\b(?:INSERT\s+(?:OVERWRITE\s+)?INTO|UPDATE|DELETE\s+FROM|MERGE\s+INTO|TRUNCATE\s+(?:TABLE\s+)?)\s*([A-Za-z_][\w$.]*)",
+    re.IGNORECASE
+)
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and drop a trailing semicolon. Literals keep their case."""
+    return _WHITESPACE.sub(" ", sql).strip().rstrip(";").strip()
+
+
+def _table_name(qualified: str) -> str:
+    return qualified.rsplit(".", 1)[-1].upper()
+
+
+def tables_read(sql: str) -> FrozenSet[str]:
+    """Unqualified, upper-cased table names referenced in FROM/JOIN clauses."""
+    return frozenset(_table_name(t) for t in _READ_TABLES.findall(sql))
+
+
+def tables_written(sql: str) -> FrozenSet[str]:
+    """Unqualified, upper-cased table names targeted by a DML statement."""
+    return frozenset(_table_name(t) for t in _WRITE_TABLES.findall(sql))
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "tables")
+
+    def __init__(self, value: Any, expires_at: float, tables: FrozenSet[str]):
+        self.value = value
+        self.expires_at = expires_at
+        self.tables = tables
+
+
+class QueryCache:
+    """
+    Thread-safe result cache shared by the query worker threads.
+
+    Concurrent misses on the same key are collapsed: one thread runs the
+    loader while the others wait for its result.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 300.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Optional[FrozenSet[str]]], None]] = []
+
+        # Bumped on every invalidation; lets downstream caches detect stale data
+        self.data_version = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._coalesced = 0
+
+    def get(self, sql: str, count_miss: bool = True) -> Tuple[bool, Any]:
+        """
+        Return (hit, value) for the given SQL.
+
+        Pass count_miss=False for a fast-path probe that is followed by
+        get_or_load on a miss, so the miss is only counted once.
+        """
+        key = normalize_sql(sql)
+        with self._lock:
+            if count_miss:
+                return self._lookup(key)
+            hit, value = self._peek(key)
+            if hit:
+                self._hits += 1
+            return hit, value
+
+    def put(self, sql: str, value: Any, ttl: Optional[float] = None,
+            tables: Optional[Iterable[str]] = None):
+        """Store a result. Tables default to those read by the SQL."""
+        if not self.enabled:
+            return
+        key = normalize_sql(sql)
+        with self._lock:
+            self._store(key, value, ttl, tables, sql)
+
+    def get_or_load(self, sql: str, loader: Callable[[], Any], ttl: Optional[float] = None,
+                    tables: Optional[Iterable[str]] = None) -> Any:
+        """
+        Return the cached result or run loader() and cache what it returns.
+
+        Empty results are not cached: the service returns [] on query errors
+        and those must not be pinned for a whole TTL.
+        """
+        if not self.enabled:
+            return loader()
+
+        key = normalize_sql(sql)
+        with self._lock:
+            hit, value = self._lookup(key)
+            if hit:
+                return value
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                hit, value = self._peek(key)
+                if hit:
+                    self._coalesced += 1
+                    return value
+                version = self.data_version
+
+            try:
+                value = loader()
+                with self._lock:
+                    # Skip the store if an invalidation ran while loading
+                    if value and version == self.data_version:
+                        self._store(key, value, ttl, tables, sql)
+                return value
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is key_lock:
+                        del self._inflight[key]
+
+    def invalidate(self, tables: Optional[Iterable[str]] = None) -> int:
+        """
+        Drop entries that read any of the given tables (all entries if None).
+
+        Returns the number of entries removed.
+        """
+        table_set = frozenset(t.upper() for t in tables) if tables is not None else None
+        with self._lock:
+            if table_set is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                stale = [k for k, e in self._entries.items() if e.tables & table_set]
+                for k in stale:
+                    del self._entries[k]
+                removed = len(stale)
+            self.data_version += 1
+            self._invalidations += 1
+            listeners = list(self._listeners)
+
+        if removed:
+            logger.info(f"Query cache invalidated {removed} entries for {sorted(table_set) if table_set else 'ALL'}")
+        for listener in listeners:
+            try:
+                listener(table_set)
+            except Exception as e:
+                logger.warning(f"Query cache listener failed: {e}")
+        return removed
+
+    def add_invalidation_listener(self, listener: Callable[[Optional[FrozenSet[str]]], None]):
+        """Register a callback run after each invalidation with the affected tables (None = all)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for tuning TTLs and size."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "default_ttl": self.default_ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "invalidations": self._invalidations,
+                "coalesced_misses": self._coalesced,
+                "data_version": self.data_version,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds self._lock)
+    # ------------------------------------------------------------------
+
+    def _lookup(self, key: str) -> Tuple[bool, Any]:
+        hit, value = self._peek(key)
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+        return hit, value
+
+    def _peek(self, key: str) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[key]
+            self._expirations += 1
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def _store(self, key: str, value: Any, ttl: Optional[float],
+               tables: Optional[Iterable[str]], sql: str):
+        ttl = self.default_ttl if ttl is None else ttl
+        table_set = frozenset(t.upper() for t in tables) if tables is not None else tables_read(sql)
+        self._entries[key] = _Entry(value, time.monotonic() + ttl, table_set)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,188 @@
+"""
+VIGIL Risk Planning - Semantic Response Cache
+
+Caches copilot answers (Cortex Agent SSE event sequences, cortex_analyst
+results) by question meaning rather than exact text, so
+"show high risk assets in Tier 3" and "which tier 3 assets are high risk"
+share one agent run.
+
+- questions are embedded as normalized bag-of-words vectors (lowercased,
+  stop words and conversational filler dropped, plural "s" stripped, "tier3"
+  split into "tier 3") and compared by cosine similarity against
+  SEMANTIC_CACHE_THRESHOLD
+- the remaining content words must match exactly: any word selects rows
+  (a region, tier, asset type, condition grade, time window, species...), so
+  "poles" never answers a "transformers" question and "this week" never
+  answers "this month". Cosine only absorbs rewording: word order, stop
+  words, plurals and repeated terms
+- entries carry the query cache's data_version; any table invalidation makes
+  every older answer a miss
+- entries expire after SEMANTIC_CACHE_TTL seconds; each namespace is an LRU
+  bounded by SEMANTIC_CACHE_MAX_ENTRIES
+"""
+
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.85"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "1800"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "500"))
+
+_TOKEN_PATTERN = re.compile(r"[a-z]+|\d+(?:\.\d+)?")
+
+_STOP_WORDS = frozenset("""
+    a an the is are was were be been am do does did of in on at to for from by
+    with and or me my i we our us you your it its this that these those there
+    show list give get find display tell what which who whom where when please
+    can could would should will any all some about have has had as into
+    how many much need want know like see look also just currently let
+""".split())
+
+
+class QuestionVector(NamedTuple):
+    """Normalized question embedding."""
+    weights: Dict[str, float]
+    norm: float
+    strict: FrozenSet[str]  # content words, compared exactly
+
+
+def _stem(token: str) -> str:
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def embed_question(question: str) -> QuestionVector:
+    """Bag-of-words vector over normalized tokens."""
+    tokens = [
+        _stem(token) for token in _TOKEN_PATTERN.findall(question.lower())
+        if token not in _STOP_WORDS
+    ]
+    counts = Counter(tokens)
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return QuestionVector(dict(counts), norm, frozenset(counts))
+
+
+def similarity(a: QuestionVector, b: QuestionVector) -> float:
+    """Cosine similarity; 0 when the content words differ at all."""
+    if a.strict != b.strict or not a.norm or not b.norm:
+        return 0.0
+    if len(a.weights) > len(b.weights):
+        a, b = b, a
+    dot = sum(w * b.weights.get(t, 0.0) for t, w in a.weights.items())
+    return dot / (a.norm * b.norm)
+
+
+class _Entry(NamedTuple):
+    question: str
+    vector: QuestionVector
+    value: Any
+    data_version: int
+    expires_at: float
+
+
+class SemanticCache:
+    """Similarity-keyed response cache, one LRU per namespace."""
+
+    def __init__(
+        self,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SEMANTIC_CACHE_TTL,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        enabled: bool = SEMANTIC_CACHE_ENABLED
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._spaces: Dict[str, "OrderedDict[str, _Entry]"] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+
+    def lookup(self, namespace: str, question: str, data_version: int) -> Optional[Tuple[Any, float]]:
+        """Best cached (value, similarity) at or above the threshold, else None."""
+        if not self.enabled:
+            return None
+        vector = embed_question(question)
+        now = time.monotonic()
+        with self._lock:
+            space = self._spaces.get(namespace)
+            best_key, best_score = None, 0.0
+            if space:
+                stale = [
+                    key for key, entry in space.items()
+                    if entry.expires_at <= now or entry.data_version != data_version
+                ]
+                for key in stale:
+                    del space[key]
+                for key, entry in space.items():
+                    score = similarity(vector, entry.vector)
+                    if score > best_score:
+                        best_key, best_score = key, score
+            if best_key is None or best_score < self.threshold:
+                self._misses += 1
+                return None
+            space.move_to_end(best_key)
+            self._hits += 1
+            return space[best_key].value, round(best_score, 4)
+
+    def store(self, namespace: str, question: str, data_version: int, value: Any, ttl: Optional[float] = None):
+        """Cache value for question under the given data version."""
+        if not self.enabled:
+            return
+        vector = embed_question(question)
+        # Questions with the same normalized tokens share one slot
+        key = " ".join(sorted(vector.weights)) or question
+        entry = _Entry(
+            question=question,
+            vector=vector,
+            value=value,
+            data_version=data_version,
+            expires_at=time.monotonic() + (ttl if ttl is not None else self.ttl)
+        )
+        with self._lock:
+            space = self._spaces.setdefault(namespace, OrderedDict())
+            space[key] = entry
+            space.move_to_end(key)
+            while len(space) > self.max_entries:
+                space.popitem(last=False)
+            self._stores += 1
+
+    def clear(self):
+        with self._lock:
+            self._spaces.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "enabled": self.enabled,
+                "threshold": self.threshold,
+                "entries": {name: len(space) for name, space in self._spaces.items()},
+                "hits": self._hits,
+                "misses": self._misses,
+                "stores": self._stores,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    """Get or create the semantic response cache singleton"""
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
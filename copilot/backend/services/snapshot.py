@@ -0,0 +1,218 @@
+"""
+VIGIL Risk Planning - Agent Data Snapshots
+
+In-memory columnar copies of the listings the agents summarize (assets,
+vegetation encroachments), so a chat turn aggregates arrays instead of
+re-querying Snowflake and looping over row dicts:
+
+- each (dataset, region) listing is loaded once into a TableSnapshot and
+  reused until SNAPSHOT_TTL seconds pass or the query cache invalidates one
+  of the dataset's source tables
+- numeric columns are float64 arrays (None -> a caller default); text
+  columns are dictionary-encoded (int codes + category list), so filters and group-bys
+  evaluate once per distinct value and then work on integer codes
+- the original rows are kept for the top-N listings agents still print
+- empty listings are not kept (the service returns [] on query errors, and
+  a failed load should not be served for a whole TTL)
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TTL = float(os.getenv("SNAPSHOT_TTL", "300"))
+
+# Dataset -> (service loader method, tables it reads)
+SNAPSHOT_DATASETS: Dict[str, Tuple[str, FrozenSet[str]]] = {
+    "assets": ("get_assets", frozenset({"ASSET", "CIRCUIT", "LOCATION"})),
+    "vegetation": (
+        "get_vegetation_encroachments",
+        frozenset({"VEGETATION_ENCROACHMENT", "ASSET", "CIRCUIT", "LOCATION"})
+    ),
+}
+
+
+class TableSnapshot:
+    """Immutable columnar view of a list of row dicts."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.built_at = time.monotonic()
+        self._numeric: Dict[Tuple[str, float], np.ndarray] = {}
+        self._encoded: Dict[Tuple[str, Any], Tuple[np.ndarray, List[Any]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def numeric(self, name: str, default: float = 0.0) -> np.ndarray:
+        """
+        Column as float64, with missing / None / 0 read as default.
+
+        Matches the agents' `row.get(name) or default` idiom.
+        """
+        key = (name, default)
+        column = self._numeric.get(key)
+        if column is None:
+            values = np.array([row.get(name) or default for row in self.rows], dtype=float)
+            with self._lock:
+                column = self._numeric.setdefault(key, values)
+        return column
+
+    def encoded(self, name: str, missing: Any = None) -> Tuple[np.ndarray, List[Any]]:
+        """Dictionary-encode a column: (codes, categories in first-seen order)."""
+        key = (name, missing)
+        result = self._encoded.get(key)
+        if result is None:
+            lookup: Dict[Any, int] = {}
+            codes = np.fromiter(
+                (lookup.setdefault(row.get(name, missing), len(lookup)) for row in self.rows),
+                dtype=np.int64, count=len(self.rows)
+            )
+            result = (codes, list(lookup))
+            with self._lock:
+                result = self._encoded.setdefault(key, result)
+        return result
+
+    def where(self, name: str, predicate: Callable[[Any], bool]) -> np.ndarray:
+        """Boolean mask of rows whose value in column name satisfies predicate."""
+        codes, categories = self.encoded(name)
+        if not categories:
+            return np.zeros(0, dtype=bool)
+        return np.array([bool(predicate(value)) for value in categories], dtype=bool)[codes]
+
+    def isin(self, name: str, *values: Any) -> np.ndarray:
+        """Boolean mask of rows whose value in column name is one of values."""
+        wanted = set(values)
+        return self.where(name, lambda value: value in wanted)
+
+    def group_by(self, name: str, missing: Any = None) -> Tuple[List[Any], np.ndarray, np.ndarray]:
+        """(categories, codes, counts per category) for a text column."""
+        codes, categories = self.encoded(name, missing)
+        return categories, codes, np.bincount(codes, minlength=len(categories))
+
+    def group_mean(self, codes: np.ndarray, counts: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Per-group mean of values for codes/counts from group_by."""
+        sums = np.bincount(codes, weights=values, minlength=len(counts))
+        return np.divide(sums, counts, out=np.zeros(len(counts)), where=counts > 0)
+
+    def take(self, index: np.ndarray) -> List[Dict[str, Any]]:
+        """Original row dicts at the given positions (or boolean mask)."""
+        if index.dtype == bool:
+            index = np.flatnonzero(index)
+        return [self.rows[i] for i in index.tolist()]
+
+    def top(self, mask: np.ndarray, by: np.ndarray, limit: Optional[int] = None) -> np.ndarray:
+        """Positions of masked rows ordered by `by` descending (stable), at most limit."""
+        positions = np.flatnonzero(mask)
+        order = positions[np.argsort(-by[positions], kind="stable")]
+        return order if limit is None else order[:limit]
+
+
+class SnapshotStore:
+    """Shared, invalidation-aware cache of TableSnapshots keyed by (dataset, region)."""
+
+    def __init__(self, snowflake_service, ttl: float = SNAPSHOT_TTL):
+        self.sf = snowflake_service
+        self.ttl = ttl
+        self._snapshots: Dict[Tuple[str, Optional[str]], TableSnapshot] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Tuple[str, Optional[str]], threading.Lock] = {}
+
+        self._generation = 0
+
+        self._hits = 0
+        self._loads = 0
+        self._invalidations = 0
+
+        self.sf.cache.add_invalidation_listener(self._on_invalidate)
+
+    def _on_invalidate(self, tables: Optional[FrozenSet[str]]):
+        stale = [
+            name for name, (_, sources) in SNAPSHOT_DATASETS.items()
+            if tables is None or tables & sources
+        ]
+        if stale:
+            self.invalidate(stale)
+
+    def invalidate(self, datasets: Optional[List[str]] = None):
+        """Drop snapshots for the given datasets (all if None)."""
+        with self._lock:
+            for key in list(self._snapshots):
+                if datasets is None or key[0] in datasets:
+                    del self._snapshots[key]
+            self._generation += 1
+            self._invalidations += 1
+        logger.info(f"Agent snapshots invalidated: {datasets or 'all'}")
+
+    def _fresh(self, key: Tuple[str, Optional[str]]) -> Optional[TableSnapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is not None and time.monotonic() - snapshot.built_at < self.ttl:
+            return snapshot
+        return None
+
+    def get(self, dataset: str, region: Optional[str] = None) -> TableSnapshot:
+        """Snapshot of a dataset listing, loading it on first use or when stale."""
+        key = (dataset, region)
+        snapshot = self._fresh(key)
+        if snapshot is not None:
+            with self._lock:
+                self._hits += 1
+            return snapshot
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            snapshot = self._fresh(key)
+            if snapshot is not None:
+                with self._lock:
+                    self._hits += 1
+                return snapshot
+            loader, _ = SNAPSHOT_DATASETS[dataset]
+            started = time.perf_counter()
+            generation = self._generation
+            kwargs = {"region": region} if region else {}
+            snapshot = TableSnapshot(getattr(self.sf, loader)(**kwargs))
+            with self._lock:
+                # Keep it only if no invalidation raced the load
+                if len(snapshot) and generation == self._generation:
+                    self._snapshots[key] = snapshot
+                self._loads += 1
+            print(f"[SNAPSHOT] Loaded {dataset} ({region or 'all regions'}): "
+                  f"{len(snapshot)} rows in {(time.perf_counter() - started) * 1000:.0f}ms", flush=True)
+            return snapshot
+
+    async def get_async(self, dataset: str, region: Optional[str] = None) -> TableSnapshot:
+        """get() off the event loop (only the load touches the warehouse)."""
+        snapshot = self._fresh((dataset, region))
+        if snapshot is not None:
+            with self._lock:
+                self._hits += 1
+            return snapshot
+        return await self.sf.run_async(self.get, dataset, region)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            lookups = self._hits + self._loads
+            return {
+                "ttl_s": self.ttl,
+                "snapshots": {
+                    f"{dataset}:{region or '*'}": {
+                        "rows": len(snapshot),
+                        "age_s": round(now - snapshot.built_at, 1)
+                    }
+                    for (dataset, region), snapshot in self._snapshots.items()
+                },
+                "hits": self._hits,
+                "loads": self._loads,
+                "invalidations": self._invalidations,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
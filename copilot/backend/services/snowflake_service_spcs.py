@@ -20,15 +20,98 @@ ACTUAL SCHEMA (matches DDL):
                    COMPOSITE_RISK_SCORE, RISK_TIER, ASSESSED_BY, ASSESSMENT_METHOD
 """
 
+import asyncio
+import functools
 import json
 import os
+import re
 import subprocess
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime, date
 import logging
 
+from .connection_pool import ConnectionPool
+from .query_cache import QueryCache, tables_written
+from .pagination import SortKey, build_page, keyset_query
+from .columnar import arrow_to_records
+from .token_provider import get_token_provider
+from .semantic_cache import get_semantic_cache
+from .sql_plan_cache import SQLPlanCache
+from .snapshot import SnapshotStore
+from .local_warehouse import LOCAL_DATA_DIR, LocalWarehouse
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on warehouse calls running at once from the async API.
+QUERY_WORKERS = int(os.getenv("SNOWFLAKE_QUERY_WORKERS", "8"))
+
+# Connector pool used inside SPCS; sized to the query workers by default so
+# every worker thread can hold its own connection.
+POOL_ENABLED = os.getenv("SNOWFLAKE_POOL_ENABLED", "true").lower() in ("1", "true", "yes")
+POOL_MIN_SIZE = int(os.getenv("SNOWFLAKE_POOL_MIN_SIZE", "1"))
+POOL_MAX_SIZE = int(os.getenv("SNOWFLAKE_POOL_MAX_SIZE", str(QUERY_WORKERS)))
+POOL_IDLE_TIMEOUT = float(os.getenv("SNOWFLAKE_POOL_IDLE_TIMEOUT", "300"))
+POOL_HEALTH_CHECK_INTERVAL = float(os.getenv("SNOWFLAKE_POOL_HEALTH_CHECK_INTERVAL", "60"))
+POOL_ACQUIRE_TIMEOUT = float(os.getenv("SNOWFLAKE_POOL_ACQUIRE_TIMEOUT", "30"))
+
+# Local execution path: "connector" keeps logged-in connections open for the
+# life of the process (uses the same ~/.snowflake/connections.toml entry as the
+# CLI); "cli" spawns `snow sql` per query; "duckdb" serves the synthetic
+# parquet in LOCAL_DATA_DIR from an embedded warehouse (no account needed, and
+# it wins over SPCS detection so CI and load tests never reach Snowflake).
+LOCAL_BACKEND = os.getenv("SNOWFLAKE_LOCAL_BACKEND", "connector").lower()
+
+# Result cache for summary queries over tables that change a few times a day.
+QUERY_CACHE_ENABLED = os.getenv("QUERY_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256"))
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "300"))
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", str(QUERY_CACHE_TTL)))
+
+# Bulk listings fetch Arrow batches from the connector instead of row tuples
+# (requires pyarrow; falls back to the row path when unavailable).
+ARROW_FETCH_ENABLED = os.getenv("SNOWFLAKE_ARROW_FETCH", "true").lower() in ("1", "true", "yes")
+
+# Map layer: individual assets are returned from MAP_CLUSTER_MAX_ZOOM upward,
+# below that assets are aggregated into grid cells roughly MAP_CLUSTER_CELL_PX
+# screen pixels wide (256px web-mercator tiles).
+MAP_POINT_LIMIT = int(os.getenv("MAP_POINT_LIMIT", "5000"))
+MAP_CLUSTER_MAX_ZOOM = int(os.getenv("MAP_CLUSTER_MAX_ZOOM", "11"))
+MAP_CLUSTER_CELL_PX = int(os.getenv("MAP_CLUSTER_CELL_PX", "64"))
+
+BBox = Tuple[float, float, float, float]
+
+
+def map_cluster_cell_degrees(zoom: int) -> float:
+    """Grid cell size in degrees for the given map zoom level."""
+    return 360.0 * MAP_CLUSTER_CELL_PX / (256 * 2 ** max(0, zoom))
+
+
+# Rows pulled per fetchmany() round when streaming list endpoints.
+STREAM_BATCH_SIZE = int(os.getenv("SNOWFLAKE_STREAM_BATCH_SIZE", "500"))
+
+# ORDER BY keys for the list endpoints; the trailing ID makes each order total
+# so keyset cursors are unambiguous.
+ASSET_KEYSET = (SortKey("a.CONDITION_SCORE", "CONDITION_SCORE"), SortKey("a.ASSET_ID", "ASSET_ID"))
+VEGETATION_KEYSET = (SortKey("v.DAYS_TO_CONTACT", "DAYS_TO_CONTACT"), SortKey("v.ENCROACHMENT_ID", "ENCROACHMENT_ID"))
+RISK_KEYSET = (SortKey("r.COMPOSITE_RISK_SCORE", "COMPOSITE_RISK_SCORE", descending=True), SortKey("r.ASSESSMENT_ID", "ASSESSMENT_ID"))
+WORK_ORDER_PRIORITY_RANK = """CASE w.PRIORITY 
+                WHEN 'EMERGENCY' THEN 1 
+                WHEN 'URGENT' THEN 2 
+                WHEN 'HIGH' THEN 3 
+                WHEN 'MEDIUM' THEN 4 
+                ELSE 5 
+            END"""
+WORK_ORDER_KEYSET = (
+    SortKey(WORK_ORDER_PRIORITY_RANK, "PRIORITY_RANK"),
+    SortKey("w.SCHEDULED_DATE", "SCHEDULED_DATE"),
+    SortKey("w.WORK_ORDER_ID", "WORK_ORDER_ID")
+)
+
+_JSON_ARRAY_START = re.compile(r"^\s*\[", re.MULTILINE)
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _detect_spcs() -> bool:
     """Detect if running inside SPCS container"""
@@ -59,15 +142,41 @@ class SnowflakeServiceSPCS:
         self.warehouse = os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH")
         self._session = None
         self._connection = None
+        self._pool: Optional[ConnectionPool] = None
+        self._warehouse: Optional[LocalWarehouse] = None
+        self._arrow_fetch = ARROW_FETCH_ENABLED
+        self._tokens = get_token_provider()
+        self.cache = QueryCache(
+            max_entries=QUERY_CACHE_MAX_ENTRIES,
+            default_ttl=QUERY_CACHE_TTL,
+            enabled=QUERY_CACHE_ENABLED
+        )
+        self.sql_plans = SQLPlanCache(scope=f"{self.database}.{self.schema}")
+        self.snapshots = SnapshotStore(self)
+        self._analyst_context: Optional[str] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=QUERY_WORKERS,
+            thread_name_prefix="snowflake-query"
+        )
         
-        self.is_spcs = IS_SPCS
+        self.is_spcs = IS_SPCS and LOCAL_BACKEND != "duckdb"
         
-        if self.is_spcs:
-            logger.info("Running inside SPCS - using Snowpark Session")
-            self._init_snowpark_session()
+        if LOCAL_BACKEND == "duckdb" and self._init_local_warehouse():
+            logger.info(f"Running locally - using embedded warehouse ({LOCAL_DATA_DIR})")
+        elif self.is_spcs:
+            if POOL_ENABLED and self._init_connection_pool():
+                logger.info("Running inside SPCS - using connector pool")
+            else:
+                logger.info("Running inside SPCS - using Snowpark Session")
+                self._init_snowpark_session()
+            self._tokens.add_listener(self._on_token_rotated)
+            self._tokens.start_watcher()
         else:
-            logger.info("Running locally - using Snowflake CLI")
             self.snow_path = self._find_snow_cli()
+            if LOCAL_BACKEND == "connector" and self._init_connection_pool(self._connect_local):
+                logger.info(f"Running locally - using persistent connector connections ({self.connection_name})")
+            else:
+                logger.info("Running locally - using Snowflake CLI")
     
     def _find_snow_cli(self) -> str:
         """Find the snow CLI path"""
@@ -110,11 +219,74 @@ class SnowflakeServiceSPCS:
             logger.error(f"Failed to establish Snowpark Session: {e}")
             self._init_connector_fallback()
     
+    def _connect(self):
+        """Open a new connector connection using the current SPCS OAuth token"""
+        import snowflake.connector
+        
+        token = self._tokens.get_token() or ""
+        
+        return snowflake.connector.connect(
+            host=os.environ.get("SNOWFLAKE_HOST", ""),
+            account=os.environ.get("SNOWFLAKE_ACCOUNT", ""),
+            authenticator="oauth",
+            token=token,
+            database=self.database,
+            schema=self.schema,
+            warehouse=self.warehouse
+        )
+    
+    def _connect_local(self):
+        """Open a connector connection from the named CLI connection (local development)"""
+        import snowflake.connector
+        
+        overrides = {"database": self.database, "schema": self.schema}
+        if os.getenv("SNOWFLAKE_WAREHOUSE"):
+            overrides["warehouse"] = self.warehouse
+        return snowflake.connector.connect(connection_name=self.connection_name, **overrides)
+    
+    def _init_connection_pool(self, factory: Optional[Callable[[], Any]] = None) -> bool:
+        """Create the connector pool and open min_size connections eagerly"""
+        try:
+            print(f"[POOL] Initializing connection pool (min={POOL_MIN_SIZE}, max={POOL_MAX_SIZE})...", flush=True)
+            pool = ConnectionPool(
+                factory=factory or self._connect,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                idle_timeout=POOL_IDLE_TIMEOUT,
+                health_check_interval=POOL_HEALTH_CHECK_INTERVAL,
+                acquire_timeout=POOL_ACQUIRE_TIMEOUT
+            )
+            pool.prefill()
+            self._pool = pool
+            print(f"[POOL] Connection pool ready", flush=True)
+            logger.info(f"Connection pool established: {pool.stats()}")
+            return True
+        except Exception as e:
+            print(f"[POOL] Connection pool init failed: {e}", flush=True)
+            logger.error(f"Connection pool init failed: {e}")
+            return False
+    
+    def _init_local_warehouse(self) -> bool:
+        """Load the synthetic parquet into the embedded warehouse and pool its connections"""
+        try:
+            print(f"[LOCAL] Loading embedded warehouse from {LOCAL_DATA_DIR}...", flush=True)
+            warehouse = LocalWarehouse(LOCAL_DATA_DIR, database=self.database, schema=self.schema)
+            counts = warehouse.load()
+            print(f"[LOCAL] Loaded {len(counts)} tables ({counts.get(f'{self.schema}.ASSET', 0)} assets)", flush=True)
+        except Exception as e:
+            print(f"[LOCAL] Embedded warehouse init failed: {e}", flush=True)
+            logger.error(f"Embedded warehouse init failed: {e}")
+            return False
+        
+        if not self._init_connection_pool(warehouse.connect):
+            warehouse.close()
+            return False
+        self._warehouse = warehouse
+        return True
+    
     def _init_connector_fallback(self):
         """Fallback to connector if Snowpark fails - also used for reconnection"""
         try:
-            import snowflake.connector
-            
             if self._connection:
                 try:
                     self._connection.close()
@@ -122,21 +294,7 @@ class SnowflakeServiceSPCS:
                     pass
                 self._connection = None
             
-            token_path = "/snowflake/session/token"
-            token = ""
-            if os.path.exists(token_path):
-                with open(token_path, "r") as f:
-                    token = f.read().strip()
-            
-            self._connection = snowflake.connector.connect(
-                host=os.environ.get("SNOWFLAKE_HOST", ""),
-                account=os.environ.get("SNOWFLAKE_ACCOUNT", ""),
-                authenticator="oauth",
-                token=token,
-                database=self.database,
-                schema=self.schema,
-                warehouse=self.warehouse
-            )
+            self._connection = self._connect()
             print(f"[SPCS] Connector established with warehouse: {self.warehouse}", flush=True)
             logger.info(f"Connector fallback connection established with warehouse: {self.warehouse}")
             return True
@@ -145,27 +303,199 @@ class SnowflakeServiceSPCS:
             logger.error(f"Connector fallback also failed: {e}")
             return False
     
+    def _on_token_rotated(self, token: str):
+        """Token file changed: move connections onto the new token before the old one expires"""
+        if self._pool:
+            print(f"[SPCS] Session token rotated, recycling connection pool...", flush=True)
+            self._pool.recycle()
+        elif self._connection:
+            print(f"[SPCS] Session token rotated, reconnecting...", flush=True)
+            self._init_connector_fallback()
+    
     def _reconnect_if_needed(self, error_msg: str) -> bool:
         """Check if error is token expiration and reconnect if so"""
         error_str = str(error_msg).lower()
         if "390114" in str(error_msg) or ("token" in error_str and "expired" in error_str):
+            # Re-read the token file; if it changed, _on_token_rotated has
+            # already moved the connections onto the new token.
+            previous = self._tokens.current
+            self._tokens.invalidate()
+            rotated = self._tokens.refresh(force=True) != previous
+            if self._pool:
+                if not rotated:
+                    # Retire every pooled connection; the next acquire logs in
+                    # again with the current token.
+                    print(f"[SPCS] Token expired, recycling connection pool...", flush=True)
+                    self._pool.recycle()
+                return True
+            if rotated and self._connection:
+                return True
             print(f"[SPCS] Token expired, reconnecting...", flush=True)
             return self._init_connector_fallback()
         return False
     
+    def pool_stats(self) -> Dict[str, Any]:
+        """Connection pool counters (empty when the pool is not in use)"""
+        return self._pool.stats() if self._pool else {}
+    
+    @staticmethod
+    def _cursor_to_dicts(cursor) -> List[Dict[str, Any]]:
+        """Convert a connector cursor's result set into a list of dicts"""
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        return SnowflakeServiceSPCS._rows_to_dicts(columns, cursor.fetchall())
+    
+    @staticmethod
+    def _rows_to_dicts(columns: List[str], rows: List[Any]) -> List[Dict[str, Any]]:
+        """Zip connector row tuples with column names, ISO-formatting temporals"""
+        results = []
+        for row in rows:
+            row_dict = {}
+            for i, col in enumerate(columns):
+                value = row[i]
+                if hasattr(value, 'isoformat'):
+                    value = value.isoformat()
+                row_dict[col] = value
+            results.append(row_dict)
+        return results
+    
     def execute_query(self, query: str) -> List[Dict[str, Any]]:
         """Execute a SQL query and return results as list of dicts"""
-        if self.is_spcs:
+        if self.is_spcs or self._pool:
             return self._execute_query_snowpark(query)
         else:
             return self._execute_query_cli(query)
     
+    async def run_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking service call on the bounded query thread pool.
+        
+        Keeps warehouse round-trips off the event loop so one slow query
+        does not stall other requests or SSE streams.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+    
+    async def execute_query_async(self, query: str) -> List[Dict[str, Any]]:
+        """Async variant of execute_query for use from FastAPI handlers and agents."""
+        return await self.run_async(self.execute_query, query)
+    
+    def execute_query_cached(self, query: str, ttl: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Execute a query through the result cache (keyed by normalized SQL)."""
+        return self.cache.get_or_load(query, lambda: self.execute_query(query), ttl=ttl)
+    
+    async def execute_query_cached_async(self, query: str, ttl: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Async variant of execute_query_cached."""
+        hit, value = self.cache.get(query, count_miss=False) if self.cache.enabled else (False, None)
+        if hit:
+            return value
+        return await self.run_async(self.execute_query_cached, query, ttl)
+    
+    def execute_query_bulk(self, query: str, retry: bool = True) -> List[Dict[str, Any]]:
+        """
+        Execute a large listing query via the connector's Arrow fetch path.
+        
+        Same result shape as execute_query, but temporal and decimal columns
+        are converted column-at-a-time instead of per value in Python.
+        """
+        if not self._arrow_fetch or not (self._pool or self._connection):
+            return self.execute_query(query)
+        
+        print(f"[QUERY] Executing (arrow): {query[:200]}...", flush=True)
+        try:
+            with self._pool.connection() if self._pool else nullcontext(self._connection) as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(query)
+                    table = cursor.fetch_arrow_all()
+                finally:
+                    cursor.close()
+            results = arrow_to_records(table)
+            print(f"[QUERY] Returned {len(results)} rows (arrow)", flush=True)
+            return results
+        except Exception as e:
+            error_str = str(e)
+            if retry and self._reconnect_if_needed(error_str):
+                return self.execute_query_bulk(query, retry=False)
+            if "pyarrow" in error_str.lower() or isinstance(e, ImportError):
+                logger.warning(f"Arrow fetch unavailable, using row fetch: {e}")
+                self._arrow_fetch = False
+                return self.execute_query(query)
+            print(f"[QUERY] EXCEPTION: {error_str}", flush=True)
+            logger.error(f"Arrow query failed: {e}")
+            return []
+    
+    def iter_query(self, query: str, batch_size: int = STREAM_BATCH_SIZE,
+                   dedicated: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Yield result rows as the cursor fetches them, batch_size at a time,
+        instead of materializing the whole result set.
+        
+        dedicated=True streams on a connection opened outside the pool, so an
+        unbounded export held open by a slow client never takes a pooled slot.
+        """
+        print(f"[QUERY] Streaming: {query[:200]}...", flush=True)
+        if self._pool:
+            holder = self._pool.dedicated() if dedicated else self._pool.connection()
+        elif self._connection:
+            holder = nullcontext(self._connection)
+        else:
+            holder = None
+        if holder is not None:
+            with holder as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute(query)
+                    columns = [desc[0] for desc in cursor.description] if cursor.description else []
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield from self._rows_to_dicts(columns, rows)
+                finally:
+                    cursor.close()
+        elif self._session:
+            for row in self._session.sql(query).to_local_iterator():
+                row_dict = row.asDict()
+                for key, value in row_dict.items():
+                    if hasattr(value, 'isoformat'):
+                        row_dict[key] = value.isoformat()
+                yield row_dict
+        else:
+            # CLI output arrives all at once; nothing to stream incrementally
+            yield from self.execute_query(query)
+    
+    def fetch_page(self, base_sql: str, keyset: Sequence[SortKey], limit: int, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        One keyset page of a list query: {"items": [...], "next_cursor": str | None}.
+        
+        Raises InvalidCursorError for a cursor that does not belong to this keyset.
+        """
+        rows = self.execute_query_bulk(keyset_query(base_sql, keyset, cursor=cursor, limit=limit + 1))
+        return build_page(rows, keyset, limit)
+    
+    def invalidate_cache(self, tables: Optional[List[str]] = None) -> int:
+        """Drop cached results that read the given tables (everything if None)."""
+        return self.cache.invalidate(tables)
+    
     def _execute_query_snowpark(self, query: str, retry: bool = True) -> List[Dict[str, Any]]:
         """Execute query using Snowpark Session (SPCS) with auto-reconnect on token expiration"""
         print(f"[QUERY] Executing: {query[:200]}...", flush=True)
         
         try:
-            if self._session:
+            if self._pool:
+                with self._pool.connection() as conn:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute(query)
+                        results = self._cursor_to_dicts(cursor)
+                    finally:
+                        cursor.close()
+                
+                print(f"[QUERY] Returned {len(results)} rows (pooled)", flush=True)
+                return results
+            elif self._session:
                 print(f"[QUERY] Using Snowpark Session", flush=True)
                 df = self._session.sql(query)
                 rows = df.collect()
@@ -187,21 +517,7 @@ class SnowflakeServiceSPCS:
                 print(f"[QUERY] Using Connector fallback", flush=True)
                 cursor = self._connection.cursor()
                 cursor.execute(query)
-                columns = [desc[0] for desc in cursor.description] if cursor.description else []
-                rows = cursor.fetchall()
-                
-                print(f"[QUERY] Fetched {len(rows)} rows, columns: {columns[:5]}...", flush=True)
-                
-                results = []
-                for row in rows:
-                    row_dict = {}
-                    for i, col in enumerate(columns):
-                        value = row[i]
-                        if hasattr(value, 'isoformat'):
-                            value = value.isoformat()
-                        row_dict[col] = value
-                    results.append(row_dict)
-                
+                results = self._cursor_to_dicts(cursor)
                 cursor.close()
                 print(f"[QUERY] Returning {len(results)} results", flush=True)
                 return results
@@ -254,24 +570,13 @@ class SnowflakeServiceSPCS:
     def _parse_json_output(self, output: str) -> List[Dict[str, Any]]:
         """Parse snow sql JSON output into list of dicts"""
         try:
-            lines = output.strip().split('\n')
-            json_lines = []
-            in_json = False
-            
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith('['):
-                    in_json = True
-                if in_json:
-                    json_lines.append(line)
-                if in_json and stripped.endswith(']'):
-                    break
-            
-            if not json_lines:
+            # Skip any CLI banner/warnings and decode the array in one pass
+            match = _JSON_ARRAY_START.search(output)
+            if not match:
                 return []
             
-            json_str = '\n'.join(json_lines)
-            return json.loads(json_str)
+            data, _ = _JSON_DECODER.raw_decode(output, match.end() - 1)
+            return data
             
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
@@ -279,15 +584,29 @@ class SnowflakeServiceSPCS:
     
     def execute_dml(self, sql: str, params: Optional[Dict] = None) -> int:
         """Execute DML (INSERT/UPDATE/DELETE) and return affected rows."""
-        if self.is_spcs:
-            return self._execute_dml_snowpark(sql)
+        if self.is_spcs or self._pool:
+            affected = self._execute_dml_snowpark(sql)
         else:
-            return self._execute_dml_cli(sql)
+            affected = self._execute_dml_cli(sql)
+        
+        # Cached reads of the written tables are now stale
+        written = tables_written(sql)
+        if written:
+            self.cache.invalidate(written)
+        return affected
     
-    def _execute_dml_snowpark(self, sql: str) -> int:
+    def _execute_dml_snowpark(self, sql: str, retry: bool = True) -> int:
         """Execute DML using Snowpark Session"""
         try:
-            if self._session:
+            if self._pool:
+                with self._pool.connection() as conn:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute(sql)
+                        return cursor.rowcount
+                    finally:
+                        cursor.close()
+            elif self._session:
                 self._session.sql(sql).collect()
                 return 1
             elif self._connection:
@@ -299,6 +618,8 @@ class SnowflakeServiceSPCS:
             return 0
         except Exception as e:
             logger.error(f"DML execution failed: {e}")
+            if retry and self._reconnect_if_needed(str(e)):
+                return self._execute_dml_snowpark(sql, retry=False)
             return 0
     
     def _execute_dml_cli(self, sql: str) -> int:
@@ -477,8 +798,8 @@ class SnowflakeServiceSPCS:
     # Asset Queries - USING ACTUAL COLUMN NAMES
     # =========================================================================
     
-    def get_assets(self, region: Optional[str] = None, asset_type: Optional[str] = None) -> List[Dict]:
-        """Get assets with optional filtering."""
+    def _assets_sql(self, region: Optional[str] = None, asset_type: Optional[str] = None) -> str:
+        """Filtered asset listing without ORDER BY/LIMIT."""
         sql = f"""
         SELECT 
             a.ASSET_ID,
@@ -505,9 +826,23 @@ class SnowflakeServiceSPCS:
             sql += f" AND l.REGION = '{region}'"
         if asset_type:
             sql += f" AND a.ASSET_TYPE = '{asset_type}'"
-        sql += " ORDER BY a.CONDITION_SCORE ASC NULLS LAST LIMIT 1000"
-        
-        return self.execute_query(sql)
+        return sql
+    
+    def get_assets(self, region: Optional[str] = None, asset_type: Optional[str] = None) -> List[Dict]:
+        """Get assets with optional filtering."""
+        sql = keyset_query(self._assets_sql(region, asset_type), ASSET_KEYSET, limit=1000)
+        return self.execute_query_bulk(sql)
+    
+    def get_assets_page(self, region: Optional[str] = None, asset_type: Optional[str] = None,
+                        limit: int = 100, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Keyset-paginated asset listing."""
+        return self.fetch_page(self._assets_sql(region, asset_type), ASSET_KEYSET, limit, cursor)
+    
+    def iter_assets(self, region: Optional[str] = None, asset_type: Optional[str] = None,
+                    limit: Optional[int] = None, cursor: Optional[str] = None) -> Iterator[Dict]:
+        """Stream the asset listing row by row."""
+        return self.iter_query(keyset_query(self._assets_sql(region, asset_type), ASSET_KEYSET, cursor=cursor, limit=limit),
+                               dedicated=limit is None)
     
     def get_asset_summary(self) -> List[Dict]:
         """Get asset summary by region and type."""
@@ -524,7 +859,7 @@ class SnowflakeServiceSPCS:
         GROUP BY l.REGION, a.ASSET_TYPE
         ORDER BY l.REGION, a.ASSET_TYPE
         """
-        return self.execute_query(sql)
+        return self.execute_query_cached(sql, ttl=SUMMARY_CACHE_TTL)
     
     def get_replacement_priorities(self, limit: int = 50) -> List[Dict]:
         """Get assets prioritized for replacement."""
@@ -560,8 +895,8 @@ class SnowflakeServiceSPCS:
     # Vegetation Queries
     # =========================================================================
     
-    def get_vegetation_encroachments(self, region: Optional[str] = None) -> List[Dict]:
-        """Get vegetation encroachment data."""
+    def _vegetation_sql(self, region: Optional[str] = None) -> str:
+        """Filtered encroachment listing without ORDER BY/LIMIT."""
         sql = f"""
         SELECT 
             v.ENCROACHMENT_ID,
@@ -587,9 +922,44 @@ class SnowflakeServiceSPCS:
         """
         if region:
             sql += f" AND l.REGION = '{region}'"
-        sql += " ORDER BY v.DAYS_TO_CONTACT ASC NULLS LAST LIMIT 1000"
-        
-        return self.execute_query(sql)
+        return sql
+    
+    def get_vegetation_encroachments(self, region: Optional[str] = None) -> List[Dict]:
+        """Get vegetation encroachment data."""
+        sql = keyset_query(self._vegetation_sql(region), VEGETATION_KEYSET, limit=1000)
+        return self.execute_query_bulk(sql)
+    
+    def get_vegetation_page(self, region: Optional[str] = None, limit: int = 100,
+                            cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Keyset-paginated encroachment listing."""
+        return self.fetch_page(self._vegetation_sql(region), VEGETATION_KEYSET, limit, cursor)
+    
+    def iter_vegetation_encroachments(self, region: Optional[str] = None, limit: Optional[int] = None,
+                                      cursor: Optional[str] = None) -> Iterator[Dict]:
+        """Stream the encroachment listing row by row."""
+        return self.iter_query(keyset_query(self._vegetation_sql(region), VEGETATION_KEYSET, cursor=cursor, limit=limit),
+                               dedicated=limit is None)
+    
+    def get_vegetation_totals(self, region: Optional[str] = None) -> Dict[str, Any]:
+        """Encroachment totals over the whole filtered listing, independent of any page."""
+        sql = f"""
+        SELECT 
+            COUNT(*) as TOTAL_ENCROACHMENTS,
+            COUNT(CASE WHEN v.TRIM_PRIORITY = 'CRITICAL' THEN 1 END) as CRITICAL,
+            COUNT(CASE WHEN v.TRIM_PRIORITY = 'HIGH' THEN 1 END) as HIGH_PRIORITY,
+            COUNT(CASE WHEN v.TRIM_PRIORITY IN ('CRITICAL', 'HIGH') THEN 1 END) as OUT_OF_COMPLIANCE,
+            COALESCE(SUM(v.ESTIMATED_TRIM_COST), 0) as TOTAL_TRIM_COST,
+            COALESCE(AVG(v.CURRENT_CLEARANCE_FT), 0) as AVG_CLEARANCE_FT
+        FROM {self.database}.{self.schema}.VEGETATION_ENCROACHMENT v
+        JOIN {self.database}.{self.schema}.ASSET a ON v.ASSET_ID = a.ASSET_ID
+        JOIN {self.database}.{self.schema}.CIRCUIT c ON a.CIRCUIT_ID = c.CIRCUIT_ID
+        JOIN {self.database}.{self.schema}.LOCATION l ON a.LOCATION_ID = l.LOCATION_ID
+        WHERE 1=1
+        """
+        if region:
+            sql += f" AND l.REGION = '{region}'"
+        rows = self.execute_query_cached(sql)
+        return rows[0] if rows else {}
     
     def get_compliance_summary(self) -> List[Dict]:
         """Get GO95 compliance summary by region and fire district."""
@@ -611,7 +981,7 @@ class SnowflakeServiceSPCS:
         GROUP BY l.REGION, c.FIRE_THREAT_DISTRICT
         ORDER BY l.REGION, c.FIRE_THREAT_DISTRICT
         """
-        return self.execute_query(sql)
+        return self.execute_query_cached(sql, ttl=SUMMARY_CACHE_TTL)
     
     def get_trim_priorities(self, limit: int = 50) -> List[Dict]:
         """Get vegetation trim priorities."""
@@ -647,8 +1017,8 @@ class SnowflakeServiceSPCS:
     # Risk Queries
     # =========================================================================
     
-    def get_risk_assessments(self, region: Optional[str] = None) -> List[Dict]:
-        """Get risk assessment data."""
+    def _risk_assessments_sql(self, region: Optional[str] = None) -> str:
+        """Filtered risk assessment listing without ORDER BY/LIMIT."""
         sql = f"""
         SELECT 
             r.ASSESSMENT_ID,
@@ -672,9 +1042,23 @@ class SnowflakeServiceSPCS:
         """
         if region:
             sql += f" AND l.REGION = '{region}'"
-        sql += " ORDER BY r.COMPOSITE_RISK_SCORE DESC LIMIT 1000"
-        
-        return self.execute_query(sql)
+        return sql
+    
+    def get_risk_assessments(self, region: Optional[str] = None) -> List[Dict]:
+        """Get risk assessment data."""
+        sql = keyset_query(self._risk_assessments_sql(region), RISK_KEYSET, limit=1000)
+        return self.execute_query_bulk(sql)
+    
+    def get_risk_assessments_page(self, region: Optional[str] = None, limit: int = 100,
+                                  cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Keyset-paginated risk assessment listing."""
+        return self.fetch_page(self._risk_assessments_sql(region), RISK_KEYSET, limit, cursor)
+    
+    def iter_risk_assessments(self, region: Optional[str] = None, limit: Optional[int] = None,
+                              cursor: Optional[str] = None) -> Iterator[Dict]:
+        """Stream the risk assessment listing row by row."""
+        return self.iter_query(keyset_query(self._risk_assessments_sql(region), RISK_KEYSET, cursor=cursor, limit=limit),
+                               dedicated=limit is None)
     
     def get_risk_summary(self) -> List[Dict]:
         """Get risk summary by region and tier."""
@@ -698,7 +1082,7 @@ class SnowflakeServiceSPCS:
                 ELSE 4 
             END
         """
-        return self.execute_query(sql)
+        return self.execute_query_cached(sql, ttl=SUMMARY_CACHE_TTL)
     
     def get_psps_candidates(self) -> List[Dict]:
         """Get circuits eligible for PSPS."""
@@ -765,13 +1149,14 @@ class SnowflakeServiceSPCS:
     # Work Order Queries
     # =========================================================================
     
-    def get_work_orders(self, status: Optional[str] = None) -> List[Dict]:
-        """Get work orders with optional status filter."""
+    def _work_orders_sql(self, status: Optional[str] = None) -> str:
+        """Filtered work order listing without ORDER BY/LIMIT."""
         sql = f"""
         SELECT 
             w.WORK_ORDER_ID,
             w.WORK_ORDER_TYPE,
             w.PRIORITY,
+            {WORK_ORDER_PRIORITY_RANK} as PRIORITY_RANK,
             w.STATUS,
             w.DESCRIPTION,
             w.ESTIMATED_COST,
@@ -790,19 +1175,37 @@ class SnowflakeServiceSPCS:
         """
         if status:
             sql += f" AND w.STATUS = '{status}'"
-        sql += """
-        ORDER BY 
-            CASE w.PRIORITY 
-                WHEN 'EMERGENCY' THEN 1 
-                WHEN 'URGENT' THEN 2 
-                WHEN 'HIGH' THEN 3 
-                WHEN 'MEDIUM' THEN 4 
-                ELSE 5 
-            END,
-            w.SCHEDULED_DATE ASC
-        LIMIT 500
+        return sql
+    
+    def get_work_orders(self, status: Optional[str] = None) -> List[Dict]:
+        """Get work orders with optional status filter."""
+        sql = keyset_query(self._work_orders_sql(status), WORK_ORDER_KEYSET, limit=500)
+        return self.execute_query_bulk(sql)
+    
+    def get_work_orders_page(self, status: Optional[str] = None, limit: int = 100,
+                             cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Keyset-paginated work order listing."""
+        return self.fetch_page(self._work_orders_sql(status), WORK_ORDER_KEYSET, limit, cursor)
+    
+    def iter_work_orders(self, status: Optional[str] = None, limit: Optional[int] = None,
+                         cursor: Optional[str] = None) -> Iterator[Dict]:
+        """Stream the work order listing row by row."""
+        return self.iter_query(keyset_query(self._work_orders_sql(status), WORK_ORDER_KEYSET, cursor=cursor, limit=limit),
+                               dedicated=limit is None)
+    
+    def get_work_order_totals(self, status: Optional[str] = None) -> Dict[str, Any]:
+        """Work order counts by status over the whole filtered listing, independent of any page."""
+        sql = f"""
+        SELECT 
+            COUNT(*) as TOTAL,
+            COUNT(CASE WHEN STATUS = 'OPEN' THEN 1 END) as OPEN,
+            COUNT(CASE WHEN STATUS = 'IN_PROGRESS' THEN 1 END) as IN_PROGRESS,
+            COUNT(CASE WHEN STATUS = 'COMPLETED' THEN 1 END) as COMPLETED,
+            COUNT(CASE WHEN STATUS = 'OVERDUE' THEN 1 END) as OVERDUE
+        FROM ({self._work_orders_sql(status)}) wo
         """
-        return self.execute_query(sql)
+        rows = self.execute_query_cached(sql)
+        return rows[0] if rows else {}
     
     def get_work_order_backlog(self) -> List[Dict]:
         """Get work order backlog summary."""
@@ -820,7 +1223,7 @@ class SnowflakeServiceSPCS:
         GROUP BY l.REGION, w.WORK_ORDER_TYPE, w.STATUS
         ORDER BY l.REGION, w.WORK_ORDER_TYPE
         """
-        return self.execute_query(sql)
+        return self.execute_query_cached(sql, ttl=SUMMARY_CACHE_TTL)
     
     def create_work_order(self, work_order: Dict[str, Any]) -> str:
         """Create a new work order and return the ID."""
@@ -867,7 +1270,37 @@ class SnowflakeServiceSPCS:
             "work_order_backlog": self.get_work_order_backlog()
         }
     
-    def get_map_data(self) -> List[Dict]:
+    async def get_dashboard_metrics_async(self) -> Dict[str, Any]:
+        """
+        Same response as get_dashboard_metrics, with the four summary queries
+        in flight at once so latency is the slowest query rather than the sum.
+        """
+        asset_summary, risk_summary, compliance_summary, work_order_backlog = await asyncio.gather(
+            self.run_async(self.get_asset_summary),
+            self.run_async(self.get_risk_summary),
+            self.run_async(self.get_compliance_summary),
+            self.run_async(self.get_work_order_backlog)
+        )
+        return {
+            "fire_season": self.get_fire_season_countdown(),
+            "asset_summary": asset_summary,
+            "risk_summary": risk_summary,
+            "compliance_summary": compliance_summary,
+            "work_order_backlog": work_order_backlog
+        }
+    
+    @staticmethod
+    def _map_bbox_filter(bbox: Optional[BBox]) -> str:
+        """Viewport predicate over LOCATION coordinates (min_lon, min_lat, max_lon, max_lat)."""
+        if not bbox:
+            return ""
+        min_lon, min_lat, max_lon, max_lat = (float(v) for v in bbox)
+        return (
+            f" AND l.LONGITUDE BETWEEN {min_lon} AND {max_lon}"
+            f" AND l.LATITUDE BETWEEN {min_lat} AND {max_lat}"
+        )
+    
+    def get_map_data(self, bbox: Optional[BBox] = None, limit: int = MAP_POINT_LIMIT) -> List[Dict]:
         """Get asset locations with risk data for map visualization."""
         sql = f"""
         SELECT 
@@ -885,9 +1318,41 @@ class SnowflakeServiceSPCS:
         JOIN {self.database}.{self.schema}.CIRCUIT c ON a.CIRCUIT_ID = c.CIRCUIT_ID
         JOIN {self.database}.{self.schema}.LOCATION l ON a.LOCATION_ID = l.LOCATION_ID
         WHERE l.LATITUDE IS NOT NULL AND l.LONGITUDE IS NOT NULL
-        LIMIT 5000
+        {self._map_bbox_filter(bbox)}
+        LIMIT {int(limit)}
         """
-        return self.execute_query(sql)
+        return self.execute_query_bulk(sql)
+    
+    def get_map_clusters(self, zoom: int, bbox: Optional[BBox] = None) -> List[Dict]:
+        """
+        Aggregate map assets into a lat/lon grid sized for the zoom level.
+        
+        One row per non-empty cell with the asset count, the centroid of its
+        assets and risk/condition rollups, so the payload scales with the
+        viewport instead of the fleet.
+        """
+        cell = map_cluster_cell_degrees(zoom)
+        sql = f"""
+        SELECT 
+            FLOOR(l.LONGITUDE / {cell}) as CELL_X,
+            FLOOR(l.LATITUDE / {cell}) as CELL_Y,
+            COUNT(*) as ASSET_COUNT,
+            AVG(l.LONGITUDE) as LONGITUDE,
+            AVG(l.LATITUDE) as LATITUDE,
+            AVG(a.CONDITION_SCORE) as AVG_CONDITION_SCORE,
+            AVG(r.COMPOSITE_RISK_SCORE) as AVG_RISK_SCORE,
+            MAX(r.COMPOSITE_RISK_SCORE) as MAX_RISK_SCORE,
+            COUNT(CASE WHEN r.RISK_TIER = 'CRITICAL' THEN 1 END) as CRITICAL_COUNT,
+            COUNT(CASE WHEN r.RISK_TIER = 'HIGH' THEN 1 END) as HIGH_COUNT
+        FROM {self.database}.{self.schema}.ASSET a
+        LEFT JOIN {self.database}.{self.schema}.RISK_ASSESSMENT r ON a.ASSET_ID = r.ASSET_ID
+        JOIN {self.database}.{self.schema}.CIRCUIT c ON a.CIRCUIT_ID = c.CIRCUIT_ID
+        JOIN {self.database}.{self.schema}.LOCATION l ON a.LOCATION_ID = l.LOCATION_ID
+        WHERE l.LATITUDE IS NOT NULL AND l.LONGITUDE IS NOT NULL
+        {self._map_bbox_filter(bbox)}
+        GROUP BY CELL_X, CELL_Y
+        """
+        return self.execute_query_bulk(sql)
     
     # =========================================================================
     # Cortex LLM
@@ -904,10 +1369,27 @@ class SnowflakeServiceSPCS:
         ) AS RESPONSE
         """
         
+        if self._warehouse:
+            # The embedded warehouse has no Cortex; callers fall back to templates
+            print(f"[LLM] Cortex unavailable on the embedded warehouse", flush=True)
+            return ""
+        
         print(f"[LLM] Calling Cortex LLM with model: {model}", flush=True)
         
         try:
-            if self.is_spcs and self._connection:
+            if self._pool:
+                with self._pool.connection() as conn:
+                    cursor = conn.cursor()
+                    try:
+                        cursor.execute(sql)
+                        row = cursor.fetchone()
+                    finally:
+                        cursor.close()
+                
+                if row and row[0]:
+                    return str(row[0])
+                return ""
+            elif self.is_spcs and self._connection:
                 cursor = self._connection.cursor()
                 cursor.execute(sql)
                 row = cursor.fetchone()
@@ -953,8 +1435,64 @@ class SnowflakeServiceSPCS:
             return ""
     
     def cortex_analyst(self, question: str) -> Dict[str, Any]:
-        """Text-to-SQL using Cortex Complete LLM as fallback."""
-        schema_context = f"""
+        """
+        Text-to-SQL using Cortex Complete LLM as fallback.
+        
+        Answers are kept in the semantic response cache, keyed by question
+        similarity and the query cache's data version.
+        """
+        semantic_cache = get_semantic_cache()
+        data_version = self.cache.data_version
+        hit = semantic_cache.lookup("analyst", question, data_version)
+        if hit:
+            result, score = hit
+            return {**result, "cached": True, "similarity": score}
+        
+        # Previously validated SQL for this question (or its region/tier/limit
+        # template) skips the LLM call entirely
+        plan = self.sql_plans.lookup(question)
+        if plan:
+            print(f"[ANALYST] SQL plan cache hit ({plan.question_key})", flush=True)
+            results = self.execute_query(plan.sql)
+            if results:
+                result = {"answer": "Query executed", "sql": plan.sql, "data": results, "error": None, "plan_cached": True}
+                semantic_cache.store("analyst", question, data_version, result)
+                return result
+            # execute_query reports failures as no rows: treat the plan as
+            # stale and regenerate the SQL
+            logger.warning(f"Cached SQL plan returned no rows, regenerating: {plan.question_key}")
+            self.sql_plans.discard(plan)
+        
+        prompt = f"{self._analyst_schema_context()}\n\nUSER QUESTION: {question}\n\nSQL:"
+        
+        try:
+            generated_sql = self.cortex_complete(prompt)
+            
+            if not generated_sql:
+                return {"answer": None, "sql": None, "data": None, "error": "LLM did not generate SQL"}
+            
+            generated_sql = generated_sql.strip()
+            if generated_sql.startswith("```"):
+                lines = generated_sql.split("\n")
+                generated_sql = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
+            generated_sql = generated_sql.strip()
+            
+            results = self.execute_query(generated_sql)
+            result = {"answer": "Query executed", "sql": generated_sql, "data": results, "error": None}
+            if results:
+                # execute_query reports failures as no rows, so only SQL that
+                # returned data counts as validated or is worth replaying
+                self.sql_plans.store(question, generated_sql)
+                semantic_cache.store("analyst", question, data_version, result)
+            return result
+        except Exception as e:
+            return {"answer": None, "sql": None, "data": None, "error": str(e)}
+    
+    def _analyst_schema_context(self) -> str:
+        """Schema prompt for text-to-SQL (built once per service)"""
+        if self._analyst_context is not None:
+            return self._analyst_context
+        self._analyst_context = f"""
 You are a SQL expert. Generate Snowflake SQL to answer the user's question.
 
 DATABASE: {self.database}
@@ -985,28 +1523,18 @@ RULES:
 - Return ONLY valid SQL, no explanations
 - Always include ORDER BY and LIMIT 50
 """
-        
-        prompt = f"{schema_context}\n\nUSER QUESTION: {question}\n\nSQL:"
-        
-        try:
-            generated_sql = self.cortex_complete(prompt)
-            
-            if not generated_sql:
-                return {"answer": None, "sql": None, "data": None, "error": "LLM did not generate SQL"}
-            
-            generated_sql = generated_sql.strip()
-            if generated_sql.startswith("```"):
-                lines = generated_sql.split("\n")
-                generated_sql = "\n".join(lines[1:-1] if lines[-1] == "```" else lines[1:])
-            generated_sql = generated_sql.strip()
-            
-            results = self.execute_query(generated_sql)
-            return {"answer": "Query executed", "sql": generated_sql, "data": results, "error": None}
-        except Exception as e:
-            return {"answer": None, "sql": None, "data": None, "error": str(e)}
+        return self._analyst_context
     
     def close(self):
         """Close the connection"""
+        self._tokens.remove_listener(self._on_token_rotated)
+        self._tokens.stop_watcher()
+        self.sql_plans.close()
+        self._executor.shutdown(wait=False)
+        if self._pool:
+            self._pool.close()
+        if self._warehouse:
+            self._warehouse.close()
         if self._session:
             try:
                 self._session.close()
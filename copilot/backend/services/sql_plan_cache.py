@@ -0,0 +1,272 @@
+"""
+VIGIL Risk Planning - Generated SQL Plan Cache
+
+Persistent question -> SQL cache for cortex_analyst, so a question that has
+already been turned into working SQL never goes back to CORTEX.COMPLETE.
+
+- questions are normalized (lowercase, punctuation and whitespace collapsed)
+- region, fire threat tier and row limit are pulled out as parameters:
+  "top 10 tier 3 assets in NorCal" and "top 25 tier 2 assets in SoCal"
+  share the template "top {limit} {tier} assets in {region}"
+- when every extracted value appears literally in the generated SQL
+  ('NORCAL', 'TIER_3', LIMIT 10) the SQL is stored as a template and
+  re-rendered for new values; otherwise it is stored for the exact
+  question only
+- only SELECT/WITH statements that executed and returned rows are stored
+- plans live in SQLite at SQL_PLAN_CACHE_PATH, scoped by database.schema and
+  evicted least-recently-used beyond SQL_PLAN_CACHE_MAX_ENTRIES. They
+  survive restarts only when that path is on persistent storage: the SPCS
+  spec points it at a block volume, while the temp-dir default (local runs)
+  lasts as long as the container or machine's /tmp
+"""
+
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SQL_PLAN_CACHE_ENABLED = os.getenv("SQL_PLAN_CACHE_ENABLED", "true").lower() == "true"
+SQL_PLAN_CACHE_PATH = os.getenv(
+    "SQL_PLAN_CACHE_PATH", os.path.join(tempfile.gettempdir(), "vigil_sql_plans.sqlite")
+)
+SQL_PLAN_CACHE_MAX_ENTRIES = int(os.getenv("SQL_PLAN_CACHE_MAX_ENTRIES", "5000"))
+
+# Spoken forms -> REGION codes used in the LOCATION table
+_REGION_ALIASES = {
+    "NORCAL": r"nor\s*cal|northern\s+california",
+    "SOCAL": r"so\s*cal|southern\s+california",
+    "PNW": r"pnw|pacific\s+northwest",
+    "SOUTHWEST": r"south\s*west",
+    "MOUNTAIN": r"mountain\s+region|mountain",
+}
+_REGION_PATTERN = re.compile(
+    r"\b(?:" + "|".join(f"(?P<{code}>{alias})" for code, alias in _REGION_ALIASES.items()) + r")\b"
+)
+_TIER_PATTERN = re.compile(r"\b(?:tier[\s_-]*(?P<n>[123])|(?P<non>non[\s_-]*hftd))\b")
+_LIMIT_PATTERN = re.compile(r"\b(?:top|first|bottom|limit)\s+(?P<n>\d{1,5})\b")
+_NON_WORD = re.compile(r"[^a-z0-9{}_]+")
+_SELECT_PATTERN = re.compile(r"^\s*(?:select|with)\b", re.IGNORECASE)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sql_plans (
+    scope TEXT NOT NULL,
+    question_key TEXT NOT NULL,
+    sql_template TEXT NOT NULL,
+    params TEXT NOT NULL,
+    example_question TEXT,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, question_key)
+)
+"""
+
+
+class QuestionParams(NamedTuple):
+    """Normalized question, its parameter template and extracted values."""
+    normalized: str
+    template: str
+    values: Dict[str, str]
+
+
+class SQLPlan(NamedTuple):
+    """A cached plan rendered for one question."""
+    question_key: str
+    sql: str
+    templated: bool
+
+
+def _collapse(text: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def extract_params(question: str) -> QuestionParams:
+    """Pull region / tier / limit out of a question."""
+    text = question.lower()
+    values: Dict[str, str] = {}
+    spans: List[Tuple[int, int, str]] = []
+
+    region = _REGION_PATTERN.search(text)
+    if region:
+        values["region"] = region.lastgroup
+        spans.append((region.start(), region.end(), "{region}"))
+    tier = _TIER_PATTERN.search(text)
+    if tier:
+        values["tier"] = "NON_HFTD" if tier.group("non") else f"TIER_{tier.group('n')}"
+        spans.append((tier.start(), tier.end(), "{tier}"))
+    limit = _LIMIT_PATTERN.search(text)
+    if limit:
+        values["limit"] = str(int(limit.group("n")))
+        spans.append((limit.start("n"), limit.end("n"), "{limit}"))
+
+    template = text
+    for start, end, marker in sorted(spans, reverse=True):
+        template = template[:start] + f" {marker} " + template[end:]
+    return QuestionParams(_collapse(text), _collapse(template), values)
+
+
+def _templatize_sql(sql: str, values: Dict[str, str]) -> Optional[str]:
+    """Replace extracted values in SQL with markers; None if any value is missing."""
+    for name, value in values.items():
+        if name == "limit":
+            pattern = re.compile(rf"\bLIMIT\s+{value}\b", re.IGNORECASE)
+            replacement = "LIMIT {{limit}}"
+        else:
+            pattern = re.compile(rf"'{value}'", re.IGNORECASE)
+            replacement = f"'{{{{{name}}}}}'"
+        sql, count = pattern.subn(replacement, sql)
+        if not count:
+            return None
+    return sql
+
+
+def _render_sql(template: str, values: Dict[str, str]) -> str:
+    for name, value in values.items():
+        template = template.replace(f"{{{{{name}}}}}", value)
+    return template
+
+
+class SQLPlanCache:
+    """SQLite-backed cache of validated generated SQL."""
+
+    def __init__(
+        self,
+        path: str = SQL_PLAN_CACHE_PATH,
+        scope: str = "",
+        max_entries: int = SQL_PLAN_CACHE_MAX_ENTRIES,
+        enabled: bool = SQL_PLAN_CACHE_ENABLED
+    ):
+        self.path = path
+        self.scope = scope
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        self._lookups = 0
+        self._hits = 0
+        self._stores = 0
+        self._discards = 0
+
+        if self.enabled:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(_SCHEMA)
+                logger.info(f"SQL plan cache at {path}: {self._count()} plans")
+            except sqlite3.Error as e:
+                logger.warning(f"SQL plan cache disabled, cannot open {path}: {e}")
+                self._db = None
+                self.enabled = False
+
+    def _count(self) -> int:
+        row = self._db.execute("SELECT COUNT(*) FROM sql_plans WHERE scope = ?", (self.scope,)).fetchone()
+        return row[0]
+
+    def lookup(self, question: str) -> Optional[SQLPlan]:
+        """Cached SQL for question (exact match first, then its template)."""
+        if not self.enabled:
+            return None
+        params = extract_params(question)
+        with self._lock:
+            self._lookups += 1
+            keys = [params.normalized]
+            if params.values:
+                keys.append(params.template)
+            for key in keys:
+                row = self._db.execute(
+                    "SELECT sql_template, params FROM sql_plans WHERE scope = ? AND question_key = ?",
+                    (self.scope, key)
+                ).fetchone()
+                if row is None:
+                    continue
+                sql_template, names = row
+                templated = bool(names)
+                if templated and set(names.split(",")) != set(params.values):
+                    continue
+                self._db.execute(
+                    "UPDATE sql_plans SET hit_count = hit_count + 1, last_used_at = ? "
+                    "WHERE scope = ? AND question_key = ?",
+                    (time.time(), self.scope, key)
+                )
+                self._hits += 1
+                sql = _render_sql(sql_template, params.values) if templated else sql_template
+                return SQLPlan(key, sql, templated)
+        return None
+
+    def store(self, question: str, sql: str) -> bool:
+        """Remember SQL that answered question; returns False if not cacheable."""
+        if not self.enabled or not _SELECT_PATTERN.match(sql):
+            return False
+        params = extract_params(question)
+        template = _templatize_sql(sql, params.values) if params.values else None
+        if template is not None:
+            key, sql_template, names = params.template, template, ",".join(sorted(params.values))
+        else:
+            key, sql_template, names = params.normalized, sql, ""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sql_plans "
+                "(scope, question_key, sql_template, params, example_question, created_at, last_used_at, hit_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                (self.scope, key, sql_template, names, question, now, now)
+            )
+            self._stores += 1
+            overflow = self._count() - self.max_entries
+            if overflow > 0:
+                self._db.execute(
+                    "DELETE FROM sql_plans WHERE rowid IN (SELECT rowid FROM sql_plans WHERE scope = ? "
+                    "ORDER BY last_used_at LIMIT ?)",
+                    (self.scope, overflow)
+                )
+        return True
+
+    def discard(self, plan: SQLPlan):
+        """Drop a plan whose SQL no longer works (its lookup did not avoid an LLM call)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM sql_plans WHERE scope = ? AND question_key = ?", (self.scope, plan.question_key)
+            )
+            self._discards += 1
+            self._hits = max(0, self._hits - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            entries, total_hits, templates = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hit_count), 0), COALESCE(SUM(params != ''), 0) "
+                "FROM sql_plans WHERE scope = ?",
+                (self.scope,)
+            ).fetchone()
+            return {
+                "enabled": True,
+                "path": self.path,
+                "entries": entries,
+                "templated_entries": templates,
+                "lookups": self._lookups,
+                "llm_calls_avoided": self._hits,
+                "llm_calls_avoided_all_time": total_hits,
+                "hit_rate": round(self._hits / self._lookups, 4) if self._lookups else 0.0,
+                "stores": self._stores,
+                "discards": self._discards,
+            }
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+                self.enabled = False
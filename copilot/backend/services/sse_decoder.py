@@ -0,0 +1,125 @@
+"""
+VIGIL Risk Planning - Incremental SSE Decoder
+
+Decodes a text/event-stream body (https://html.spec.whatwg.org/#event-stream-interpretation)
+as raw bytes arrive from the network:
+
+- bytes are appended to one buffer and scanned forward from a saved offset,
+  so every byte is examined once no matter how the stream is chunked
+- the consumed prefix is dropped only once it is at least half the buffer,
+  keeping compaction amortized O(1) per byte
+- lines end in "\\n" or "\\r\\n" (bare "\\r" is not used by Snowflake)
+- fields are parsed line by line while scanning; multi-line data: fields are
+  joined with "\\n" as the spec requires, and comment lines are skipped
+- each line is decoded as UTF-8 only when complete, so multi-byte characters
+  split across network chunks decode correctly
+"""
+
+from typing import List, NamedTuple, Optional
+
+
+class SSEEvent(NamedTuple):
+    """One dispatched server-sent event."""
+    event: Optional[str]
+    data: str
+    id: Optional[str] = None
+
+
+class SSEDecoder:
+    """
+    Incremental server-sent events decoder.
+
+    Usage:
+        decoder = SSEDecoder()
+        async for chunk in response.aiter_bytes():
+            for event in decoder.feed(chunk):
+                ...
+        for event in decoder.flush():
+            ...
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._pos = 0
+        self._scan = 0
+        self._event: Optional[str] = None
+        self._data: List[str] = []
+        self._id: Optional[str] = None
+        self._last_id: Optional[str] = None
+
+    def feed(self, chunk: bytes) -> List[SSEEvent]:
+        """Consume a chunk and return the events it completed."""
+        buffer = self._buffer
+        buffer += chunk
+        events: List[SSEEvent] = []
+
+        pos = self._pos
+        find = buffer.find
+        # Resume the newline search where the previous chunk's scan ended, so a
+        # long line arriving over many chunks is not rescanned from its start
+        start = self._scan
+        while True:
+            newline = find(b"\n", start)
+            if newline < 0:
+                break
+            end = newline - 1 if newline > pos and buffer[newline - 1] == 0x0D else newline
+            event = self._process_line(buffer[pos:end])
+            if event is not None:
+                events.append(event)
+            pos = start = newline + 1
+
+        if pos and pos * 2 >= len(buffer):
+            del buffer[:pos]
+            pos = 0
+        self._pos = pos
+        self._scan = len(buffer)
+        return events
+
+    def flush(self) -> List[SSEEvent]:
+        """End of stream: process a trailing unterminated line and pending event."""
+        events: List[SSEEvent] = []
+        if self._pos < len(self._buffer):
+            tail = self._buffer[self._pos:].rstrip(b"\r")
+            event = self._process_line(tail)
+            if event is not None:
+                events.append(event)
+        self._buffer.clear()
+        self._pos = self._scan = 0
+        event = self._dispatch()
+        if event is not None:
+            events.append(event)
+        return events
+
+    def _process_line(self, line: bytearray) -> Optional[SSEEvent]:
+        if not line:
+            return self._dispatch()
+        if line[0] == 0x3A:  # ":" comment / keep-alive
+            return None
+
+        colon = line.find(b":")
+        if colon < 0:
+            field, value = line, b""
+        else:
+            field = line[:colon]
+            value = line[colon + 2:] if line[colon + 1:colon + 2] == b" " else line[colon + 1:]
+
+        if field == b"data":
+            self._data.append(value.decode("utf-8", errors="replace"))
+        elif field == b"event":
+            self._event = value.decode("utf-8", errors="replace")
+        elif field == b"id" and b"\0" not in value:
+            self._id = value.decode("utf-8", errors="replace")
+        return None
+
+    def _dispatch(self) -> Optional[SSEEvent]:
+        if self._id is not None:
+            self._last_id = self._id
+        if not self._data:
+            self._event = None
+            self._id = None
+            return None
+        event = SSEEvent(self._event, "\n".join(self._data), self._last_id)
+        self._event = None
+        self._data = []
+        self._id = None
+        return event
@@ -0,0 +1,150 @@
+"""
+VIGIL Risk Planning - SPCS OAuth Token Provider
+
+SPCS writes a short-lived OAuth token to /snowflake/session/token and
+replaces the file before the old token expires. This provider keeps the
+token in memory and re-reads the file only when its identity (inode, mtime,
+size) changes, or when a caller reports an auth failure.
+
+When a different token is loaded, registered listeners are notified. The
+Snowflake service uses that to rotate its connection pool onto the new token
+before the old sessions hit 390114 (token expired), rather than after a
+failed query.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPCS_TOKEN_PATH = os.getenv("SNOWFLAKE_TOKEN_PATH", "/snowflake/session/token")
+# Minimum seconds between stat() calls on the hot path
+TOKEN_STAT_INTERVAL = float(os.getenv("TOKEN_STAT_INTERVAL", "5"))
+# Background watcher poll interval; the watcher is what makes rotation proactive
+TOKEN_WATCH_INTERVAL = float(os.getenv("TOKEN_WATCH_INTERVAL", "30"))
+
+_FileIdentity = Tuple[int, int, int]
+
+
+class TokenProvider:
+    """Cached reader for the SPCS session token file."""
+
+    def __init__(self, path: str = SPCS_TOKEN_PATH, stat_interval: float = TOKEN_STAT_INTERVAL):
+        self.path = path
+        self.stat_interval = stat_interval
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._identity: Optional[_FileIdentity] = None
+        self._checked_at = 0.0
+        self._listeners: List[Callable[[str], None]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self._reads = 0
+        self._rotations = 0
+        self._invalidations = 0
+
+    def _stat(self) -> Optional[_FileIdentity]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    @property
+    def current(self) -> Optional[str]:
+        """Last loaded token, without touching the file."""
+        return self._token
+
+    def get_token(self) -> Optional[str]:
+        """Current token, or None when no token file exists (not in SPCS)."""
+        if self._token is not None and time.monotonic() - self._checked_at < self.stat_interval:
+            return self._token
+        return self.refresh()
+
+    def refresh(self, force: bool = False) -> Optional[str]:
+        """Re-read the token file if it changed (always, when force=True)."""
+        rotated = None
+        with self._lock:
+            identity = self._stat()
+            self._checked_at = time.monotonic()
+            if identity is None:
+                self._token, self._identity = None, None
+                return None
+            if force or identity != self._identity or self._token is None:
+                with open(self.path, "r") as f:
+                    token = f.read().strip()
+                self._reads += 1
+                if self._token is not None and token != self._token:
+                    self._rotations += 1
+                    rotated = token
+                self._token, self._identity = token, identity
+            token = self._token
+
+        if rotated is not None:
+            print(f"[TOKEN] Session token rotated, notifying {len(self._listeners)} listener(s)", flush=True)
+            for listener in list(self._listeners):
+                try:
+                    listener(rotated)
+                except Exception as e:
+                    logger.warning(f"Token rotation listener failed: {e}")
+        return token
+
+    def invalidate(self):
+        """Report an auth failure: the next get_token() re-reads the file."""
+        with self._lock:
+            self._identity = None
+            self._checked_at = 0.0
+            self._invalidations += 1
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """Call callback(new_token) whenever a different token is loaded."""
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def start_watcher(self, interval: float = TOKEN_WATCH_INTERVAL):
+        """Poll the token file in a daemon thread so rotation is noticed while idle."""
+        if self._watcher is not None or interval <= 0:
+            return
+        self._stop.clear()
+
+        def _watch():
+            while not self._stop.wait(interval):
+                try:
+                    self.refresh()
+                except Exception as e:
+                    logger.warning(f"Token watcher refresh failed: {e}")
+
+        self._watcher = threading.Thread(target=_watch, name="token-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        self._stop.set()
+        self._watcher = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "available": self._token is not None,
+            "file_reads": self._reads,
+            "rotations": self._rotations,
+            "invalidations": self._invalidations,
+            "watching": self._watcher is not None,
+        }
+
+
+_token_provider: Optional[TokenProvider] = None
+
+
+def get_token_provider() -> TokenProvider:
+    """Get or create the token provider singleton"""
+    global _token_provider
+    if _token_provider is None:
+        _token_provider = TokenProvider()
+    return _token_provider
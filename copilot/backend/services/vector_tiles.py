@@ -0,0 +1,252 @@
+"""
+VIGIL Risk Planning - Asset Vector Tiles
+
+Serves /tiles/{z}/{x}/{y}.mvt for the 3D risk map without a warehouse
+round-trip per tile:
+
+- the full map query (asset + risk + location) is loaded once into an
+  in-memory columnar index, refreshed after MVT_INDEX_TTL seconds
+- points are bucketed by their web-mercator tile at MVT_INDEX_ZOOM and kept
+  sorted by bucket key, so a tile lookup is a few binary searches
+- encoded tiles live in an LRU cache that is dropped, together with the
+  index, whenever the query cache invalidates asset/risk/location tables
+- an empty load is served but not kept (get_map_data returns [] on query
+  errors, and a failed load should not blank the map for a whole TTL)
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional
+
+import numpy as np
+
+from .mvt import DEFAULT_EXTENT, PointLayerEncoder, encode_tile
+
+logger = logging.getLogger(__name__)
+
+MVT_INDEX_ZOOM = int(os.getenv("MVT_INDEX_ZOOM", "10"))
+MVT_INDEX_TTL = float(os.getenv("MVT_INDEX_TTL", "900"))
+MVT_MAX_ASSETS = int(os.getenv("MVT_MAX_ASSETS", "2000000"))
+MVT_MAX_FEATURES_PER_TILE = int(os.getenv("MVT_MAX_FEATURES_PER_TILE", "20000"))
+MVT_TILE_CACHE_SIZE = int(os.getenv("MVT_TILE_CACHE_SIZE", "4096"))
+MVT_LAYER_NAME = "assets"
+
+# Tables whose changes make tiles stale
+TILE_SOURCE_TABLES = frozenset({"ASSET", "RISK_ASSESSMENT", "LOCATION", "CIRCUIT"})
+
+_MAX_MERCATOR_LAT = 85.05112878
+
+
+def lon_lat_to_mercator(lon: np.ndarray, lat: np.ndarray):
+    """Longitude/latitude in degrees -> normalized web-mercator x, y in [0, 1)."""
+    lat = np.clip(lat, -_MAX_MERCATOR_LAT, _MAX_MERCATOR_LAT)
+    x = (lon + 180.0) / 360.0
+    lat_rad = np.radians(lat)
+    y = (1.0 - np.log(np.tan(lat_rad) + 1.0 / np.cos(lat_rad)) / math.pi) / 2.0
+    eps = np.nextafter(1.0, 0.0)
+    return np.clip(x, 0.0, eps), np.clip(y, 0.0, eps)
+
+
+class PointIndex:
+    """Immutable columnar snapshot of map points, bucketed for tile lookups."""
+
+    def __init__(self, rows: List[Dict[str, Any]], index_zoom: int = MVT_INDEX_ZOOM):
+        self.index_zoom = index_zoom
+        self.built_at = time.monotonic()
+
+        lon = np.array([r.get("LONGITUDE") for r in rows], dtype=float)
+        lat = np.array([r.get("LATITUDE") for r in rows], dtype=float)
+        valid = ~(np.isnan(lon) | np.isnan(lat))
+        valid_idx = np.flatnonzero(valid)
+
+        x, y = lon_lat_to_mercator(lon[valid], lat[valid])
+        scale = 1 << index_zoom
+        keys = (y * scale).astype(np.int64) * scale + (x * scale).astype(np.int64)
+        order = np.argsort(keys, kind="stable")
+
+        self.x = x[order]
+        self.y = y[order]
+        self.keys = keys[order]
+        self.risk = np.array(
+            [rows[i].get("COMPOSITE_RISK_SCORE") for i in valid_idx[order]], dtype=float
+        )
+        self.rows = [rows[i] for i in valid_idx[order]]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def candidates(self, z: int, tx: int, ty: int) -> np.ndarray:
+        """Positions of points inside tile z/tx/ty."""
+        if z >= self.index_zoom:
+            shift = z - self.index_zoom
+            key = (ty >> shift) * (1 << self.index_zoom) + (tx >> shift)
+            lo, hi = np.searchsorted(self.keys, [key, key + 1])
+            if lo == hi:
+                return np.empty(0, dtype=np.int64)
+            idx = np.arange(lo, hi)
+            if shift:
+                scale = 1 << z
+                inside = ((self.x[idx] * scale).astype(np.int64) == tx) & \
+                         ((self.y[idx] * scale).astype(np.int64) == ty)
+                idx = idx[inside]
+            return idx
+
+        # Lower zoom: the tile covers a square block of index cells, one
+        # contiguous key range per index row
+        span = 1 << (self.index_zoom - z)
+        width = 1 << self.index_zoom
+        rows = np.arange(ty * span, (ty + 1) * span, dtype=np.int64)
+        starts = np.searchsorted(self.keys, rows * width + tx * span)
+        ends = np.searchsorted(self.keys, rows * width + (tx + 1) * span)
+        ranges = [np.arange(s, e) for s, e in zip(starts, ends) if e > s]
+        return np.concatenate(ranges) if ranges else np.empty(0, dtype=np.int64)
+
+
+class VectorTileService:
+    """Builds and caches asset vector tiles from the map query."""
+
+    def __init__(self, snowflake_service, extent: int = DEFAULT_EXTENT):
+        self.sf = snowflake_service
+        self.extent = extent
+        self._index: Optional[PointIndex] = None
+        self._index_lock = threading.Lock()
+        self._tiles: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._tiles_lock = threading.Lock()
+        self._generation = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._rebuilds = 0
+
+        self.sf.cache.add_invalidation_listener(self._on_invalidate)
+
+    # ------------------------------------------------------------------
+    # Index / cache lifecycle
+    # ------------------------------------------------------------------
+
+    def _on_invalidate(self, tables: Optional[FrozenSet[str]]):
+        if tables is None or tables & TILE_SOURCE_TABLES:
+            self.invalidate()
+
+    def invalidate(self):
+        """Drop the point index and every cached tile."""
+        with self._tiles_lock:
+            self._generation += 1
+            self._tiles.clear()
+        with self._index_lock:
+            self._index = None
+        logger.info("Vector tile cache invalidated")
+
+    def _get_index(self) -> PointIndex:
+        index = self._index
+        if index is not None and time.monotonic() - index.built_at < MVT_INDEX_TTL:
+            return index
+        with self._index_lock:
+            index = self._index
+            if index is None or time.monotonic() - index.built_at >= MVT_INDEX_TTL:
+                started = time.perf_counter()
+                rows = self.sf.get_map_data(limit=MVT_MAX_ASSETS)
+                if not rows:
+                    logger.warning("Map query returned no assets; tile index not cached")
+                    return PointIndex(rows)
+                index = PointIndex(rows)
+                self._index = index
+                self._rebuilds += 1
+                with self._tiles_lock:
+                    self._generation += 1
+                    self._tiles.clear()
+                print(f"[TILES] Indexed {len(index)} assets in {(time.perf_counter() - started) * 1000:.0f}ms", flush=True)
+            return index
+
+    # ------------------------------------------------------------------
+    # Tiles
+    # ------------------------------------------------------------------
+
+    def get_tile(self, z: int, x: int, y: int) -> bytes:
+        """Encoded MVT bytes for tile z/x/y (empty bytes for an empty tile)."""
+        index = self._get_index()
+        cache_key = (z, x, y)
+        with self._tiles_lock:
+            tile = self._tiles.get(cache_key)
+            if tile is not None:
+                self._tiles.move_to_end(cache_key)
+                self._hits += 1
+                return tile
+            self._misses += 1
+            generation = self._generation
+
+        tile = self._render(index, z, x, y)
+
+        with self._tiles_lock:
+            if generation == self._generation and len(index):
+                self._tiles[cache_key] = tile
+                while len(self._tiles) > MVT_TILE_CACHE_SIZE:
+                    self._tiles.popitem(last=False)
+        return tile
+
+    def _render(self, index: PointIndex, z: int, x: int, y: int) -> bytes:
+        idx = index.candidates(z, x, y)
+        if idx.size == 0:
+            return b""
+
+        scale = 1 << z
+        px = ((index.x[idx] * scale - x) * self.extent).astype(np.int64)
+        py = ((index.y[idx] * scale - y) * self.extent).astype(np.int64)
+
+        if idx.size > MVT_MAX_FEATURES_PER_TILE:
+            # Thin dense low-zoom tiles: keep the riskiest point per
+            # 16x16 tile-unit cell so hot spots stay visible
+            risk = np.nan_to_num(index.risk[idx], nan=-1.0)
+            by_risk = np.argsort(-risk, kind="stable")
+            cells = (py[by_risk] >> 4) * (self.extent >> 4) + (px[by_risk] >> 4)
+            _, first = np.unique(cells, return_index=True)
+            keep = by_risk[first]
+            keep = keep[np.argsort(-risk[keep], kind="stable")][:MVT_MAX_FEATURES_PER_TILE]
+            idx, px, py = idx[keep], px[keep], py[keep]
+
+        layer = PointLayerEncoder(MVT_LAYER_NAME, self.extent)
+        for i, tile_x, tile_y in zip(idx.tolist(), px.tolist(), py.tolist()):
+            row = index.rows[i]
+            layer.add_point(tile_x, tile_y, {
+                "asset_id": row.get("ASSET_ID"),
+                "asset_type": row.get("ASSET_TYPE"),
+                "risk_tier": row.get("RISK_TIER"),
+                "risk_score": _as_float(row.get("COMPOSITE_RISK_SCORE")),
+                "condition_score": _as_float(row.get("CONDITION_SCORE")),
+                "fire_district": row.get("FIRE_THREAT_DISTRICT"),
+                "region": row.get("REGION"),
+            })
+        return encode_tile([layer])
+
+    def stats(self) -> Dict[str, Any]:
+        index = self._index
+        with self._tiles_lock:
+            lookups = self._hits + self._misses
+            return {
+                "indexed_assets": len(index) if index else 0,
+                "index_age_s": round(time.monotonic() - index.built_at, 1) if index else None,
+                "index_rebuilds": self._rebuilds,
+                "cached_tiles": len(self._tiles),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def _as_float(value: Any) -> Optional[float]:
+    return float(value) if value is not None else None
+
+
+_tile_service: Optional[VectorTileService] = None
+
+
+def get_tile_service(snowflake_service) -> VectorTileService:
+    """Get or create the vector tile service singleton"""
+    global _tile_service
+    if _tile_service is None:
+        _tile_service = VectorTileService(snowflake_service)
+    return _tile_service
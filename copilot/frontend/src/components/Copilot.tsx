@@ -66,6 +66,8 @@ Try asking: *"What's the hidden discovery?"*`,
   const [isLoading, setIsLoading] = useState(false)
   const [showThinking, setShowThinking] = useState<Record<string, boolean>>({})
   const messagesEndRef = useRef<HTMLDivElement>(null)
+  // Issued by the backend on the first reply; sent back so follow-ups keep context
+  const conversationIdRef = useRef<string | undefined>(undefined)
 
   const scrollToBottom = () => {
     messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' })
@@ -108,7 +110,8 @@ Try asking: *"What's the hidden discovery?"*`,
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({
-          message: content.trim()
+          message: content.trim(),
+          conversation_id: conversationIdRef.current
         })
       })
 
@@ -134,13 +137,18 @@ Try asking: *"What's the hidden discovery?"*`,
         buffer = events.pop() || ''
 
         for (const eventStr of events) {
-          if (!eventStr.trim() || !eventStr.startsWith('data:')) continue
+          // Events may be named ("event: complete\ndata: {...}"); use the data line
+          const dataLine = eventStr.split('\n').find(line => line.startsWith('data:'))
+          if (!dataLine) continue
           
-          const dataStr = eventStr.replace('data:', '').trim()
+          const dataStr = dataLine.slice(5).trim()
           if (dataStr === '[DONE]') continue
 
           try {
             const event = JSON.parse(dataStr)
+            if (event.conversation_id) {
+              conversationIdRef.current = event.conversation_id
+            }
             
             if (event.type === 'text') {
               fullContent += event.content || ''
@@ -256,13 +264,17 @@ Try asking: *"What's the hidden discovery?"*`,
           method: 'POST',
           headers: { 'Content-Type': 'application/json' },
           body: JSON.stringify({
-            message: content.trim()
+            message: content.trim(),
+            conversation_id: conversationIdRef.current
           })
         })
 
         if (!response.ok) throw new Error('Failed to get response')
 
         const data = await response.json()
+        if (data.conversation_id) {
+          conversationIdRef.current = data.conversation_id
+        }
         
         setMessages(prev => prev.map(msg => 
           msg.id === assistantId 
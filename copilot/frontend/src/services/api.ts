@@ -119,10 +119,10 @@ export const searchVegetationDocs = (query: string) =>
   fetchAPI(`/search/vegetation?query=${encodeURIComponent(query)}`);
 
 // Chat
-export const sendChatMessage = async (message: string, persona?: string) => {
+export const sendChatMessage = async (message: string, persona?: string, conversationId?: string) => {
   return fetchAPI('/chat', {
     method: 'POST',
-    body: JSON.stringify({ message, persona }),
+    body: JSON.stringify({ message, persona, conversation_id: conversationId }),
   });
 };
 
@@ -144,7 +144,8 @@ export const streamChatMessage = async (
     onComplete?: (data: unknown) => void;
     onError?: (error: string) => void;
   },
-  persona?: string
+  persona?: string,
+  conversationId?: string
 ) => {
   const abortController = new AbortController();
 
@@ -155,7 +156,7 @@ export const streamChatMessage = async (
         'Content-Type': 'application/json',
         'Accept': 'text/event-stream',
       },
-      body: JSON.stringify({ message, persona }),
+      body: JSON.stringify({ message, persona, conversation_id: conversationId }),
       signal: abortController.signal,
     });
 
@@ -127,6 +127,7 @@ export interface ChatResponse {
   persona: AgentPersona;
   data?: Record<string, unknown>;
   sources?: string[];
+  conversation_id?: string;
   fire_season: FireSeasonStatus;
   timestamp: string;
 }
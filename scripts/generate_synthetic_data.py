@@ -2,24 +2,73 @@
 VIGIL Risk-Based Planning - Synthetic Data Generator
 
 Generates realistic synthetic data for utility risk management with:
-- 5,000 assets across 5 regions (NorCal, SoCal, PNW, Southwest, Mountain)
+- 5,000 assets across 5 regions (NorCal, SoCal, PNW, Southwest, Mountain),
+  or 5,000 x --scale (e.g. --scale 200 for 1M assets)
 - Real latitude/longitude for 3D map visualization
 - ML-friendly patterns for the "Hidden Discovery" feature (Water Treeing)
 - Dynamic fire season calculations
 - Vegetation encroachment with species-based growth rates
+
+Every table is built column-at-a-time from NumPy arrays drawn from one seeded
+Generator (--seed), with merges / group-bys for the cross-table lookups, so
+the same seed, scale and reference time (--as-of) always produce the same data
+and generation time grows linearly with the asset count. AMI readings, the largest table, are generated
+in batches of whole cables and streamed to parquet one row group at a time, so
+memory stays flat however long or fine-grained the time series is.
+
+Each region is an independent partition: its sizes and ID ranges are planned
+up front, its random streams are spawned from --seed, every region dates its
+rows from one reference time, and it is generated in its own worker process
+(--workers). Output is therefore identical for any worker count. Partitions are merged into one parquet file per table (the
+layout deploy.sh uploads), or kept as a hive-partitioned dataset with
+--layout dataset.
+
+Usage (from scripts/):
+    python generate_synthetic_data.py
+    python generate_synthetic_data.py --scale 200 --output-dir /data/vigil
+    python generate_synthetic_data.py --ami-interval-minutes 15 --ami-horizon-days 365
+    python generate_synthetic_data.py --scale 200 --workers 5 --layout dataset
+    python generate_synthetic_data.py --seed 7 --as-of 2026-06-01T00:00
 """
 
+import argparse
+import os
+import shutil
+import time
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
-import json
-import uuid
-from typing import List, Dict, Tuple
-
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+import pyarrow as pa
+import pyarrow.parquet as pq
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_SEED = 42
+
+# Assets generated at --scale 1 (the original demo size)
+BASE_ASSET_COUNT = 5000
+BASE_HISTORICAL_WORK_ORDERS = 300
+BASE_OPEN_WORK_ORDERS = 100
+
+# AMI time series: one reading per cable every interval over the horizon,
+# generated and written in batches of about AMI_BATCH_ROWS readings
+AMI_INTERVAL_MINUTES = 24 * 60
+AMI_HORIZON_DAYS = 90
+AMI_BATCH_ROWS = 500_000
+
+WEATHER_FORECAST_DAYS = 14
+SNAPSHOT_MONTHS = 12
+
+# Per-region tables, written as <table>/PARTITION_REGION=<code>/part-0.parquet
+# (the key is not REGION, which locations already carries as a column)
+REGIONAL_TABLES = [
+    "locations", "circuits", "assets", "vegetation", "ami_readings", "work_orders",
+    "weather", "risk_assessments", "cable_predictions", "monthly_snapshots",
+]
+PARTITION_KEY = "PARTITION_REGION"
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "synthetic")
 
 # =============================================================================
 # GEOGRAPHIC CONFIGURATION - Real utility territories
@@ -172,56 +221,68 @@ CABLE_INSULATION_TYPES = {
 }
 
 
-def generate_uuid() -> str:
-    """Generate a short UUID for IDs."""
-    return str(uuid.uuid4())[:8].upper()
+# =============================================================================
+# VECTOR HELPERS
+# =============================================================================
+
+def pick(rng: np.random.Generator, options: Sequence, size: int, p: Optional[Sequence[float]] = None) -> np.ndarray:
+    """Sample size values from options (uniform unless p is given)."""
+    return np.asarray(options, dtype=object)[rng.choice(len(options), size=size, p=p)]
 
 
-def random_date_in_range(start_date: datetime, end_date: datetime) -> datetime:
-    """Generate a random date between two dates."""
-    delta = end_date - start_date
-    random_days = random.randint(0, delta.days)
-    return start_date + timedelta(days=random_days)
+def lookup(keys: np.ndarray, mapping: Dict, default=None) -> np.ndarray:
+    """Map each key through a dict, resolving every distinct key only once."""
+    codes, uniques = pd.factorize(np.asarray(keys, dtype=object))
+    return np.array([mapping.get(key, default) for key in uniques])[codes]
 
 
-def get_fire_tier(region_config: dict) -> str:
-    """Select fire tier based on region distribution."""
-    distribution = region_config["fire_threat_distribution"]
-    return np.random.choice(
-        list(distribution.keys()),
-        p=list(distribution.values())
-    )
+def date_offsets(today: date, days) -> np.ndarray:
+    """today + days (array) as datetime.date objects, so parquet keeps date32 columns."""
+    return (np.datetime64(today, "D") + np.asarray(days, dtype="timedelta64[D]")).astype(object)
 
 
-def get_species_for_region(region: str) -> str:
-    """Get a random tree species appropriate for the region."""
-    valid_species = [s for s, config in TREE_SPECIES.items() if region in config["regions"]]
-    if not valid_species:
-        valid_species = ["BRUSH"]  # Default
-    return random.choice(valid_species)
+def make_ids(prefix: str, count: int, width: int, start: int = 1) -> List[str]:
+    """Sequential IDs like AST-000001."""
+    return [f"{prefix}-{i:0{width}d}" for i in range(start, start + count)]
 
 
-def get_clearance_requirement(voltage_class: str, fire_tier: str) -> float:
-    """Get required clearance based on voltage and fire tier."""
-    return CLEARANCE_REQUIREMENTS.get((voltage_class, fire_tier), 4.0)
+def scaled(base: float, scale: float) -> int:
+    """Row count for a --scale multiplier (at least 1)."""
+    return max(1, round(base * scale))
+
+
+def circuit_multiplier(scale: float) -> int:
+    """Larger scales add circuits rather than piling more assets onto each feeder."""
+    return max(1, round(scale))
+
+
+def plan_assets_per_circuit(rng: np.random.Generator, circuit_count: int, total_target: int) -> np.ndarray:
+    """Assets on each circuit: the even share of total_target, varied -20% / +40%."""
+    base_per_circuit = max(1, total_target // circuit_count)
+    jitter = base_per_circuit // 5
+    return np.maximum(0, base_per_circuit + rng.integers(-jitter, 2 * jitter + 1, circuit_count))
 
 
 # =============================================================================
 # LOCATION GENERATOR
 # =============================================================================
 
-def generate_locations_df() -> pd.DataFrame:
-    """Generate location/zone data."""
+def generate_locations_df(rng: np.random.Generator, regions: Optional[Sequence[str]] = None,
+                          first_id: int = 1) -> pd.DataFrame:
+    """Generate location/zone data (for the given REGIONS codes, default all)."""
     locations_data = []
-    location_counter = 1
-    
-    for region_code, region_config in REGIONS.items():
+    location_counter = first_id
+
+    for region_code in regions or list(REGIONS):
+        region_config = REGIONS[region_code]
+        distribution = region_config["fire_threat_distribution"]
+
         for loc in region_config["locations"]:
             location_id = f"LOC-{location_counter:04d}"
             location_counter += 1
-            
-            fire_tier = get_fire_tier(region_config)
-            
+
+            fire_tier = str(pick(rng, list(distribution), 1, p=list(distribution.values()))[0])
+
             locations_data.append({
                 "LOCATION_ID": location_id,
                 "ZONE_NAME": loc["name"],
@@ -236,14 +297,14 @@ def generate_locations_df() -> pd.DataFrame:
                 "REGION": region_code,
                 "CENTER_LATITUDE": loc["lat"],
                 "CENTER_LONGITUDE": loc["lon"],
-                "H3_INDEX": f"8a{random.randint(1000000, 9999999)}fffffff",
-                "AREA_SQUARE_MILES": random.uniform(50, 200),
-                "AVG_WIND_SPEED_MPH": random.uniform(5, 25),
-                "AVG_ANNUAL_RAINFALL_IN": region_config["avg_rainfall_in"] * random.uniform(0.8, 1.2),
+                "H3_INDEX": f"8a{rng.integers(1000000, 10000000)}fffffff",
+                "AREA_SQUARE_MILES": rng.uniform(50, 200),
+                "AVG_WIND_SPEED_MPH": rng.uniform(5, 25),
+                "AVG_ANNUAL_RAINFALL_IN": region_config["avg_rainfall_in"] * rng.uniform(0.8, 1.2),
                 "VEGETATION_DENSITY": loc["veg_density"],
                 "TERRAIN_TYPE": loc["terrain"],
             })
-    
+
     return pd.DataFrame(locations_data)
 
 
@@ -251,77 +312,74 @@ def generate_locations_df() -> pd.DataFrame:
 # CIRCUIT GENERATOR
 # =============================================================================
 
-def generate_circuits_df(locations_df: pd.DataFrame) -> pd.DataFrame:
-    """Generate circuit/feeder data."""
-    circuits_data = []
-    circuit_counter = 1
-    
+def generate_circuits_df(locations_df: pd.DataFrame, rng: np.random.Generator,
+                         circuits_per_location: Optional[np.ndarray] = None, first_id: int = 1,
+                         now: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate circuit/feeder data (3-6 circuits per location unless planned)."""
+    today = (now or datetime.now()).date()
+
     voltage_classes = ["4KV", "12KV", "21KV", "33KV", "69KV"]
     voltage_weights = [0.1, 0.5, 0.25, 0.1, 0.05]
-    
-    for _, loc in locations_df.iterrows():
-        # Generate 3-6 circuits per location
-        num_circuits = random.randint(3, 6)
-        
-        for i in range(num_circuits):
-            circuit_id = f"CKT-{circuit_counter:05d}"
-            circuit_counter += 1
-            
-            voltage_class = np.random.choice(voltage_classes, p=voltage_weights)
-            total_miles = random.uniform(5, 30)
-            overhead_pct = random.uniform(0.6, 0.95)
-            
-            # Last trim date in past 0-4 years
-            last_trim = datetime.now() - timedelta(days=random.randint(0, 1460))
-            trim_cycle = random.choice([2, 3, 4])  # Years
-            next_trim = last_trim + timedelta(days=trim_cycle * 365)
-            
-            circuits_data.append({
-                "CIRCUIT_ID": circuit_id,
-                "CIRCUIT_NAME": f"{loc['ZONE_NAME']} Feeder {i+1}",
-                "FEEDER_ID": f"FDR-{circuit_counter:05d}",
-                "SUBSTATION_NAME": f"{loc['ZONE_NAME']} Substation",
-                "SUBSTATION_ID": f"SUB-{loc['LOCATION_ID'][-4:]}",
-                "DISTRICT": loc["ZONE_NAME"],
-                "DIVISION": loc["REGION"],
-                "VOLTAGE_CLASS": voltage_class,
-                "CIRCUIT_TYPE": "DISTRIBUTION" if voltage_class in ["4KV", "12KV", "21KV"] else "SUBTRANSMISSION",
-                "CONSTRUCTION_TYPE": "MIXED",
-                "TOTAL_MILES": round(total_miles, 2),
-                "OVERHEAD_MILES": round(total_miles * overhead_pct, 2),
-                "UNDERGROUND_MILES": round(total_miles * (1 - overhead_pct), 2),
-                "POLE_COUNT": int(total_miles * overhead_pct * random.uniform(15, 25)),
-                "TRANSFORMER_COUNT": int(total_miles * random.uniform(3, 8)),
-                "CUSTOMER_COUNT": int(total_miles * random.uniform(50, 200)),
-                "LOCATION_ID": loc["LOCATION_ID"],
-                "FIRE_THREAT_TIER": loc["FIRE_THREAT_TIER"],
-                "PRIORITY_TIER": "P1" if loc["FIRE_THREAT_TIER"] == "TIER_3" else "P2" if loc["FIRE_THREAT_TIER"] == "TIER_2" else "P3",
-                "SAIDI_MINUTES": random.uniform(30, 180),
-                "SAIFI_COUNT": random.uniform(0.5, 2.5),
-                "MAIFI_COUNT": random.uniform(2, 10),
-                "LAST_PATROL_DATE": (datetime.now() - timedelta(days=random.randint(0, 90))).date(),
-                "LAST_TRIM_DATE": last_trim.date(),
-                "TRIM_CYCLE_YEARS": trim_cycle,
-                "NEXT_SCHEDULED_TRIM": next_trim.date(),
-            })
-    
-    return pd.DataFrame(circuits_data)
+
+    # Generate 3-6 circuits per location
+    per_location = circuits_per_location if circuits_per_location is not None else rng.integers(3, 7, len(locations_df))
+    loc_idx = np.repeat(np.arange(len(locations_df)), per_location)
+    n = len(loc_idx)
+    feeder_number = np.arange(n) - np.repeat(np.cumsum(per_location) - per_location, per_location) + 1
+
+    zone_name = locations_df["ZONE_NAME"].to_numpy()[loc_idx]
+    location_id = locations_df["LOCATION_ID"].to_numpy()[loc_idx]
+    fire_tier = locations_df["FIRE_THREAT_TIER"].to_numpy()[loc_idx]
+
+    voltage_class = pick(rng, voltage_classes, n, p=voltage_weights)
+    total_miles = rng.uniform(5, 30, n)
+    overhead_pct = rng.uniform(0.6, 0.95, n)
+
+    # Last trim date in past 0-4 years
+    last_trim_days = rng.integers(0, 1461, n)
+    trim_cycle = pick(rng, [2, 3, 4], n).astype(int)  # Years
+
+    return pd.DataFrame({
+        "CIRCUIT_ID": make_ids("CKT", n, 5, start=first_id),
+        "CIRCUIT_NAME": [f"{zone} Feeder {i}" for zone, i in zip(zone_name, feeder_number.tolist())],
+        "FEEDER_ID": make_ids("FDR", n, 5, start=first_id + 1),
+        "SUBSTATION_NAME": [f"{zone} Substation" for zone in zone_name],
+        "SUBSTATION_ID": [f"SUB-{loc[-4:]}" for loc in location_id],
+        "DISTRICT": zone_name,
+        "DIVISION": locations_df["REGION"].to_numpy()[loc_idx],
+        "VOLTAGE_CLASS": voltage_class,
+        "CIRCUIT_TYPE": np.where(np.isin(voltage_class, ["4KV", "12KV", "21KV"]), "DISTRIBUTION", "SUBTRANSMISSION"),
+        "CONSTRUCTION_TYPE": "MIXED",
+        "TOTAL_MILES": np.round(total_miles, 2),
+        "OVERHEAD_MILES": np.round(total_miles * overhead_pct, 2),
+        "UNDERGROUND_MILES": np.round(total_miles * (1 - overhead_pct), 2),
+        "POLE_COUNT": (total_miles * overhead_pct * rng.uniform(15, 25, n)).astype(int),
+        "TRANSFORMER_COUNT": (total_miles * rng.uniform(3, 8, n)).astype(int),
+        "CUSTOMER_COUNT": (total_miles * rng.uniform(50, 200, n)).astype(int),
+        "LOCATION_ID": location_id,
+        "FIRE_THREAT_TIER": fire_tier,
+        "PRIORITY_TIER": lookup(fire_tier, {"TIER_3": "P1", "TIER_2": "P2"}, "P3"),
+        "SAIDI_MINUTES": rng.uniform(30, 180, n),
+        "SAIFI_COUNT": rng.uniform(0.5, 2.5, n),
+        "MAIFI_COUNT": rng.uniform(2, 10, n),
+        "LAST_PATROL_DATE": date_offsets(today, -rng.integers(0, 91, n)),
+        "LAST_TRIM_DATE": date_offsets(today, -last_trim_days),
+        "TRIM_CYCLE_YEARS": trim_cycle,
+        "NEXT_SCHEDULED_TRIM": date_offsets(today, trim_cycle * 365 - last_trim_days),
+    }, copy=False)
 
 
 # =============================================================================
 # ASSET GENERATOR
 # =============================================================================
 
-def generate_assets_df(circuits_df: pd.DataFrame, locations_df: pd.DataFrame) -> pd.DataFrame:
-    """Generate 5,000 assets across all circuits."""
-    assets_data = []
-    asset_counter = 1
-    
-    # Calculate assets per circuit based on region targets
-    total_target = 5000
+def generate_assets_df(circuits_df: pd.DataFrame, locations_df: pd.DataFrame, rng: np.random.Generator,
+                       assets_per_circuit: Optional[np.ndarray] = None, first_id: int = 1,
+                       now: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate assets across all circuits (5,000 in total unless planned per circuit)."""
+    today = (now or datetime.now()).date()
     circuit_count = len(circuits_df)
-    base_per_circuit = total_target // circuit_count
-    
+
     asset_types = {
         "POLE": {"pct": 0.45, "subtypes": ["WOOD_POLE", "STEEL_POLE", "CONCRETE_POLE"]},
         "CONDUCTOR": {"pct": 0.30, "subtypes": ["ACSR", "AAC", "AAAC", "COVERED_CONDUCTOR"]},
@@ -329,581 +387,627 @@ def generate_assets_df(circuits_df: pd.DataFrame, locations_df: pd.DataFrame) ->
         "SWITCH": {"pct": 0.05, "subtypes": ["RECLOSER", "SECTIONALIZER", "FUSE"]},
         "CABLE_UNDERGROUND": {"pct": 0.08, "subtypes": ["PRIMARY_CABLE", "SECONDARY_CABLE"]},
     }
-    
-    for _, circuit in circuits_df.iterrows():
-        location = locations_df[locations_df["LOCATION_ID"] == circuit["LOCATION_ID"]].iloc[0]
-        
-        # Vary assets per circuit
-        num_assets = base_per_circuit + random.randint(-10, 20)
-        
-        for i in range(num_assets):
-            asset_id = f"AST-{asset_counter:06d}"
-            asset_counter += 1
-            
-            # Select asset type
-            asset_type = np.random.choice(
-                list(asset_types.keys()),
-                p=[v["pct"] for v in asset_types.values()]
-            )
-            asset_config = asset_types[asset_type]
-            asset_subtype = random.choice(asset_config["subtypes"])
-            
-            # Age distribution (older infrastructure)
-            if asset_type == "CABLE_UNDERGROUND":
-                # Underground cables: key for Water Treeing detection
-                age = random.randint(5, 35)
-                insulation_type = random.choice(list(CABLE_INSULATION_TYPES.keys()))
-                moisture_exposure = random.choice(["LOW", "MEDIUM", "HIGH"])
-                soil_type = random.choice(["SANDY", "CLAY", "LOAM", "ROCKY"])
-            else:
-                age = random.randint(3, 50)
-                insulation_type = None
-                moisture_exposure = None
-                soil_type = None
-            
-            # Position with slight randomization around circuit location
-            lat = location["CENTER_LATITUDE"] + random.uniform(-0.05, 0.05)
-            lon = location["CENTER_LONGITUDE"] + random.uniform(-0.05, 0.05)
-            
-            # Condition and risk scores
-            condition_score = max(1, min(5, int(5 - (age / 15) + random.uniform(-1, 1))))
-            
-            # Risk calculation
-            base_risk = (age / 50) * 40  # Age contribution
-            condition_risk = (5 - condition_score) * 10  # Condition contribution
-            fire_tier_risk = {"TIER_3": 25, "TIER_2": 15, "TIER_1": 5, "NON_HFTD": 0}.get(location["FIRE_THREAT_TIER"], 0)
-            composite_risk = min(100, base_risk + condition_risk + fire_tier_risk + random.uniform(-10, 10))
-            
-            assets_data.append({
-                "ASSET_ID": asset_id,
-                "ASSET_NAME": f"{asset_subtype.replace('_', ' ').title()} {asset_counter}",
-                "ASSET_TYPE": asset_type,
-                "ASSET_SUBTYPE": asset_subtype,
-                "CIRCUIT_ID": circuit["CIRCUIT_ID"],
-                "LOCATION_ID": circuit["LOCATION_ID"],
-                "PARENT_ASSET_ID": None,
-                "MANUFACTURER": random.choice(["ABB", "Siemens", "GE", "Eaton", "S&C", "Cooper"]),
-                "MODEL": f"Model-{random.randint(100, 999)}",
-                "INSTALL_DATE": (datetime.now() - timedelta(days=age * 365 + random.randint(0, 365))).date(),
-                "EXPECTED_LIFE_YEARS": {"POLE": 45, "CONDUCTOR": 40, "TRANSFORMER": 35, "SWITCH": 30, "CABLE_UNDERGROUND": 40}.get(asset_type, 40),
-                "AGE_YEARS": age,
-                "VOLTAGE_CLASS": circuit["VOLTAGE_CLASS"],
-                "PHASE": random.choice(["A", "B", "C", "ABC", "AB", "BC"]),
-                "RATED_CAPACITY": random.uniform(100, 1000),
-                "LATITUDE": round(lat, 6),
-                "LONGITUDE": round(lon, 6),
-                "ELEVATION_FT": random.uniform(100, 8000),
-                "SPAN_LENGTH_FT": random.uniform(100, 400) if asset_type == "CONDUCTOR" else None,
-                "HEIGHT_FT": random.uniform(35, 65) if asset_type == "POLE" else None,
-                "DEPTH_FT": random.uniform(3, 6) if asset_type == "CABLE_UNDERGROUND" else None,
-                "CONDITION_SCORE": condition_score,
-                "LAST_INSPECTION_DATE": (datetime.now() - timedelta(days=random.randint(30, 365))).date(),
-                "LAST_INSPECTION_TYPE": random.choice(["VISUAL", "INTRUSIVE", "DRONE", "LIDAR"]),
-                "REPLACEMENT_PRIORITY": "IMMEDIATE" if composite_risk >= 80 else "HIGH" if composite_risk >= 60 else "MEDIUM" if composite_risk >= 40 else "LOW",
-                "INSULATION_TYPE": insulation_type,
-                "CABLE_JACKET": "PVC" if asset_type == "CABLE_UNDERGROUND" else None,
-                "SOIL_TYPE": soil_type,
-                "MOISTURE_EXPOSURE": moisture_exposure,
-                "FAILURE_PROBABILITY": round(composite_risk / 200, 3),
-                "IGNITION_RISK_SCORE": round(composite_risk * random.uniform(0.8, 1.2), 1) if location["FIRE_THREAT_TIER"] in ["TIER_2", "TIER_3"] else round(composite_risk * 0.5, 1),
-                "COMPOSITE_RISK_SCORE": round(composite_risk, 1),
-                "RISK_SCORE_DATE": datetime.now().date(),
-                "STATUS": "IN_SERVICE",
-                "OPERATIONAL_FLAG": True,
-            })
-    
-    return pd.DataFrame(assets_data)
+    expected_life = {"POLE": 45, "CONDUCTOR": 40, "TRANSFORMER": 35, "SWITCH": 30, "CABLE_UNDERGROUND": 40}
+
+    per_circuit = (
+        assets_per_circuit if assets_per_circuit is not None
+        else plan_assets_per_circuit(rng, circuit_count, BASE_ASSET_COUNT)
+    )
+
+    # Circuit + location attributes for every asset, joined once per circuit
+    circuits = circuits_df[["CIRCUIT_ID", "LOCATION_ID", "VOLTAGE_CLASS"]].merge(
+        locations_df[["LOCATION_ID", "FIRE_THREAT_TIER", "CENTER_LATITUDE", "CENTER_LONGITUDE"]],
+        on="LOCATION_ID", how="left"
+    )
+    circuit_idx = np.repeat(np.arange(circuit_count), per_circuit)
+    n = len(circuit_idx)
+    circuit = {col: circuits[col].to_numpy()[circuit_idx] for col in circuits.columns}
+    fire_tier = circuit["FIRE_THREAT_TIER"]
+
+    # Select asset type, then a subtype within each type
+    type_names = list(asset_types)
+    type_code = rng.choice(len(type_names), size=n, p=[v["pct"] for v in asset_types.values()])
+    asset_type = np.asarray(type_names, dtype=object)[type_code]
+    asset_subtype = np.empty(n, dtype=object)
+    for code, config in enumerate(asset_types.values()):
+        rows = np.flatnonzero(type_code == code)
+        asset_subtype[rows] = pick(rng, config["subtypes"], len(rows))
+
+    is_cable = type_code == type_names.index("CABLE_UNDERGROUND")
+    is_pole = type_code == type_names.index("POLE")
+    is_conductor = type_code == type_names.index("CONDUCTOR")
+
+    # Age distribution (older infrastructure); underground cables are the
+    # key population for Water Treeing detection
+    age = np.where(is_cable, rng.integers(5, 36, n), rng.integers(3, 51, n))
+    insulation_type = np.where(is_cable, pick(rng, list(CABLE_INSULATION_TYPES), n), None)
+    moisture_exposure = np.where(is_cable, pick(rng, ["LOW", "MEDIUM", "HIGH"], n), None)
+    soil_type = np.where(is_cable, pick(rng, ["SANDY", "CLAY", "LOAM", "ROCKY"], n), None)
+
+    # Position with slight randomization around circuit location
+    lat = circuit["CENTER_LATITUDE"].astype(float) + rng.uniform(-0.05, 0.05, n)
+    lon = circuit["CENTER_LONGITUDE"].astype(float) + rng.uniform(-0.05, 0.05, n)
+
+    # Condition and risk scores
+    condition_score = np.clip(np.trunc(5 - (age / 15) + rng.uniform(-1, 1, n)), 1, 5).astype(int)
+
+    # Risk calculation
+    base_risk = (age / 50) * 40  # Age contribution
+    condition_risk = (5 - condition_score) * 10  # Condition contribution
+    fire_tier_risk = lookup(fire_tier, {"TIER_3": 25, "TIER_2": 15, "TIER_1": 5, "NON_HFTD": 0}, 0)
+    composite_risk = np.minimum(100, base_risk + condition_risk + fire_tier_risk + rng.uniform(-10, 10, n))
+    hftd = np.isin(fire_tier, ["TIER_2", "TIER_3"])
+
+    subtype_titles = {
+        subtype: subtype.replace("_", " ").title()
+        for config in asset_types.values() for subtype in config["subtypes"]
+    }
+
+    return pd.DataFrame({
+        "ASSET_ID": make_ids("AST", n, 6, start=first_id),
+        "ASSET_NAME": [f"{subtype_titles[s]} {i}" for s, i in zip(asset_subtype, range(first_id + 1, first_id + n + 1))],
+        "ASSET_TYPE": asset_type,
+        "ASSET_SUBTYPE": asset_subtype,
+        "CIRCUIT_ID": circuit["CIRCUIT_ID"],
+        "LOCATION_ID": circuit["LOCATION_ID"],
+        "PARENT_ASSET_ID": None,
+        "MANUFACTURER": pick(rng, ["ABB", "Siemens", "GE", "Eaton", "S&C", "Cooper"], n),
+        "MODEL": [f"Model-{m}" for m in rng.integers(100, 1000, n).tolist()],
+        "INSTALL_DATE": date_offsets(today, -(age * 365 + rng.integers(0, 366, n))),
+        "EXPECTED_LIFE_YEARS": lookup(asset_type, expected_life, 40),
+        "AGE_YEARS": age,
+        "VOLTAGE_CLASS": circuit["VOLTAGE_CLASS"],
+        "PHASE": pick(rng, ["A", "B", "C", "ABC", "AB", "BC"], n),
+        "RATED_CAPACITY": rng.uniform(100, 1000, n),
+        "LATITUDE": np.round(lat, 6),
+        "LONGITUDE": np.round(lon, 6),
+        "ELEVATION_FT": rng.uniform(100, 8000, n),
+        "SPAN_LENGTH_FT": np.where(is_conductor, rng.uniform(100, 400, n), np.nan),
+        "HEIGHT_FT": np.where(is_pole, rng.uniform(35, 65, n), np.nan),
+        "DEPTH_FT": np.where(is_cable, rng.uniform(3, 6, n), np.nan),
+        "CONDITION_SCORE": condition_score,
+        "LAST_INSPECTION_DATE": date_offsets(today, -rng.integers(30, 366, n)),
+        "LAST_INSPECTION_TYPE": pick(rng, ["VISUAL", "INTRUSIVE", "DRONE", "LIDAR"], n),
+        "REPLACEMENT_PRIORITY": np.select(
+            [composite_risk >= 80, composite_risk >= 60, composite_risk >= 40],
+            ["IMMEDIATE", "HIGH", "MEDIUM"], "LOW"
+        ),
+        "INSULATION_TYPE": insulation_type,
+        "CABLE_JACKET": np.where(is_cable, "PVC", None),
+        "SOIL_TYPE": soil_type,
+        "MOISTURE_EXPOSURE": moisture_exposure,
+        "FAILURE_PROBABILITY": np.round(composite_risk / 200, 3),
+        "IGNITION_RISK_SCORE": np.where(
+            hftd, np.round(composite_risk * rng.uniform(0.8, 1.2, n), 1), np.round(composite_risk * 0.5, 1)
+        ),
+        "COMPOSITE_RISK_SCORE": np.round(composite_risk, 1),
+        "RISK_SCORE_DATE": date_offsets(today, np.zeros(n, dtype=int)),
+        "STATUS": "IN_SERVICE",
+        "OPERATIONAL_FLAG": True,
+    }, copy=False)
 
 
 # =============================================================================
 # VEGETATION ENCROACHMENT GENERATOR
 # =============================================================================
 
-def generate_vegetation_df(assets_df: pd.DataFrame, locations_df: pd.DataFrame, circuits_df: pd.DataFrame) -> pd.DataFrame:
-    """Generate vegetation encroachment data for overhead assets."""
-    vegetation_data = []
-    veg_counter = 1
-    
-    # Only overhead assets have vegetation issues
+def generate_vegetation_df(assets_df: pd.DataFrame, locations_df: pd.DataFrame, circuits_df: pd.DataFrame,
+                           rng: np.random.Generator, first_id: int = 1,
+                           now: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate vegetation encroachment data for overhead assets (at most one per asset)."""
+    today = (now or datetime.now()).date()
+
+    # Only overhead assets have vegetation issues; 70% of them have vegetation nearby
     overhead_assets = assets_df[assets_df["ASSET_TYPE"].isin(["POLE", "CONDUCTOR"])]
-    
-    for _, asset in overhead_assets.iterrows():
-        # 70% of overhead assets have vegetation nearby
-        if random.random() > 0.70:
-            continue
-            
-        veg_id = f"VEG-{veg_counter:06d}"
-        veg_counter += 1
-        
-        location = locations_df[locations_df["LOCATION_ID"] == asset["LOCATION_ID"]].iloc[0]
-        circuit = circuits_df[circuits_df["CIRCUIT_ID"] == asset["CIRCUIT_ID"]].iloc[0]
-        
-        # Get species appropriate for region
-        species = get_species_for_region(location["REGION"])
-        species_config = TREE_SPECIES[species]
-        
-        # Get required clearance
-        required_clearance = get_clearance_requirement(
-            asset["VOLTAGE_CLASS"], 
-            location["FIRE_THREAT_TIER"]
-        )
-        
-        # Current distance - vary based on when last trimmed
-        days_since_trim = (datetime.now().date() - circuit["LAST_TRIM_DATE"]).days
-        growth_since_trim = (species_config["growth_rate_ft"] / 365) * days_since_trim
-        
-        # Base clearance after trim, then subtract growth
-        post_trim_clearance = required_clearance + random.uniform(2, 8)
-        current_distance = max(0.5, post_trim_clearance - growth_since_trim + random.uniform(-2, 2))
-        
-        # Determine clearance status
-        if current_distance < required_clearance * 0.5:
-            clearance_status = "CRITICAL"
-        elif current_distance < required_clearance:
-            clearance_status = "VIOLATION"
-        elif current_distance < required_clearance * 1.5:
-            clearance_status = "MARGINAL"
-        else:
-            clearance_status = "COMPLIANT"
-        
-        # Predict future encroachment
-        growth_30d = (species_config["growth_rate_ft"] / 365) * 30
-        growth_90d = (species_config["growth_rate_ft"] / 365) * 90
-        
-        predicted_30d = max(0, current_distance - growth_30d)
-        predicted_90d = max(0, current_distance - growth_90d)
-        
-        # Days to critical
-        if current_distance <= required_clearance * 0.5:
-            days_to_critical = 0
-        else:
-            distance_to_critical = current_distance - (required_clearance * 0.5)
-            daily_growth = species_config["growth_rate_ft"] / 365
-            days_to_critical = int(distance_to_critical / daily_growth) if daily_growth > 0 else 999
-        
-        vegetation_data.append({
-            "ENCROACHMENT_ID": veg_id,
-            "ASSET_ID": asset["ASSET_ID"],
-            "MEASUREMENT_DATE": datetime.now().date(),
-            "MEASUREMENT_SOURCE": random.choice(["LIDAR", "DRONE", "FIELD_INSPECTION"]),
-            "TREE_SPECIES": species,
-            "TREE_HEIGHT_FT": random.uniform(20, 80),
-            "TREE_CANOPY_DIAMETER_FT": random.uniform(10, 40),
-            "TREE_HEALTH": random.choice(["HEALTHY", "HEALTHY", "HEALTHY", "STRESSED", "DEAD"]),
-            "DISTANCE_TO_CONDUCTOR_FT": round(current_distance, 2),
-            "HORIZONTAL_CLEARANCE_FT": round(current_distance * random.uniform(0.8, 1.0), 2),
-            "VERTICAL_CLEARANCE_FT": round(current_distance * random.uniform(0.9, 1.1), 2),
-            "GROWTH_RATE_ANNUAL_FT": species_config["growth_rate_ft"],
-            "GROWTH_RATE_CATEGORY": species_config["category"],
-            "PREDICTED_ENCROACHMENT_30D_FT": round(growth_30d, 2),
-            "PREDICTED_ENCROACHMENT_90D_FT": round(growth_90d, 2),
-            "DAYS_TO_CRITICAL": days_to_critical,
-            "REQUIRED_CLEARANCE_FT": required_clearance,
-            "CLEARANCE_STATUS": clearance_status,
-            "IN_VIOLATION": clearance_status in ["VIOLATION", "CRITICAL"],
-            "STRIKE_POTENTIAL": "HIGH" if current_distance < 4 else "MEDIUM" if current_distance < 8 else "LOW",
-            "FALL_IN_POTENTIAL": random.random() < 0.2,
-            "BLOW_IN_POTENTIAL": random.random() < 0.3,
-        })
-    
-    return pd.DataFrame(vegetation_data)
+    overhead_assets = overhead_assets[rng.random(len(overhead_assets)) <= 0.70]
+
+    # Location, circuit and GO95 clearance attributes by join (left joins keep asset order)
+    clearance_df = pd.DataFrame(
+        [(voltage, tier, feet) for (voltage, tier), feet in CLEARANCE_REQUIREMENTS.items()],
+        columns=["VOLTAGE_CLASS", "FIRE_THREAT_TIER", "REQUIRED_CLEARANCE_FT"]
+    )
+    spans = (
+        overhead_assets[["ASSET_ID", "LOCATION_ID", "CIRCUIT_ID", "VOLTAGE_CLASS"]]
+        .merge(locations_df[["LOCATION_ID", "REGION", "FIRE_THREAT_TIER"]], on="LOCATION_ID", how="left")
+        .merge(circuits_df[["CIRCUIT_ID", "LAST_TRIM_DATE"]], on="CIRCUIT_ID", how="left")
+        .merge(clearance_df, on=["VOLTAGE_CLASS", "FIRE_THREAT_TIER"], how="left")
+    )
+    n = len(spans)
+
+    # Get species appropriate for each region
+    species = np.empty(n, dtype=object)
+    for region, rows in spans.groupby("REGION").indices.items():
+        valid_species = [s for s, config in TREE_SPECIES.items() if region in config["regions"]] or ["BRUSH"]
+        species[rows] = pick(rng, valid_species, len(rows))
+    growth_rate = lookup(species, {s: config["growth_rate_ft"] for s, config in TREE_SPECIES.items()}).astype(float)
+    daily_growth = growth_rate / 365
+
+    required_clearance = spans["REQUIRED_CLEARANCE_FT"].fillna(4.0).to_numpy()
+
+    # Current distance - vary based on when last trimmed
+    last_trim = spans["LAST_TRIM_DATE"].to_numpy().astype("datetime64[D]")
+    days_since_trim = (np.datetime64(today, "D") - last_trim).astype(int)
+    growth_since_trim = daily_growth * days_since_trim
+
+    # Base clearance after trim, then subtract growth
+    post_trim_clearance = required_clearance + rng.uniform(2, 8, n)
+    current_distance = np.maximum(0.5, post_trim_clearance - growth_since_trim + rng.uniform(-2, 2, n))
+
+    # Determine clearance status
+    clearance_status = np.select(
+        [current_distance < required_clearance * 0.5,
+         current_distance < required_clearance,
+         current_distance < required_clearance * 1.5],
+        ["CRITICAL", "VIOLATION", "MARGINAL"], "COMPLIANT"
+    )
+
+    # Predict future encroachment
+    growth_30d = daily_growth * 30
+    growth_90d = daily_growth * 90
+
+    # Days to critical
+    distance_to_critical = current_distance - (required_clearance * 0.5)
+    days_to_critical = np.where(distance_to_critical <= 0, 0, np.trunc(distance_to_critical / daily_growth)).astype(int)
+
+    return pd.DataFrame({
+        "ENCROACHMENT_ID": make_ids("VEG", n, 6, start=first_id),
+        "ASSET_ID": spans["ASSET_ID"].to_numpy(),
+        "MEASUREMENT_DATE": date_offsets(today, np.zeros(n, dtype=int)),
+        "MEASUREMENT_SOURCE": pick(rng, ["LIDAR", "DRONE", "FIELD_INSPECTION"], n),
+        "TREE_SPECIES": species,
+        "TREE_HEIGHT_FT": rng.uniform(20, 80, n),
+        "TREE_CANOPY_DIAMETER_FT": rng.uniform(10, 40, n),
+        "TREE_HEALTH": pick(rng, ["HEALTHY", "HEALTHY", "HEALTHY", "STRESSED", "DEAD"], n),
+        "DISTANCE_TO_CONDUCTOR_FT": np.round(current_distance, 2),
+        "HORIZONTAL_CLEARANCE_FT": np.round(current_distance * rng.uniform(0.8, 1.0, n), 2),
+        "VERTICAL_CLEARANCE_FT": np.round(current_distance * rng.uniform(0.9, 1.1, n), 2),
+        "GROWTH_RATE_ANNUAL_FT": growth_rate,
+        "GROWTH_RATE_CATEGORY": lookup(species, {s: config["category"] for s, config in TREE_SPECIES.items()}),
+        "PREDICTED_ENCROACHMENT_30D_FT": np.round(growth_30d, 2),
+        "PREDICTED_ENCROACHMENT_90D_FT": np.round(growth_90d, 2),
+        "DAYS_TO_CRITICAL": days_to_critical,
+        "REQUIRED_CLEARANCE_FT": required_clearance,
+        "CLEARANCE_STATUS": clearance_status,
+        "IN_VIOLATION": np.isin(clearance_status, ["VIOLATION", "CRITICAL"]),
+        "STRIKE_POTENTIAL": np.select([current_distance < 4, current_distance < 8], ["HIGH", "MEDIUM"], "LOW"),
+        "FALL_IN_POTENTIAL": rng.random(n) < 0.2,
+        "BLOW_IN_POTENTIAL": rng.random(n) < 0.3,
+    }, copy=False)
 
 
 # =============================================================================
 # AMI READING GENERATOR - THE HIDDEN DISCOVERY (Water Treeing)
 # =============================================================================
 
-def generate_ami_readings_df(assets_df: pd.DataFrame) -> pd.DataFrame:
+def _ami_reading_block(rng: np.random.Generator, cable_ids: np.ndarray, problem_cable: np.ndarray,
+                       timestamps: np.ndarray, reading_day: np.ndarray, first_reading: int) -> pd.DataFrame:
+    """Readings for a batch of cables: one row per cable per interval, newest first."""
+    cables, per_cable = len(cable_ids), len(timestamps)
+    n = cables * per_cable
+    days = int(reading_day[-1]) + 1 if per_cable else 0
+    is_problem_cable = np.repeat(problem_cable, per_cable)
+
+    # Simulate weather: rain is drawn per cable per day and shared by that day's readings
+    rainy_day = rng.random((cables, days)) < 0.25  # 25% chance of rain
+    rain_day_mm = np.where(rainy_day, rng.uniform(10, 50, (cables, days)), 0.0)
+    is_rainy = rainy_day[:, reading_day].ravel()
+    rainfall_mm = rain_day_mm[:, reading_day].ravel()
+    del rainy_day, rain_day_mm
+    soil_moisture = 30 + (rainfall_mm * 0.5) + rng.uniform(-5, 5, n)
+
+    # Base voltage
+    nominal_voltage = 120.0
+    base_voltage = nominal_voltage * rng.uniform(0.98, 1.02, n)
+
+    # THE WATER TREEING PATTERN: problem cables show voltage dips during
+    # rain, plus occasional dips even without rain (early stage)
+    rain_correlated_dip = is_problem_cable & is_rainy & (rainfall_mm > 10)
+    early_dip = is_problem_cable & ~rain_correlated_dip & (rng.random(n) < 0.1)
+    voltage_dip_pct = np.select(
+        [rain_correlated_dip, early_dip],
+        [rng.uniform(2.0, 5.0, n), rng.uniform(1.0, 2.5, n)], 0.0
+    )
+    voltage_dip_flag = rain_correlated_dip | early_dip
+    voltage = base_voltage * (1 - voltage_dip_pct / 100)
+
+    return pd.DataFrame({
+        "READING_ID": make_ids("AMI", n, 8, start=first_reading),
+        "ASSET_ID": np.repeat(cable_ids, per_cable),
+        "READING_TIMESTAMP": np.tile(timestamps, cables),
+        "VOLTAGE_A": np.round(voltage * rng.uniform(0.99, 1.01, n), 2),
+        "VOLTAGE_B": np.round(voltage * rng.uniform(0.99, 1.01, n), 2),
+        "VOLTAGE_C": np.round(voltage * rng.uniform(0.99, 1.01, n), 2),
+        "VOLTAGE_AVG": np.round(voltage, 2),
+        "VOLTAGE_NOMINAL": nominal_voltage,
+        "VOLTAGE_DIP_PCT": np.round(voltage_dip_pct, 2),
+        "VOLTAGE_DIP_FLAG": voltage_dip_flag,
+        "DIP_DURATION_SECONDS": np.where(voltage_dip_flag, rng.integers(100, 501, n), 0),
+        "RAINFALL_MM": np.round(rainfall_mm, 1),
+        "SOIL_MOISTURE_PCT": np.round(soil_moisture, 1),
+        "TEMPERATURE_F": rng.uniform(40, 90, n),
+        "RAIN_CORRELATED_DIP": rain_correlated_dip,
+        "CONSECUTIVE_DIP_COUNT": 0,  # Would be calculated in production
+        "CURRENT_A": np.round(rng.uniform(50, 200, n), 2),
+        "CURRENT_B": np.round(rng.uniform(50, 200, n), 2),
+        "CURRENT_C": np.round(rng.uniform(50, 200, n), 2),
+        "POWER_KW": np.round(rng.uniform(100, 500, n), 2),
+        "POWER_FACTOR": np.round(rng.uniform(0.85, 0.98, n), 2),
+        "READING_QUALITY": "VALID",
+    }, copy=False)
+
+
+def iter_ami_reading_batches(assets_df: pd.DataFrame, rng: np.random.Generator,
+                             horizon_days: int = AMI_HORIZON_DAYS,
+                             interval_minutes: int = AMI_INTERVAL_MINUTES,
+                             batch_rows: int = AMI_BATCH_ROWS,
+                             now: Optional[datetime] = None, first_reading: int = 1) -> Iterator[pd.DataFrame]:
     """
-    Generate AMI (smart meter) readings for underground cables.
-    
+    Generate AMI (smart meter) readings for underground cables, batch by batch.
+
     THE HIDDEN DISCOVERY: Water Treeing Detection
     - Cables with XLPE insulation, age 15-25 years, high moisture exposure
     - Show voltage dips (2-5%) correlated with rainfall events
     - Pattern: voltage_dip_flag = TRUE when rainfall_mm > 10
+
+    One reading per cable every interval_minutes over the last horizon_days.
+    Each batch holds whole cables and about batch_rows readings, so memory is
+    bounded by the batch, not by cables x readings. Readings depend on the
+    generator state, so the same seed and settings (including batch_rows)
+    reproduce the same data.
     """
-    ami_data = []
-    reading_counter = 1
-    
+    now = now or datetime.now()
+
     # Get underground cables
     ug_cables = assets_df[assets_df["ASSET_TYPE"] == "CABLE_UNDERGROUND"]
-    
+    cable_ids = ug_cables["ASSET_ID"].to_numpy()
+
     # Identify "problem cables" - THE HIDDEN DISCOVERY PATTERN
-    problem_cables = ug_cables[
+    problem_cable = (
         (ug_cables["INSULATION_TYPE"] == "XLPE") &
         (ug_cables["AGE_YEARS"] >= 15) &
         (ug_cables["AGE_YEARS"] <= 25) &
         (ug_cables["MOISTURE_EXPOSURE"].isin(["MEDIUM", "HIGH"]))
-    ]["ASSET_ID"].tolist()
-    
-    # Generate 90 days of readings
-    for _, cable in ug_cables.iterrows():
-        is_problem_cable = cable["ASSET_ID"] in problem_cables
-        
-        for day_offset in range(90):
-            reading_date = datetime.now() - timedelta(days=day_offset)
-            
-            # Simulate weather
-            is_rainy = random.random() < 0.25  # 25% chance of rain
-            rainfall_mm = random.uniform(10, 50) if is_rainy else 0
-            soil_moisture = 30 + (rainfall_mm * 0.5) + random.uniform(-5, 5)
-            
-            # Base voltage
-            nominal_voltage = 120.0
-            base_voltage = nominal_voltage * random.uniform(0.98, 1.02)
-            
-            # THE WATER TREEING PATTERN
-            if is_problem_cable and is_rainy and rainfall_mm > 10:
-                # Problem cables show voltage dips during rain
-                voltage_dip_pct = random.uniform(2.0, 5.0)
-                voltage = base_voltage * (1 - voltage_dip_pct / 100)
-                voltage_dip_flag = True
-                rain_correlated_dip = True
-            elif is_problem_cable and random.random() < 0.1:
-                # Occasional dips even without rain (early stage)
-                voltage_dip_pct = random.uniform(1.0, 2.5)
-                voltage = base_voltage * (1 - voltage_dip_pct / 100)
-                voltage_dip_flag = True
-                rain_correlated_dip = False
-            else:
-                # Normal operation
-                voltage = base_voltage
-                voltage_dip_pct = 0
-                voltage_dip_flag = False
-                rain_correlated_dip = False
-            
-            reading_id = f"AMI-{reading_counter:08d}"
-            reading_counter += 1
-            
-            ami_data.append({
-                "READING_ID": reading_id,
-                "ASSET_ID": cable["ASSET_ID"],
-                "READING_TIMESTAMP": reading_date,
-                "VOLTAGE_A": round(voltage * random.uniform(0.99, 1.01), 2),
-                "VOLTAGE_B": round(voltage * random.uniform(0.99, 1.01), 2),
-                "VOLTAGE_C": round(voltage * random.uniform(0.99, 1.01), 2),
-                "VOLTAGE_AVG": round(voltage, 2),
-                "VOLTAGE_NOMINAL": nominal_voltage,
-                "VOLTAGE_DIP_PCT": round(voltage_dip_pct, 2),
-                "VOLTAGE_DIP_FLAG": voltage_dip_flag,
-                "DIP_DURATION_SECONDS": random.randint(100, 500) if voltage_dip_flag else 0,
-                "RAINFALL_MM": round(rainfall_mm, 1),
-                "SOIL_MOISTURE_PCT": round(soil_moisture, 1),
-                "TEMPERATURE_F": random.uniform(40, 90),
-                "RAIN_CORRELATED_DIP": rain_correlated_dip,
-                "CONSECUTIVE_DIP_COUNT": 0,  # Would be calculated in production
-                "CURRENT_A": round(random.uniform(50, 200), 2),
-                "CURRENT_B": round(random.uniform(50, 200), 2),
-                "CURRENT_C": round(random.uniform(50, 200), 2),
-                "POWER_KW": round(random.uniform(100, 500), 2),
-                "POWER_FACTOR": round(random.uniform(0.85, 0.98), 2),
-                "READING_QUALITY": "VALID",
-            })
-    
-    return pd.DataFrame(ami_data)
+    ).to_numpy()
+
+    # Reading schedule shared by every cable (minutes before now)
+    offsets = np.arange(0, horizon_days * 24 * 60, interval_minutes)
+    timestamps = np.datetime64(now, "us") - offsets.astype("timedelta64[m]")
+    reading_day = offsets // (24 * 60)
+    cables_per_batch = max(1, batch_rows // max(len(offsets), 1))
+
+    # Always yield at least one (possibly empty) batch so writers get a schema
+    for start in range(0, max(len(cable_ids), 1), cables_per_batch):
+        batch = slice(start, start + cables_per_batch)
+        yield _ami_reading_block(
+            rng, cable_ids[batch], problem_cable[batch], timestamps, reading_day,
+            first_reading=first_reading + start * len(offsets)
+        )
+
+
+def generate_ami_readings_df(assets_df: pd.DataFrame, rng: np.random.Generator, **kwargs) -> pd.DataFrame:
+    """All AMI readings as one DataFrame (small scales; see write_ami_readings)."""
+    return pd.concat(iter_ami_reading_batches(assets_df, rng, **kwargs), ignore_index=True)
+
+
+def summarize_ami_readings(ami_df: pd.DataFrame, now: datetime) -> pd.DataFrame:
+    """Per-cable Water Treeing inputs (reading, dip and rain counts) indexed by ASSET_ID."""
+    dip_flag = ami_df["VOLTAGE_DIP_FLAG"]
+    return pd.DataFrame({
+        "ASSET_ID": ami_df["ASSET_ID"],
+        "READINGS": 1,
+        "DIPS": dip_flag,
+        "DIPS_30D": dip_flag & (ami_df["READING_TIMESTAMP"] >= now - timedelta(days=30)),
+        "DIP_PCT": ami_df["VOLTAGE_DIP_PCT"].where(dip_flag, 0.0),
+        "RAIN_DIPS": ami_df["RAIN_CORRELATED_DIP"],
+        "RAIN_EVENTS": ami_df["RAINFALL_MM"] > 10,
+    }).groupby("ASSET_ID", sort=False).sum()
+
+
+def write_ami_readings(assets_df: pd.DataFrame, path: str, rng: np.random.Generator,
+                       now: Optional[datetime] = None, **kwargs) -> Tuple[int, int, pd.DataFrame]:
+    """
+    Stream AMI readings to a parquet file, one row group per batch.
+
+    Returns (readings written, row groups, per-cable summary for the cable
+    failure predictions), so the readings never have to be held in memory.
+    """
+    now = now or datetime.now()
+    rows = row_groups = 0
+    summaries = []
+    writer = None
+    try:
+        for batch in iter_ami_reading_batches(assets_df, rng, now=now, **kwargs):
+            table = pa.Table.from_pandas(batch, schema=writer.schema if writer else None, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table, row_group_size=max(len(batch), 1))
+            rows += len(batch)
+            row_groups += 1
+            summaries.append(summarize_ami_readings(batch, now))
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows, row_groups, pd.concat(summaries)
 
 
 # =============================================================================
 # WORK ORDER GENERATOR
 # =============================================================================
 
-def generate_work_orders_df(assets_df: pd.DataFrame, vegetation_df: pd.DataFrame) -> pd.DataFrame:
-    """Generate historical and open work orders."""
-    work_orders = []
-    wo_counter = 1
-    
+def generate_work_orders_df(assets_df: pd.DataFrame, vegetation_df: pd.DataFrame, rng: np.random.Generator,
+                            historical_count: int = BASE_HISTORICAL_WORK_ORDERS,
+                            open_limit: int = BASE_OPEN_WORK_ORDERS, first_id: int = 1,
+                            now: Optional[datetime] = None) -> pd.DataFrame:
+    """Generate historical and open work orders (open ones for the first open_limit violations)."""
+    now = now or datetime.now()
+    today = now.date()
+    contractors = ["Davey Tree", "Asplundh", "Wright Tree Service"]
+
     # Historical completed work orders (past 2 years)
-    for i in range(300):
-        wo_id = f"WO-{wo_counter:06d}"
-        wo_counter += 1
-        
-        asset = assets_df.sample(1).iloc[0]
-        
-        activity_type = random.choice(["TRIM", "TRIM", "TRIM", "INSPECT", "REPAIR", "REPLACE"])
-        completion_date = datetime.now() - timedelta(days=random.randint(30, 730))
-        
-        work_orders.append({
-            "WORK_ORDER_ID": wo_id,
-            "WORK_ORDER_NUMBER": f"WO-{datetime.now().year}-{wo_counter:05d}",
-            "ASSET_ID": asset["ASSET_ID"],
-            "CIRCUIT_ID": asset["CIRCUIT_ID"],
-            "LOCATION_ID": asset["LOCATION_ID"],
-            "ACTIVITY_TYPE": activity_type,
-            "WORK_TYPE": random.choice(["ROUTINE", "CORRECTIVE", "PREVENTIVE"]),
-            "PRIORITY": random.choice(["HIGH", "MEDIUM", "LOW"]),
-            "DESCRIPTION": f"{activity_type} work on {asset['ASSET_TYPE']}",
-            "SCOPE_NOTES": f"Standard {activity_type.lower()} procedure",
-            "ESTIMATED_HOURS": random.uniform(2, 16),
-            "ESTIMATED_COST": random.uniform(500, 5000),
-            "TREES_TO_TRIM": random.randint(5, 50) if activity_type == "TRIM" else None,
-            "ESTIMATED_MILES": random.uniform(0.5, 5) if activity_type == "TRIM" else None,
-            "SPECIES_TARGET": None,
-            "REQUESTED_DATE": (completion_date - timedelta(days=random.randint(7, 30))).date(),
-            "SCHEDULED_DATE": (completion_date - timedelta(days=random.randint(1, 7))).date(),
-            "DUE_DATE": completion_date.date(),
-            "COMPLETION_DATE": completion_date.date(),
-            "STATUS": "COMPLETED",
-            "ACTUAL_HOURS": random.uniform(2, 20),
-            "ACTUAL_COST": random.uniform(500, 6000),
-            "MILES_TRIMMED": random.uniform(0.5, 5) if activity_type == "TRIM" else None,
-            "TREES_TRIMMED": random.randint(5, 60) if activity_type == "TRIM" else None,
-            "ASSIGNED_CREW": f"Crew-{random.randint(1, 20)}",
-            "CONTRACTOR": random.choice(["Davey Tree", "Asplundh", "Wright Tree Service", "Internal Crew"]),
-            "PRE_WORK_RISK_SCORE": random.uniform(40, 80),
-            "POST_WORK_RISK_SCORE": random.uniform(20, 50),
-            "RISK_REDUCTION_VALUE": random.uniform(10, 40),
-            "CREATED_BY": "system",
-            "CREATED_SOURCE": "PATROL",
-        })
-    
+    n = historical_count
+    asset = assets_df.iloc[rng.integers(0, len(assets_df), n)]
+    activity_type = pick(rng, ["TRIM", "TRIM", "TRIM", "INSPECT", "REPAIR", "REPLACE"], n)
+    is_trim = activity_type == "TRIM"
+    completion_days = -rng.integers(30, 731, n)
+
+    historical = pd.DataFrame({
+        "WORK_ORDER_ID": make_ids("WO", n, 6, start=first_id),
+        "WORK_ORDER_NUMBER": [f"WO-{now.year}-{i:05d}" for i in range(first_id + 1, first_id + n + 1)],
+        "ASSET_ID": asset["ASSET_ID"].to_numpy(),
+        "CIRCUIT_ID": asset["CIRCUIT_ID"].to_numpy(),
+        "LOCATION_ID": asset["LOCATION_ID"].to_numpy(),
+        "ACTIVITY_TYPE": activity_type,
+        "WORK_TYPE": pick(rng, ["ROUTINE", "CORRECTIVE", "PREVENTIVE"], n),
+        "PRIORITY": pick(rng, ["HIGH", "MEDIUM", "LOW"], n),
+        "DESCRIPTION": [f"{a} work on {t}" for a, t in zip(activity_type, asset["ASSET_TYPE"].to_numpy())],
+        "SCOPE_NOTES": [f"Standard {a.lower()} procedure" for a in activity_type],
+        "ESTIMATED_HOURS": rng.uniform(2, 16, n),
+        "ESTIMATED_COST": rng.uniform(500, 5000, n),
+        "TREES_TO_TRIM": np.where(is_trim, rng.integers(5, 51, n), np.nan),
+        "ESTIMATED_MILES": np.where(is_trim, rng.uniform(0.5, 5, n), np.nan),
+        "SPECIES_TARGET": None,
+        "REQUESTED_DATE": date_offsets(today, completion_days - rng.integers(7, 31, n)),
+        "SCHEDULED_DATE": date_offsets(today, completion_days - rng.integers(1, 8, n)),
+        "DUE_DATE": date_offsets(today, completion_days),
+        "COMPLETION_DATE": date_offsets(today, completion_days),
+        "STATUS": "COMPLETED",
+        "ACTUAL_HOURS": rng.uniform(2, 20, n),
+        "ACTUAL_COST": rng.uniform(500, 6000, n),
+        "MILES_TRIMMED": np.where(is_trim, rng.uniform(0.5, 5, n), np.nan),
+        "TREES_TRIMMED": np.where(is_trim, rng.integers(5, 61, n), np.nan),
+        "ASSIGNED_CREW": [f"Crew-{c}" for c in rng.integers(1, 21, n).tolist()],
+        "CONTRACTOR": pick(rng, contractors + ["Internal Crew"], n),
+        "PRE_WORK_RISK_SCORE": rng.uniform(40, 80, n),
+        "POST_WORK_RISK_SCORE": rng.uniform(20, 50, n),
+        "RISK_REDUCTION_VALUE": rng.uniform(10, 40, n),
+        "CREATED_BY": "system",
+        "CREATED_SOURCE": "PATROL",
+    }, copy=False)
+
     # Open work orders (based on vegetation violations)
     violations = vegetation_df[vegetation_df["CLEARANCE_STATUS"].isin(["VIOLATION", "CRITICAL"])]
-    
-    for _, veg in violations.head(100).iterrows():
-        wo_id = f"WO-{wo_counter:06d}"
-        wo_counter += 1
-        
-        asset = assets_df[assets_df["ASSET_ID"] == veg["ASSET_ID"]].iloc[0]
-        
-        priority = "EMERGENCY" if veg["CLEARANCE_STATUS"] == "CRITICAL" else "URGENT"
-        status = random.choice(["SUBMITTED", "APPROVED", "SCHEDULED", "IN_PROGRESS"])
-        
-        work_orders.append({
-            "WORK_ORDER_ID": wo_id,
-            "WORK_ORDER_NUMBER": f"WO-{datetime.now().year}-{wo_counter:05d}",
-            "ASSET_ID": asset["ASSET_ID"],
-            "CIRCUIT_ID": asset["CIRCUIT_ID"],
-            "LOCATION_ID": asset["LOCATION_ID"],
-            "ACTIVITY_TYPE": "TRIM",
-            "WORK_TYPE": "CORRECTIVE",
-            "PRIORITY": priority,
-            "DESCRIPTION": f"Vegetation clearance - {veg['TREE_SPECIES']} at {veg['DISTANCE_TO_CONDUCTOR_FT']:.1f}ft",
-            "SCOPE_NOTES": f"Required clearance: {veg['REQUIRED_CLEARANCE_FT']}ft. Current: {veg['DISTANCE_TO_CONDUCTOR_FT']:.1f}ft",
-            "ESTIMATED_HOURS": random.uniform(2, 8),
-            "ESTIMATED_COST": random.uniform(500, 2000),
-            "TREES_TO_TRIM": random.randint(1, 10),
-            "ESTIMATED_MILES": None,
-            "SPECIES_TARGET": veg["TREE_SPECIES"],
-            "REQUESTED_DATE": datetime.now().date(),
-            "SCHEDULED_DATE": (datetime.now() + timedelta(days=random.randint(1, 14))).date() if status in ["SCHEDULED", "IN_PROGRESS"] else None,
-            "DUE_DATE": (datetime.now() + timedelta(days=7 if priority == "EMERGENCY" else 14)).date(),
-            "COMPLETION_DATE": None,
-            "STATUS": status,
-            "ACTUAL_HOURS": None,
-            "ACTUAL_COST": None,
-            "MILES_TRIMMED": None,
-            "TREES_TRIMMED": None,
-            "ASSIGNED_CREW": f"Crew-{random.randint(1, 20)}" if status in ["SCHEDULED", "IN_PROGRESS"] else None,
-            "CONTRACTOR": random.choice(["Davey Tree", "Asplundh", "Wright Tree Service"]),
-            "PRE_WORK_RISK_SCORE": asset["COMPOSITE_RISK_SCORE"],
-            "POST_WORK_RISK_SCORE": None,
-            "RISK_REDUCTION_VALUE": None,
-            "CREATED_BY": "VIGIL_AI",
-            "CREATED_SOURCE": "VIGIL_AI",
-        })
-    
-    return pd.DataFrame(work_orders)
+    violations = violations.head(open_limit).merge(
+        assets_df[["ASSET_ID", "CIRCUIT_ID", "LOCATION_ID", "COMPOSITE_RISK_SCORE"]], on="ASSET_ID", how="left"
+    )
+    m = len(violations)
+
+    priority = np.where(violations["CLEARANCE_STATUS"].to_numpy() == "CRITICAL", "EMERGENCY", "URGENT")
+    status = pick(rng, ["SUBMITTED", "APPROVED", "SCHEDULED", "IN_PROGRESS"], m)
+    scheduled = np.isin(status, ["SCHEDULED", "IN_PROGRESS"])
+    species = violations["TREE_SPECIES"].to_numpy()
+    distance = violations["DISTANCE_TO_CONDUCTOR_FT"].to_numpy()
+    required = violations["REQUIRED_CLEARANCE_FT"].to_numpy()
+
+    open_orders = pd.DataFrame({
+        "WORK_ORDER_ID": make_ids("WO", m, 6, start=first_id + n),
+        "WORK_ORDER_NUMBER": [f"WO-{now.year}-{i:05d}" for i in range(first_id + n + 1, first_id + n + m + 1)],
+        "ASSET_ID": violations["ASSET_ID"].to_numpy(),
+        "CIRCUIT_ID": violations["CIRCUIT_ID"].to_numpy(),
+        "LOCATION_ID": violations["LOCATION_ID"].to_numpy(),
+        "ACTIVITY_TYPE": "TRIM",
+        "WORK_TYPE": "CORRECTIVE",
+        "PRIORITY": priority,
+        "DESCRIPTION": [f"Vegetation clearance - {s} at {d:.1f}ft" for s, d in zip(species, distance)],
+        "SCOPE_NOTES": [f"Required clearance: {r}ft. Current: {d:.1f}ft" for r, d in zip(required.tolist(), distance)],
+        "ESTIMATED_HOURS": rng.uniform(2, 8, m),
+        "ESTIMATED_COST": rng.uniform(500, 2000, m),
+        "TREES_TO_TRIM": rng.integers(1, 11, m).astype(float),
+        "ESTIMATED_MILES": np.nan,
+        "SPECIES_TARGET": species,
+        "REQUESTED_DATE": date_offsets(today, np.zeros(m, dtype=int)),
+        "SCHEDULED_DATE": np.where(scheduled, date_offsets(today, rng.integers(1, 15, m)), None),
+        "DUE_DATE": date_offsets(today, np.where(priority == "EMERGENCY", 7, 14)),
+        "COMPLETION_DATE": None,
+        "STATUS": status,
+        "ACTUAL_HOURS": np.nan,
+        "ACTUAL_COST": np.nan,
+        "MILES_TRIMMED": np.nan,
+        "TREES_TRIMMED": np.nan,
+        "ASSIGNED_CREW": np.where(scheduled, [f"Crew-{c}" for c in rng.integers(1, 21, m).tolist()], None),
+        "CONTRACTOR": pick(rng, contractors, m),
+        "PRE_WORK_RISK_SCORE": violations["COMPOSITE_RISK_SCORE"].to_numpy(),
+        "POST_WORK_RISK_SCORE": np.nan,
+        "RISK_REDUCTION_VALUE": np.nan,
+        "CREATED_BY": "VIGIL_AI",
+        "CREATED_SOURCE": "VIGIL_AI",
+    }, copy=False)
+
+    return pd.concat([historical, open_orders], ignore_index=True).infer_objects()
 
 
 # =============================================================================
 # WEATHER FORECAST GENERATOR
 # =============================================================================
 
-def generate_weather_df(locations_df: pd.DataFrame) -> pd.DataFrame:
+def generate_weather_df(locations_df: pd.DataFrame, rng: np.random.Generator, days: int = WEATHER_FORECAST_DAYS,
+                        first_id: int = 1, now: Optional[datetime] = None) -> pd.DataFrame:
     """Generate 14-day weather forecasts per location."""
-    weather_data = []
-    forecast_counter = 1
-    
-    for _, location in locations_df.iterrows():
-        region = location["REGION"]
-        base_temp = {"NORCAL": 70, "SOCAL": 80, "PNW": 60, "SOUTHWEST": 95, "MOUNTAIN": 65}.get(region, 70)
-        
-        for day_offset in range(14):
-            forecast_date = datetime.now().date() + timedelta(days=day_offset)
-            
-            # Fire weather conditions more likely in certain regions
-            fire_weather_prob = {"NORCAL": 0.15, "SOCAL": 0.20, "PNW": 0.05, "SOUTHWEST": 0.10, "MOUNTAIN": 0.10}.get(region, 0.1)
-            is_fire_weather = random.random() < fire_weather_prob
-            
-            wind_speed = random.uniform(25, 60) if is_fire_weather else random.uniform(5, 20)
-            humidity = random.uniform(5, 20) if is_fire_weather else random.uniform(30, 70)
-            
-            forecast_id = f"WX-{forecast_counter:06d}"
-            forecast_counter += 1
-            
-            weather_data.append({
-                "FORECAST_ID": forecast_id,
-                "LOCATION_ID": location["LOCATION_ID"],
-                "FORECAST_DATE": forecast_date,
-                "FORECAST_HOUR": 12,
-                "SOURCE": "NWS",
-                "ISSUED_AT": datetime.now(),
-                "TEMPERATURE_F": base_temp + random.uniform(-10, 10),
-                "TEMPERATURE_MAX_F": base_temp + random.uniform(5, 15),
-                "TEMPERATURE_MIN_F": base_temp + random.uniform(-15, -5),
-                "WIND_SPEED_MPH": round(wind_speed, 1),
-                "WIND_GUST_MPH": round(wind_speed * random.uniform(1.3, 1.8), 1),
-                "WIND_DIRECTION": random.choice(["N", "NE", "E", "SE", "S", "SW", "W", "NW"]),
-                "HUMIDITY_PCT": round(humidity, 1),
-                "PRECIPITATION_PROBABILITY": 0.05 if is_fire_weather else random.uniform(0, 0.4),
-                "PRECIPITATION_AMOUNT_IN": 0 if is_fire_weather else random.uniform(0, 0.5),
-                "PRECIPITATION_TYPE": "NONE" if is_fire_weather else random.choice(["NONE", "NONE", "RAIN"]),
-                "RED_FLAG_WARNING": is_fire_weather and wind_speed > 40,
-                "FIRE_WEATHER_WATCH": is_fire_weather and wind_speed > 30,
-                "WIND_ADVISORY": wind_speed > 35,
-                "FIRE_WEATHER_INDEX": round(wind_speed * (100 - humidity) / 100, 1),
-                "PSPS_PROBABILITY": round(min(1.0, wind_speed / 60 * (100 - humidity) / 100), 2) if is_fire_weather else 0,
-            })
-    
-    return pd.DataFrame(weather_data)
+    now = now or datetime.now()
+
+    n = len(locations_df) * days
+    region = np.repeat(locations_df["REGION"].to_numpy(), days)
+    day_offset = np.tile(np.arange(days), len(locations_df))
+    base_temp = lookup(region, {"NORCAL": 70, "SOCAL": 80, "PNW": 60, "SOUTHWEST": 95, "MOUNTAIN": 65}, 70)
+
+    # Fire weather conditions more likely in certain regions
+    fire_weather_prob = lookup(region, {"NORCAL": 0.15, "SOCAL": 0.20, "PNW": 0.05, "SOUTHWEST": 0.10, "MOUNTAIN": 0.10}, 0.1)
+    is_fire_weather = rng.random(n) < fire_weather_prob
+
+    wind_speed = np.where(is_fire_weather, rng.uniform(25, 60, n), rng.uniform(5, 20, n))
+    humidity = np.where(is_fire_weather, rng.uniform(5, 20, n), rng.uniform(30, 70, n))
+
+    return pd.DataFrame({
+        "FORECAST_ID": make_ids("WX", n, 6, start=first_id),
+        "LOCATION_ID": np.repeat(locations_df["LOCATION_ID"].to_numpy(), days),
+        "FORECAST_DATE": date_offsets(now.date(), day_offset),
+        "FORECAST_HOUR": 12,
+        "SOURCE": "NWS",
+        "ISSUED_AT": np.full(n, np.datetime64(now, "us")),
+        "TEMPERATURE_F": base_temp + rng.uniform(-10, 10, n),
+        "TEMPERATURE_MAX_F": base_temp + rng.uniform(5, 15, n),
+        "TEMPERATURE_MIN_F": base_temp + rng.uniform(-15, -5, n),
+        "WIND_SPEED_MPH": np.round(wind_speed, 1),
+        "WIND_GUST_MPH": np.round(wind_speed * rng.uniform(1.3, 1.8, n), 1),
+        "WIND_DIRECTION": pick(rng, ["N", "NE", "E", "SE", "S", "SW", "W", "NW"], n),
+        "HUMIDITY_PCT": np.round(humidity, 1),
+        "PRECIPITATION_PROBABILITY": np.where(is_fire_weather, 0.05, rng.uniform(0, 0.4, n)),
+        "PRECIPITATION_AMOUNT_IN": np.where(is_fire_weather, 0.0, rng.uniform(0, 0.5, n)),
+        "PRECIPITATION_TYPE": np.where(is_fire_weather, "NONE", pick(rng, ["NONE", "NONE", "RAIN"], n)),
+        "RED_FLAG_WARNING": is_fire_weather & (wind_speed > 40),
+        "FIRE_WEATHER_WATCH": is_fire_weather & (wind_speed > 30),
+        "WIND_ADVISORY": wind_speed > 35,
+        "FIRE_WEATHER_INDEX": np.round(wind_speed * (100 - humidity) / 100, 1),
+        "PSPS_PROBABILITY": np.where(
+            is_fire_weather, np.round(np.minimum(1.0, wind_speed / 60 * (100 - humidity) / 100), 2), 0.0
+        ),
+    }, copy=False)
 
 
 # =============================================================================
 # RISK ASSESSMENT GENERATOR
 # =============================================================================
 
-def generate_risk_assessments_df(assets_df: pd.DataFrame) -> pd.DataFrame:
+def generate_risk_assessments_df(assets_df: pd.DataFrame, rng: np.random.Generator, first_id: int = 1,
+                                 now: Optional[datetime] = None) -> pd.DataFrame:
     """Generate ML risk assessments for all assets."""
-    assessments = []
-    assessment_counter = 1
-    
-    for _, asset in assets_df.iterrows():
-        assessment_id = f"RA-{assessment_counter:06d}"
-        assessment_counter += 1
-        
-        # Get composite risk from asset
-        composite_risk = asset["COMPOSITE_RISK_SCORE"]
-        
-        # Determine risk tier
-        if composite_risk >= 80:
-            risk_tier = "CRITICAL"
-            action = "REPLACE"
-            priority = "IMMEDIATE"
-        elif composite_risk >= 60:
-            risk_tier = "HIGH"
-            action = "REPAIR" if asset["CONDITION_SCORE"] <= 2 else "INSPECT"
-            priority = "HIGH"
-        elif composite_risk >= 40:
-            risk_tier = "MEDIUM"
-            action = "INSPECT"
-            priority = "MEDIUM"
-        else:
-            risk_tier = "LOW"
-            action = "MONITOR"
-            priority = "LOW"
-        
-        assessments.append({
-            "ASSESSMENT_ID": assessment_id,
-            "ASSET_ID": asset["ASSET_ID"],
-            "ASSESSMENT_DATE": datetime.now().date(),
-            "COMPOSITE_RISK_SCORE": composite_risk,
-            "RISK_TIER": risk_tier,
-            "RISK_RANK": assessment_counter,
-            "FAILURE_PROBABILITY": asset["FAILURE_PROBABILITY"],
-            "IGNITION_RISK": asset["IGNITION_RISK_SCORE"],
-            "OUTAGE_IMPACT_SCORE": random.uniform(20, 80),
-            "SAFETY_RISK_SCORE": composite_risk * random.uniform(0.8, 1.2),
-            "AGE_FACTOR": asset["AGE_YEARS"] / 50,
-            "CONDITION_FACTOR": (5 - asset["CONDITION_SCORE"]) / 4,
-            "VEGETATION_FACTOR": random.uniform(0, 0.5),
-            "WEATHER_FACTOR": random.uniform(0, 0.3),
-            "LOAD_FACTOR": random.uniform(0.1, 0.4),
-            "HISTORICAL_FACTOR": random.uniform(0, 0.3),
-            "MODEL_VERSION": "v1.0.0",
-            "MODEL_CONFIDENCE": random.uniform(0.75, 0.95),
-            "RECOMMENDED_ACTION": action,
-            "RECOMMENDED_PRIORITY": priority,
-            "ESTIMATED_RISK_REDUCTION": random.uniform(10, 40),
-        })
-    
-    return pd.DataFrame(assessments)
+    today = (now or datetime.now()).date()
+    n = len(assets_df)
+
+    # Get composite risk from asset
+    composite_risk = assets_df["COMPOSITE_RISK_SCORE"].to_numpy()
+    condition_score = assets_df["CONDITION_SCORE"].to_numpy()
+
+    # Determine risk tier
+    tiers = [composite_risk >= 80, composite_risk >= 60, composite_risk >= 40]
+    risk_tier = np.select(tiers, ["CRITICAL", "HIGH", "MEDIUM"], "LOW")
+    action = np.select(
+        tiers, ["REPLACE", np.where(condition_score <= 2, "REPAIR", "INSPECT"), "INSPECT"], "MONITOR"
+    )
+    priority = np.select(tiers, ["IMMEDIATE", "HIGH", "MEDIUM"], "LOW")
+
+    return pd.DataFrame({
+        "ASSESSMENT_ID": make_ids("RA", n, 6, start=first_id),
+        "ASSET_ID": assets_df["ASSET_ID"].to_numpy(),
+        "ASSESSMENT_DATE": date_offsets(today, np.zeros(n, dtype=int)),
+        "COMPOSITE_RISK_SCORE": composite_risk,
+        "RISK_TIER": risk_tier,
+        "RISK_RANK": np.arange(first_id + 1, first_id + n + 1),
+        "FAILURE_PROBABILITY": assets_df["FAILURE_PROBABILITY"].to_numpy(),
+        "IGNITION_RISK": assets_df["IGNITION_RISK_SCORE"].to_numpy(),
+        "OUTAGE_IMPACT_SCORE": rng.uniform(20, 80, n),
+        "SAFETY_RISK_SCORE": composite_risk * rng.uniform(0.8, 1.2, n),
+        "AGE_FACTOR": assets_df["AGE_YEARS"].to_numpy() / 50,
+        "CONDITION_FACTOR": (5 - condition_score) / 4,
+        "VEGETATION_FACTOR": rng.uniform(0, 0.5, n),
+        "WEATHER_FACTOR": rng.uniform(0, 0.3, n),
+        "LOAD_FACTOR": rng.uniform(0.1, 0.4, n),
+        "HISTORICAL_FACTOR": rng.uniform(0, 0.3, n),
+        "MODEL_VERSION": "v1.0.0",
+        "MODEL_CONFIDENCE": rng.uniform(0.75, 0.95, n),
+        "RECOMMENDED_ACTION": action,
+        "RECOMMENDED_PRIORITY": priority,
+        "ESTIMATED_RISK_REDUCTION": rng.uniform(10, 40, n),
+    }, copy=False)
 
 
 # =============================================================================
 # CABLE FAILURE PREDICTION GENERATOR (Hidden Discovery)
 # =============================================================================
 
-def generate_cable_failure_predictions_df(assets_df: pd.DataFrame, ami_df: pd.DataFrame) -> pd.DataFrame:
-    """Generate cable failure predictions with Water Treeing detection."""
-    predictions = []
-    pred_counter = 1
-    
+def generate_cable_failure_predictions_df(assets_df: pd.DataFrame, ami_summary_df: pd.DataFrame,
+                                          rng: np.random.Generator, first_id: int = 1,
+                                          now: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    Generate cable failure predictions with Water Treeing detection.
+
+    ami_summary_df is the per-cable output of summarize_ami_readings (or
+    write_ami_readings), not the readings themselves.
+    """
+    now = now or datetime.now()
+
     ug_cables = assets_df[assets_df["ASSET_TYPE"] == "CABLE_UNDERGROUND"]
-    
-    for _, cable in ug_cables.iterrows():
-        pred_id = f"CFP-{pred_counter:06d}"
-        pred_counter += 1
-        
-        # Get AMI readings for this cable
-        cable_ami = ami_df[ami_df["ASSET_ID"] == cable["ASSET_ID"]]
-        
-        # Calculate Water Treeing metrics
-        total_readings = len(cable_ami)
-        dip_count = cable_ami["VOLTAGE_DIP_FLAG"].sum()
-        rain_correlated_dips = cable_ami["RAIN_CORRELATED_DIP"].sum()
-        rain_events = (cable_ami["RAINFALL_MM"] > 10).sum()
-        
-        # Water Treeing probability based on correlation
-        if rain_events > 0:
-            rain_correlation = rain_correlated_dips / rain_events
-        else:
-            rain_correlation = 0
-        
-        # Severity determination
-        is_susceptible = (
-            cable["INSULATION_TYPE"] == "XLPE" and
-            cable["AGE_YEARS"] >= 15 and
-            cable["MOISTURE_EXPOSURE"] in ["MEDIUM", "HIGH"]
-        )
-        
-        if is_susceptible and rain_correlation > 0.6:
-            water_treeing_prob = rain_correlation * 0.95
-            severity = "SEVERE" if water_treeing_prob > 0.8 else "MODERATE"
-            action = "REPLACE"
-            urgency = "URGENT" if severity == "SEVERE" else "HIGH"
-        elif is_susceptible and rain_correlation > 0.3:
-            water_treeing_prob = rain_correlation * 0.7
-            severity = "EARLY"
-            action = "MONITOR"
-            urgency = "MEDIUM"
-        else:
-            water_treeing_prob = rain_correlation * 0.2
-            severity = "NONE"
-            action = "NO_ACTION"
-            urgency = "LOW"
-        
-        predictions.append({
-            "PREDICTION_ID": pred_id,
-            "ASSET_ID": cable["ASSET_ID"],
-            "PREDICTION_DATE": datetime.now().date(),
-            "MODEL_ID": "CABLE_FAILURE_V1",
-            "WATER_TREEING_PROBABILITY": round(water_treeing_prob, 3),
-            "WATER_TREEING_SEVERITY": severity,
-            "FAILURE_PROBABILITY_30D": round(water_treeing_prob * 0.1, 3),
-            "FAILURE_PROBABILITY_90D": round(water_treeing_prob * 0.25, 3),
-            "FAILURE_PROBABILITY_1Y": round(water_treeing_prob * 0.5, 3),
-            "VOLTAGE_DIP_FREQUENCY": round(dip_count / max(total_readings, 1), 3),
-            "RAIN_CORRELATION_SCORE": round(rain_correlation, 3),
-            "ANOMALY_SCORE": round(water_treeing_prob * 100, 1),
-            "DIP_EVENTS_LAST_30D": int(cable_ami[cable_ami["READING_TIMESTAMP"] >= datetime.now() - timedelta(days=30)]["VOLTAGE_DIP_FLAG"].sum()),
-            "DIP_EVENTS_LAST_90D": int(dip_count),
-            "AVG_DIP_MAGNITUDE_PCT": round(cable_ami[cable_ami["VOLTAGE_DIP_FLAG"]]["VOLTAGE_DIP_PCT"].mean() if dip_count > 0 else 0, 2),
-            "RAIN_EVENTS_WITH_DIPS": int(rain_correlated_dips),
-            "RAIN_EVENTS_WITHOUT_DIPS": int(rain_events - rain_correlated_dips),
-            "CABLE_AGE_YEARS": cable["AGE_YEARS"],
-            "INSULATION_TYPE": cable["INSULATION_TYPE"],
-            "MOISTURE_EXPOSURE": cable["MOISTURE_EXPOSURE"],
-            "PROACTIVE_REPLACEMENT_COST": 10000,
-            "EMERGENCY_REPAIR_COST": 100000,
-            "REGULATORY_FINE_RISK": 50000 if severity == "SEVERE" else 10000 if severity == "MODERATE" else 0,
-            "RECOMMENDED_ACTION": action,
-            "ACTION_URGENCY": urgency,
-            "PREDICTION_CONFIDENCE": random.uniform(0.80, 0.95),
-            "TOP_ANOMALY_INDICATOR": "RAIN_CORRELATED_VOLTAGE_DIP" if rain_correlation > 0.3 else "AGE_FACTOR",
-            "DETECTION_METHOD": "RAIN_CORRELATION" if rain_correlation > 0.3 else "COMBINED",
-        })
-    
-    return pd.DataFrame(predictions)
+    n = len(ug_cables)
+
+    # Water Treeing metrics per cable
+    per_cable = ami_summary_df.reindex(ug_cables["ASSET_ID"]).fillna(0)
+
+    total_readings = per_cable["READINGS"].to_numpy()
+    dip_count = per_cable["DIPS"].to_numpy()
+    rain_correlated_dips = per_cable["RAIN_DIPS"].to_numpy()
+    rain_events = per_cable["RAIN_EVENTS"].to_numpy()
+
+    # Water Treeing probability based on correlation
+    rain_correlation = np.divide(
+        rain_correlated_dips, rain_events, out=np.zeros(n), where=rain_events > 0
+    )
+    avg_dip_magnitude = np.divide(
+        per_cable["DIP_PCT"].to_numpy(), dip_count, out=np.zeros(n), where=dip_count > 0
+    )
+
+    # Severity determination
+    is_susceptible = (
+        (ug_cables["INSULATION_TYPE"] == "XLPE") &
+        (ug_cables["AGE_YEARS"] >= 15) &
+        (ug_cables["MOISTURE_EXPOSURE"].isin(["MEDIUM", "HIGH"]))
+    ).to_numpy()
+    confirmed = is_susceptible & (rain_correlation > 0.6)
+    early = is_susceptible & ~confirmed & (rain_correlation > 0.3)
+
+    water_treeing_prob = np.select([confirmed, early], [rain_correlation * 0.95, rain_correlation * 0.7], rain_correlation * 0.2)
+    severe = confirmed & (water_treeing_prob > 0.8)
+    severity = np.select([severe, confirmed, early], ["SEVERE", "MODERATE", "EARLY"], "NONE")
+    rain_detected = rain_correlation > 0.3
+
+    return pd.DataFrame({
+        "PREDICTION_ID": make_ids("CFP", n, 6, start=first_id),
+        "ASSET_ID": ug_cables["ASSET_ID"].to_numpy(),
+        "PREDICTION_DATE": date_offsets(now.date(), np.zeros(n, dtype=int)),
+        "MODEL_ID": "CABLE_FAILURE_V1",
+        "WATER_TREEING_PROBABILITY": np.round(water_treeing_prob, 3),
+        "WATER_TREEING_SEVERITY": severity,
+        "FAILURE_PROBABILITY_30D": np.round(water_treeing_prob * 0.1, 3),
+        "FAILURE_PROBABILITY_90D": np.round(water_treeing_prob * 0.25, 3),
+        "FAILURE_PROBABILITY_1Y": np.round(water_treeing_prob * 0.5, 3),
+        "VOLTAGE_DIP_FREQUENCY": np.round(dip_count / np.maximum(total_readings, 1), 3),
+        "RAIN_CORRELATION_SCORE": np.round(rain_correlation, 3),
+        "ANOMALY_SCORE": np.round(water_treeing_prob * 100, 1),
+        "DIP_EVENTS_LAST_30D": per_cable["DIPS_30D"].to_numpy().astype(int),
+        "DIP_EVENTS_LAST_90D": dip_count.astype(int),
+        "AVG_DIP_MAGNITUDE_PCT": np.round(avg_dip_magnitude, 2),
+        "RAIN_EVENTS_WITH_DIPS": rain_correlated_dips.astype(int),
+        "RAIN_EVENTS_WITHOUT_DIPS": (rain_events - rain_correlated_dips).astype(int),
+        "CABLE_AGE_YEARS": ug_cables["AGE_YEARS"].to_numpy(),
+        "INSULATION_TYPE": ug_cables["INSULATION_TYPE"].to_numpy(),
+        "MOISTURE_EXPOSURE": ug_cables["MOISTURE_EXPOSURE"].to_numpy(),
+        "PROACTIVE_REPLACEMENT_COST": 10000,
+        "EMERGENCY_REPAIR_COST": 100000,
+        "REGULATORY_FINE_RISK": np.select([severity == "SEVERE", severity == "MODERATE"], [50000, 10000], 0),
+        "RECOMMENDED_ACTION": np.select([confirmed, early], ["REPLACE", "MONITOR"], "NO_ACTION"),
+        "ACTION_URGENCY": np.select([severe, confirmed, early], ["URGENT", "HIGH", "MEDIUM"], "LOW"),
+        "PREDICTION_CONFIDENCE": rng.uniform(0.80, 0.95, n),
+        "TOP_ANOMALY_INDICATOR": np.where(rain_detected, "RAIN_CORRELATED_VOLTAGE_DIP", "AGE_FACTOR"),
+        "DETECTION_METHOD": np.where(rain_detected, "RAIN_CORRELATION", "COMBINED"),
+    }, copy=False)
 
 
 # =============================================================================
@@ -1081,63 +1185,303 @@ Required radial clearance: Per Table 1 minimums (typically 4 feet for distributi
 # MONTHLY SNAPSHOT GENERATOR
 # =============================================================================
 
-def generate_monthly_snapshots_df(circuits_df: pd.DataFrame, assets_df: pd.DataFrame, vegetation_df: pd.DataFrame) -> pd.DataFrame:
+def generate_monthly_snapshots_df(circuits_df: pd.DataFrame, assets_df: pd.DataFrame, vegetation_df: pd.DataFrame,
+                                  rng: np.random.Generator, months: int = SNAPSHOT_MONTHS, first_id: int = 1,
+                                  now: Optional[datetime] = None) -> pd.DataFrame:
     """Generate monthly snapshots for trending."""
-    snapshots = []
-    snapshot_counter = 1
-    
-    for _, circuit in circuits_df.iterrows():
-        circuit_assets = assets_df[assets_df["CIRCUIT_ID"] == circuit["CIRCUIT_ID"]]
-        circuit_veg = vegetation_df[vegetation_df["ASSET_ID"].isin(circuit_assets["ASSET_ID"])]
-        
-        # Generate 12 months of history
-        for month_offset in range(12):
-            snapshot_date = (datetime.now() - timedelta(days=month_offset * 30)).date()
-            
-            snapshot_id = f"SNAP-{snapshot_counter:06d}"
-            snapshot_counter += 1
-            
-            # Calculate dynamic fire season days
-            region = circuit["DIVISION"]
-            region_config = REGIONS.get(region, REGIONS["NORCAL"])
-            fire_start = datetime(
-                datetime.now().year,
-                region_config["fire_season_start_month"],
-                region_config["fire_season_start_day"]
-            ).date()
-            days_to_fire = (fire_start - snapshot_date).days
-            
-            snapshots.append({
-                "SNAPSHOT_ID": snapshot_id,
-                "CIRCUIT_ID": circuit["CIRCUIT_ID"],
-                "SNAPSHOT_DATE": snapshot_date,
-                "HIGH_RISK_ASSET_COUNT": int((circuit_assets["COMPOSITE_RISK_SCORE"] >= 60).sum() * random.uniform(0.8, 1.2)),
-                "CRITICAL_RISK_ASSET_COUNT": int((circuit_assets["COMPOSITE_RISK_SCORE"] >= 80).sum() * random.uniform(0.8, 1.2)),
-                "AVG_RISK_SCORE": round(circuit_assets["COMPOSITE_RISK_SCORE"].mean() * random.uniform(0.9, 1.1), 1),
-                "MAX_RISK_SCORE": round(circuit_assets["COMPOSITE_RISK_SCORE"].max(), 1),
-                "TOTAL_SPANS": len(circuit_veg),
-                "SPANS_REQUIRING_TRIM": int((circuit_veg["CLEARANCE_STATUS"].isin(["VIOLATION", "CRITICAL", "MARGINAL"])).sum() * random.uniform(0.7, 1.3)),
-                "SPANS_IN_VIOLATION": int((circuit_veg["CLEARANCE_STATUS"] == "VIOLATION").sum() * random.uniform(0.7, 1.3)),
-                "MILES_TRIMMED_MTD": round(random.uniform(0.5, 3), 2),
-                "MILES_TRIMMED_YTD": round(random.uniform(5, 20), 2),
-                "OPEN_WORK_ORDERS": random.randint(2, 15),
-                "COMPLETED_WORK_ORDERS_MTD": random.randint(1, 10),
-                "BACKLOG_DAYS": random.uniform(5, 30),
-                "BUDGET_ALLOCATED": random.uniform(50000, 200000),
-                "BUDGET_SPENT_MTD": random.uniform(10000, 50000),
-                "BUDGET_SPENT_YTD": random.uniform(100000, 500000),
-                "COST_PER_MILE": random.uniform(5000, 15000),
-                "RISK_REDUCTION_VALUE_MTD": random.uniform(5, 25),
-                "RISK_REDUCTION_VALUE_YTD": random.uniform(50, 200),
-                "RISK_REDUCTION_PER_DOLLAR": random.uniform(0.001, 0.005),
-                "OUTAGES_MTD": random.randint(0, 5),
-                "OUTAGE_MINUTES_MTD": random.uniform(0, 120),
-                "VEG_CAUSED_OUTAGES_MTD": random.randint(0, 2),
-                "DAYS_TO_FIRE_SEASON": max(0, days_to_fire),
-                "FIRE_SEASON_READINESS_PCT": round(random.uniform(60, 95), 1),
-            })
-    
-    return pd.DataFrame(snapshots)
+    now = now or datetime.now()
+
+    # Per-circuit asset and vegetation aggregates, grouped once
+    risk = assets_df["COMPOSITE_RISK_SCORE"]
+    asset_stats = pd.DataFrame({
+        "CIRCUIT_ID": assets_df["CIRCUIT_ID"],
+        "HIGH_RISK": risk >= 60,
+        "CRITICAL_RISK": risk >= 80,
+        "RISK": risk,
+    }).groupby("CIRCUIT_ID").agg(
+        HIGH_RISK=("HIGH_RISK", "sum"),
+        CRITICAL_RISK=("CRITICAL_RISK", "sum"),
+        AVG_RISK=("RISK", "mean"),
+        MAX_RISK=("RISK", "max"),
+    ).reindex(circuits_df["CIRCUIT_ID"])
+
+    status = vegetation_df["CLEARANCE_STATUS"]
+    veg_stats = pd.DataFrame({
+        "CIRCUIT_ID": vegetation_df[["ASSET_ID"]].merge(
+            assets_df[["ASSET_ID", "CIRCUIT_ID"]], on="ASSET_ID", how="left"
+        )["CIRCUIT_ID"].to_numpy(),
+        "SPANS": 1,
+        "REQUIRING_TRIM": status.isin(["VIOLATION", "CRITICAL", "MARGINAL"]).to_numpy(),
+        "IN_VIOLATION": (status == "VIOLATION").to_numpy(),
+    }).groupby("CIRCUIT_ID").sum().reindex(circuits_df["CIRCUIT_ID"]).fillna(0)
+
+    # Generate 12 months of history per circuit
+    n = len(circuits_df) * months
+    circuit_idx = np.repeat(np.arange(len(circuits_df)), months)
+    snapshot_days = -30 * np.tile(np.arange(months), len(circuits_df))
+    snapshot_date = np.datetime64(now.date(), "D") + snapshot_days.astype("timedelta64[D]")
+
+    def per_row(frame: pd.DataFrame, column: str) -> np.ndarray:
+        return frame[column].to_numpy(dtype=float)[circuit_idx]
+
+    # Calculate dynamic fire season days
+    fire_start = {
+        region: np.datetime64(date(now.year, config["fire_season_start_month"], config["fire_season_start_day"]), "D")
+        for region, config in REGIONS.items()
+    }
+    region_fire_start = lookup(circuits_df["DIVISION"].to_numpy()[circuit_idx], fire_start, fire_start["NORCAL"])
+    days_to_fire = (region_fire_start.astype("datetime64[D]") - snapshot_date).astype(int)
+
+    return pd.DataFrame({
+        "SNAPSHOT_ID": make_ids("SNAP", n, 6, start=first_id),
+        "CIRCUIT_ID": circuits_df["CIRCUIT_ID"].to_numpy()[circuit_idx],
+        "SNAPSHOT_DATE": snapshot_date.astype(object),
+        "HIGH_RISK_ASSET_COUNT": (np.nan_to_num(per_row(asset_stats, "HIGH_RISK")) * rng.uniform(0.8, 1.2, n)).astype(int),
+        "CRITICAL_RISK_ASSET_COUNT": (np.nan_to_num(per_row(asset_stats, "CRITICAL_RISK")) * rng.uniform(0.8, 1.2, n)).astype(int),
+        "AVG_RISK_SCORE": np.round(per_row(asset_stats, "AVG_RISK") * rng.uniform(0.9, 1.1, n), 1),
+        "MAX_RISK_SCORE": np.round(per_row(asset_stats, "MAX_RISK"), 1),
+        "TOTAL_SPANS": per_row(veg_stats, "SPANS").astype(int),
+        "SPANS_REQUIRING_TRIM": (per_row(veg_stats, "REQUIRING_TRIM") * rng.uniform(0.7, 1.3, n)).astype(int),
+        "SPANS_IN_VIOLATION": (per_row(veg_stats, "IN_VIOLATION") * rng.uniform(0.7, 1.3, n)).astype(int),
+        "MILES_TRIMMED_MTD": np.round(rng.uniform(0.5, 3, n), 2),
+        "MILES_TRIMMED_YTD": np.round(rng.uniform(5, 20, n), 2),
+        "OPEN_WORK_ORDERS": rng.integers(2, 16, n),
+        "COMPLETED_WORK_ORDERS_MTD": rng.integers(1, 11, n),
+        "BACKLOG_DAYS": rng.uniform(5, 30, n),
+        "BUDGET_ALLOCATED": rng.uniform(50000, 200000, n),
+        "BUDGET_SPENT_MTD": rng.uniform(10000, 50000, n),
+        "BUDGET_SPENT_YTD": rng.uniform(100000, 500000, n),
+        "COST_PER_MILE": rng.uniform(5000, 15000, n),
+        "RISK_REDUCTION_VALUE_MTD": rng.uniform(5, 25, n),
+        "RISK_REDUCTION_VALUE_YTD": rng.uniform(50, 200, n),
+        "RISK_REDUCTION_PER_DOLLAR": rng.uniform(0.001, 0.005, n),
+        "OUTAGES_MTD": rng.integers(0, 6, n),
+        "OUTAGE_MINUTES_MTD": rng.uniform(0, 120, n),
+        "VEG_CAUSED_OUTAGES_MTD": rng.integers(0, 3, n),
+        "DAYS_TO_FIRE_SEASON": np.maximum(0, days_to_fire),
+        "FIRE_SEASON_READINESS_PCT": np.round(rng.uniform(60, 95, n), 1),
+    }, copy=False)
+
+
+# =============================================================================
+# REGION PARTITIONS
+# =============================================================================
+
+@dataclass
+class RegionPartition:
+    """Sizes, ID ranges, random streams and clock for one region, fixed before any worker starts."""
+    region: str
+    now: datetime
+    data_seed: np.random.SeedSequence
+    ami_seed: np.random.SeedSequence
+    circuits_per_location: np.ndarray
+    assets_per_circuit: np.ndarray
+    historical_work_orders: int
+    open_work_orders: int
+    first_location: int
+    first_circuit: int
+    first_asset: int
+    first_work_order: int
+
+
+def plan_partitions(seed: int, scale: float, now: Optional[datetime] = None) -> List[RegionPartition]:
+    """
+    Plan every region's partition from the seed, scale and one reference time.
+
+    Each region gets its own child of SeedSequence(seed), split into planning,
+    data and AMI streams, and a block of IDs after the previous region's, so a
+    partition's rows never depend on which process generates it or when.
+    Every partition also dates its rows from the same `now` (taken once here
+    unless given), so timestamps match across partitions at any worker count.
+    Assets and work orders are shared out by each region's asset_count.
+    """
+    now = now or datetime.now()
+    partitions = []
+    next_location = next_circuit = next_asset = next_work_order = 1
+
+    for region_code, region_seed in zip(REGIONS, np.random.SeedSequence(seed).spawn(len(REGIONS))):
+        region_config = REGIONS[region_code]
+        plan_seed, data_seed, ami_seed = region_seed.spawn(3)
+        plan_rng = np.random.default_rng(plan_seed)
+        share = region_config["asset_count"] / BASE_ASSET_COUNT
+
+        circuits_per_location = plan_rng.integers(3, 7, len(region_config["locations"])) * circuit_multiplier(scale)
+        assets_per_circuit = plan_assets_per_circuit(
+            plan_rng, int(circuits_per_location.sum()), scaled(region_config["asset_count"], scale)
+        )
+        partition = RegionPartition(
+            region=region_code,
+            now=now,
+            data_seed=data_seed,
+            ami_seed=ami_seed,
+            circuits_per_location=circuits_per_location,
+            assets_per_circuit=assets_per_circuit,
+            historical_work_orders=scaled(BASE_HISTORICAL_WORK_ORDERS * share, scale),
+            open_work_orders=scaled(BASE_OPEN_WORK_ORDERS * share, scale),
+            first_location=next_location,
+            first_circuit=next_circuit,
+            first_asset=next_asset,
+            first_work_order=next_work_order,
+        )
+        partitions.append(partition)
+
+        next_location += len(region_config["locations"])
+        next_circuit += int(circuits_per_location.sum())
+        next_asset += int(assets_per_circuit.sum())
+        next_work_order += partition.historical_work_orders + partition.open_work_orders
+
+    return partitions
+
+
+def partition_path(output_dir: str, table: str, region: str) -> str:
+    """Hive-style path of one region's part of a table (directories created)."""
+    directory = os.path.join(output_dir, table, f"{PARTITION_KEY}={region}")
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, "part-0.parquet")
+
+
+def generate_partition(partition: RegionPartition, output_dir: str,
+                       ami_horizon_days: int = AMI_HORIZON_DAYS,
+                       ami_interval_minutes: int = AMI_INTERVAL_MINUTES,
+                       ami_batch_rows: int = AMI_BATCH_ROWS) -> Dict[str, Any]:
+    """
+    Generate and write every regional table for one partition (runs in a worker).
+
+    Returns row counts and the Hidden Discovery tallies; the DataFrames stay in
+    the worker so only file paths and counts cross the process boundary.
+    """
+    started = time.perf_counter()
+    region, now = partition.region, partition.now
+    rng = np.random.default_rng(partition.data_seed)
+    ami_rng = np.random.default_rng(partition.ami_seed)
+    readings_per_cable = -(-ami_horizon_days * 24 * 60 // ami_interval_minutes)
+
+    locations_df = generate_locations_df(rng, [region], first_id=partition.first_location)
+    circuits_df = generate_circuits_df(
+        locations_df, rng, partition.circuits_per_location, first_id=partition.first_circuit, now=now
+    )
+    assets_df = generate_assets_df(
+        circuits_df, locations_df, rng, partition.assets_per_circuit, first_id=partition.first_asset, now=now
+    )
+    # Tables with at most one row per asset (or per location / circuit per
+    # period) take IDs from the matching block, so regions never collide
+    vegetation_df = generate_vegetation_df(
+        assets_df, locations_df, circuits_df, rng, first_id=partition.first_asset, now=now
+    )
+    ami_count, ami_row_groups, ami_summary_df = write_ami_readings(
+        assets_df, partition_path(output_dir, "ami_readings", region), ami_rng,
+        now=now,
+        horizon_days=ami_horizon_days,
+        interval_minutes=ami_interval_minutes,
+        batch_rows=ami_batch_rows,
+        first_reading=(partition.first_asset - 1) * readings_per_cable + 1,
+    )
+    work_orders_df = generate_work_orders_df(
+        assets_df, vegetation_df, rng, partition.historical_work_orders, partition.open_work_orders,
+        first_id=partition.first_work_order, now=now,
+    )
+    weather_df = generate_weather_df(
+        locations_df, rng, first_id=(partition.first_location - 1) * WEATHER_FORECAST_DAYS + 1, now=now
+    )
+    risk_assessments_df = generate_risk_assessments_df(assets_df, rng, first_id=partition.first_asset, now=now)
+    cable_predictions_df = generate_cable_failure_predictions_df(
+        assets_df, ami_summary_df, rng, first_id=partition.first_asset, now=now
+    )
+    snapshots_df = generate_monthly_snapshots_df(
+        circuits_df, assets_df, vegetation_df, rng, first_id=(partition.first_circuit - 1) * SNAPSHOT_MONTHS + 1,
+        now=now
+    )
+
+    tables = {
+        "locations": locations_df,
+        "circuits": circuits_df,
+        "assets": assets_df,
+        "vegetation": vegetation_df,
+        "work_orders": work_orders_df,
+        "weather": weather_df,
+        "risk_assessments": risk_assessments_df,
+        "cable_predictions": cable_predictions_df,
+        "monthly_snapshots": snapshots_df,
+    }
+    for table, df in tables.items():
+        df.to_parquet(partition_path(output_dir, table, region), index=False)
+
+    severity = cable_predictions_df["WATER_TREEING_SEVERITY"]
+    rows = {table: len(df) for table, df in tables.items()}
+    rows["ami_readings"] = ami_count
+    return {
+        "region": region,
+        "rows": rows,
+        "ami_row_groups": ami_row_groups,
+        "water_treeing": int(severity.isin(["MODERATE", "SEVERE"]).sum()),
+        "severe": int((severity == "SEVERE").sum()),
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def run_partitions(partitions: List[RegionPartition], output_dir: str, workers: int,
+                   **ami_options) -> List[Dict[str, Any]]:
+    """Generate all partitions, in-process for one worker, else one process per region; results in region order."""
+    results = {}
+
+    def report(result: Dict[str, Any]) -> None:
+        results[result["region"]] = result
+        print(f"   {result['region']}: {result['rows']['assets']:,} assets, "
+              f"{result['rows']['ami_readings']:,} AMI readings in {result['elapsed']:.1f}s", flush=True)
+
+    if workers == 1:
+        for partition in partitions:
+            report(generate_partition(partition, output_dir, **ami_options))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(generate_partition, partition, output_dir, **ami_options)
+                       for partition in partitions]
+            for future in as_completed(futures):
+                report(future.result())
+
+    return [results[partition.region] for partition in partitions]
+
+
+def _copy_row_groups(writer: pq.ParquetWriter, path: str, schema: pa.Schema) -> None:
+    """Append a parquet file to an open writer row group by row group, cast to schema."""
+    source = pq.ParquetFile(path)
+    for index in range(source.num_row_groups):
+        writer.write_table(source.read_row_group(index).cast(schema))
+
+
+def merge_partitions(output_dir: str, table: str, regions: Sequence[str], layout: str) -> None:
+    """
+    Reconcile a table's region partitions.
+
+    A region can leave a column all-null (e.g. no open work orders), or a
+    table empty at small scales, and so typed differently from the others;
+    partitions are cast to one schema unified from the non-empty ones. The
+    "files" layout then concatenates them, in region order, into
+    <table>.parquet and drops the partition directory; "dataset" keeps them.
+    """
+    table_dir = os.path.join(output_dir, table)
+    paths = [partition_path(output_dir, table, region) for region in regions]
+    metadata = [pq.read_metadata(path) for path in paths]
+    schemas = [meta.schema.to_arrow_schema() for meta in metadata]
+    populated = [part_schema for part_schema, meta in zip(schemas, metadata) if meta.num_rows] or schemas
+    schema = pa.unify_schemas(populated, promote_options="permissive")
+    merged_path = os.path.join(output_dir, f"{table}.parquet")
+
+    if layout == "files":
+        with pq.ParquetWriter(merged_path, schema) as writer:
+            for path in paths:
+                _copy_row_groups(writer, path, schema)
+        shutil.rmtree(table_dir)
+        return
+
+    for path, part_schema in zip(paths, schemas):
+        if not part_schema.equals(schema):
+            rewritten = f"{path}.tmp"
+            with pq.ParquetWriter(rewritten, schema) as writer:
+                _copy_row_groups(writer, path, schema)
+            os.replace(rewritten, path)
+    if os.path.exists(merged_path):
+        os.remove(merged_path)
 
 
 # =============================================================================
@@ -1146,90 +1490,90 @@ def generate_monthly_snapshots_df(circuits_df: pd.DataFrame, assets_df: pd.DataF
 
 def main():
     """Generate all synthetic data and save to parquet files."""
+    parser = argparse.ArgumentParser(description="VIGIL synthetic data generator")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help=f"Multiplier on the {BASE_ASSET_COUNT:,}-asset demo size (200 = 1M assets)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED,
+                        help="Random seed (same seed + scale + --as-of = same data, at any --workers)")
+    parser.add_argument("--as-of", type=datetime.fromisoformat, default=None,
+                        help="Reference time every table is dated from, e.g. 2026-06-01T00:00 "
+                             "(default: now, taken once for all regions)")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="Directory for the parquet files")
+    parser.add_argument("--workers", type=int, default=min(len(REGIONS), os.cpu_count() or 1),
+                        help="Worker processes, one region each (default: one per CPU, up to the region count)")
+    parser.add_argument("--layout", choices=["files", "dataset"], default="files",
+                        help=f"'files': one <table>.parquet each; "
+                             f"'dataset': <table>/{PARTITION_KEY}=<region>/ parquet datasets")
+    parser.add_argument("--ami-interval-minutes", type=int, default=AMI_INTERVAL_MINUTES,
+                        help="Minutes between AMI readings per cable (1440 = daily, 15 = 15-minute interval data)")
+    parser.add_argument("--ami-horizon-days", type=int, default=AMI_HORIZON_DAYS,
+                        help="Days of AMI history per cable")
+    parser.add_argument("--ami-batch-rows", type=int, default=AMI_BATCH_ROWS,
+                        help="AMI readings generated and written per parquet row group (bounds memory)")
+    args = parser.parse_args()
+
+    if args.scale <= 0:
+        parser.error("--scale must be positive")
+    if args.workers <= 0:
+        parser.error("--workers must be positive")
+    if min(args.ami_interval_minutes, args.ami_horizon_days, args.ami_batch_rows) <= 0:
+        parser.error("--ami-interval-minutes, --ami-horizon-days and --ami-batch-rows must be positive")
+
+    started = time.perf_counter()
+    output_dir = args.output_dir
+    os.makedirs(output_dir, exist_ok=True)
+    workers = min(args.workers, len(REGIONS))
+
     print("🔧 VIGIL Synthetic Data Generator")
     print("=" * 50)
-    
-    # Generate data in dependency order
-    print("📍 Generating locations...")
-    locations_df = generate_locations_df()
-    print(f"   Created {len(locations_df)} locations")
-    
-    print("⚡ Generating circuits...")
-    circuits_df = generate_circuits_df(locations_df)
-    print(f"   Created {len(circuits_df)} circuits")
-    
-    print("🔩 Generating assets...")
-    assets_df = generate_assets_df(circuits_df, locations_df)
-    print(f"   Created {len(assets_df)} assets")
-    
-    print("🌲 Generating vegetation encroachment...")
-    vegetation_df = generate_vegetation_df(assets_df, locations_df, circuits_df)
-    print(f"   Created {len(vegetation_df)} vegetation records")
-    
-    print("📊 Generating AMI readings (Hidden Discovery data)...")
-    ami_df = generate_ami_readings_df(assets_df)
-    print(f"   Created {len(ami_df)} AMI readings")
-    
-    print("📋 Generating work orders...")
-    work_orders_df = generate_work_orders_df(assets_df, vegetation_df)
-    print(f"   Created {len(work_orders_df)} work orders")
-    
-    print("🌤️ Generating weather forecasts...")
-    weather_df = generate_weather_df(locations_df)
-    print(f"   Created {len(weather_df)} weather forecasts")
-    
-    print("⚠️ Generating risk assessments...")
-    risk_assessments_df = generate_risk_assessments_df(assets_df)
-    print(f"   Created {len(risk_assessments_df)} risk assessments")
-    
-    print("🔌 Generating cable failure predictions (Water Treeing)...")
-    cable_predictions_df = generate_cable_failure_predictions_df(assets_df, ami_df)
-    print(f"   Created {len(cable_predictions_df)} cable predictions")
-    
+    print(f"   Scale: {args.scale:g}x ({scaled(BASE_ASSET_COUNT, args.scale):,} target assets), seed {args.seed}")
+
+    # Clear partitions left by an earlier run so merges only see this one
+    for table in REGIONAL_TABLES:
+        shutil.rmtree(os.path.join(output_dir, table), ignore_errors=True)
+
+    partitions = plan_partitions(args.seed, args.scale, now=args.as_of)
+    print(f"🗺️ Generating {len(partitions)} regions with {workers} worker(s)...", flush=True)
+    results = run_partitions(
+        partitions, output_dir, workers,
+        ami_horizon_days=args.ami_horizon_days,
+        ami_interval_minutes=args.ami_interval_minutes,
+        ami_batch_rows=args.ami_batch_rows,
+    )
+
     print("📜 Generating compliance documents...")
     compliance_docs_df = generate_compliance_docs_df()
-    print(f"   Created {len(compliance_docs_df)} compliance documents")
-    
-    print("📈 Generating monthly snapshots...")
-    snapshots_df = generate_monthly_snapshots_df(circuits_df, assets_df, vegetation_df)
-    print(f"   Created {len(snapshots_df)} monthly snapshots")
-    
-    # Save to parquet
-    print("\n💾 Saving to parquet files...")
-    output_dir = "../data/synthetic"
-    
-    locations_df.to_parquet(f"{output_dir}/locations.parquet", index=False)
-    circuits_df.to_parquet(f"{output_dir}/circuits.parquet", index=False)
-    assets_df.to_parquet(f"{output_dir}/assets.parquet", index=False)
-    vegetation_df.to_parquet(f"{output_dir}/vegetation.parquet", index=False)
-    ami_df.to_parquet(f"{output_dir}/ami_readings.parquet", index=False)
-    work_orders_df.to_parquet(f"{output_dir}/work_orders.parquet", index=False)
-    weather_df.to_parquet(f"{output_dir}/weather.parquet", index=False)
-    risk_assessments_df.to_parquet(f"{output_dir}/risk_assessments.parquet", index=False)
-    cable_predictions_df.to_parquet(f"{output_dir}/cable_predictions.parquet", index=False)
     compliance_docs_df.to_parquet(f"{output_dir}/compliance_docs.parquet", index=False)
-    snapshots_df.to_parquet(f"{output_dir}/monthly_snapshots.parquet", index=False)
-    
-    print("\n✅ Data generation complete!")
+
+    print(f"\n💾 Writing parquet {'files' if args.layout == 'files' else 'datasets'}...")
+    regions = [partition.region for partition in partitions]
+    for table in REGIONAL_TABLES:
+        merge_partitions(output_dir, table, regions, args.layout)
+
+    def total(table: str) -> int:
+        return sum(result["rows"][table] for result in results)
+
+    ami_row_groups = sum(result["ami_row_groups"] for result in results)
+    print(f"\n✅ Data generation complete in {time.perf_counter() - started:.1f}s!")
     print("\n📊 Summary:")
-    print(f"   Locations: {len(locations_df)}")
-    print(f"   Circuits: {len(circuits_df)}")
-    print(f"   Assets: {len(assets_df)}")
-    print(f"   Vegetation: {len(vegetation_df)}")
-    print(f"   AMI Readings: {len(ami_df)}")
-    print(f"   Work Orders: {len(work_orders_df)}")
-    print(f"   Weather Forecasts: {len(weather_df)}")
-    print(f"   Risk Assessments: {len(risk_assessments_df)}")
-    print(f"   Cable Predictions: {len(cable_predictions_df)}")
+    print(f"   Locations: {total('locations')}")
+    print(f"   Circuits: {total('circuits')}")
+    print(f"   Assets: {total('assets')}")
+    print(f"   Vegetation: {total('vegetation')}")
+    print(f"   AMI Readings: {total('ami_readings')} ({ami_row_groups} row groups)")
+    print(f"   Work Orders: {total('work_orders')}")
+    print(f"   Weather Forecasts: {total('weather')}")
+    print(f"   Risk Assessments: {total('risk_assessments')}")
+    print(f"   Cable Predictions: {total('cable_predictions')}")
     print(f"   Compliance Docs: {len(compliance_docs_df)}")
-    print(f"   Monthly Snapshots: {len(snapshots_df)}")
-    
+    print(f"   Monthly Snapshots: {total('monthly_snapshots')}")
+
     # Hidden Discovery summary
-    water_treeing_cables = cable_predictions_df[cable_predictions_df["WATER_TREEING_SEVERITY"].isin(["MODERATE", "SEVERE"])]
+    water_treeing_cables = sum(result["water_treeing"] for result in results)
     print(f"\n🔍 Hidden Discovery (Water Treeing):")
-    print(f"   Cables with Water Treeing: {len(water_treeing_cables)}")
-    print(f"   Severe cases: {len(cable_predictions_df[cable_predictions_df['WATER_TREEING_SEVERITY'] == 'SEVERE'])}")
-    print(f"   Potential savings: ${len(water_treeing_cables) * 90000:,} (proactive vs emergency)")
+    print(f"   Cables with Water Treeing: {water_treeing_cables}")
+    print(f"   Severe cases: {sum(result['severe'] for result in results)}")
+    print(f"   Potential savings: ${water_treeing_cables * 90000:,} (proactive vs emergency)")
 
 
 if __name__ == "__main__":